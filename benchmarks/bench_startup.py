@@ -0,0 +1,160 @@
+"""Startup-time benchmark: how long a restart keeps players out.
+
+Boots `uvicorn nachomud.server:app` (agents on, talking to
+nachomud.ai.fake_ollama) over and over and times, from process spawn:
+
+  * health — first 200 from /health (the app is serving);
+  * ws     — first message on a fresh /ws connection (a viewer is in);
+  * ready  — first 200 from /ready (the home world and its agents are up).
+
+`cold` boots start from an empty data dir (first deploy); `warm` boots
+reuse one that has already been seeded (a rolling restart). Also times
+`import nachomud.server` on its own.
+
+    python -m benchmarks.bench_startup --repeat 5
+    python -m benchmarks.bench_startup --save benchmarks/results/startup.json
+    python -m benchmarks.bench_startup --compare benchmarks/results/startup.json
+
+`--compare` works like bench_world's. Timings are in milliseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.bench_world import compare
+from benchmarks.loadgen import ServerProcess, ws_connect
+from nachomud.ai.fake_ollama import FakeOllama
+
+POLL_SECONDS = 0.01
+BOOT_TIMEOUT_SECONDS = 60.0
+_IMPORT_SNIPPET = ("import time; t = time.perf_counter(); import nachomud.server; "
+                   "print(time.perf_counter() - t)")
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    return {"median_ms": round(statistics.median(samples), 1),
+            "min_ms": round(min(samples), 1)}
+
+
+def time_import() -> float:
+    out = subprocess.run([sys.executable, "-c", _IMPORT_SNIPPET],
+                         capture_output=True, text=True, check=True).stdout
+    return float(out.strip()) * 1000
+
+
+async def _poll(server: ServerProcess, path: str, t0: float) -> float:
+    async with httpx.AsyncClient() as http:
+        while time.perf_counter() - t0 < BOOT_TIMEOUT_SECONDS:
+            if server.proc.poll() is not None:
+                raise RuntimeError("server exited during startup")
+            with contextlib.suppress(httpx.HTTPError):
+                if (await http.get(server.base + path)).status_code == 200:
+                    return (time.perf_counter() - t0) * 1000
+            await asyncio.sleep(POLL_SECONDS)
+    raise TimeoutError(f"{path} never answered 200")
+
+
+async def _first_ws_message(server: ServerProcess, t0: float) -> float:
+    url = server.base.replace("http", "ws", 1) + "/ws"
+    async with ws_connect(url) as ws:
+        await asyncio.wait_for(ws.recv(), BOOT_TIMEOUT_SECONDS)
+    return (time.perf_counter() - t0) * 1000
+
+
+async def boot_once(workdir: str, llm_url: str) -> dict[str, float]:
+    """One server start, timed from spawn. The checkpoints are taken in
+    order, so `ws` and `ready` are upper bounds when an earlier one was
+    slower."""
+    t0 = time.perf_counter()
+    server = ServerProcess(llm_url, agent_tick=60.0, workdir=workdir)
+    try:
+        health = await _poll(server, "/health", t0)
+        ws = await _first_ws_message(server, t0)
+        ready = await _poll(server, "/ready", t0)
+    finally:
+        server.stop()
+    return {"health": health, "ws": ws, "ready": ready}
+
+
+async def _boots(repeat: int, llm_url: str) -> dict[str, dict[str, list[float]]]:
+    samples: dict[str, dict[str, list[float]]] = {"cold": {}, "warm": {}}
+    warm_dir = tempfile.mkdtemp(prefix="nachomud-startup-")
+    try:
+        await boot_once(warm_dir, llm_url)        # seed it
+        for _ in range(repeat):
+            cold_dir = tempfile.mkdtemp(prefix="nachomud-startup-")
+            try:
+                runs = {"cold": await boot_once(cold_dir, llm_url),
+                        "warm": await boot_once(warm_dir, llm_url)}
+            finally:
+                shutil.rmtree(cold_dir, ignore_errors=True)
+            for kind, timings in runs.items():
+                for name, ms in timings.items():
+                    samples[kind].setdefault(name, []).append(ms)
+    finally:
+        shutil.rmtree(warm_dir, ignore_errors=True)
+    return samples
+
+
+def run(*, repeat: int = 3) -> dict:
+    fake = FakeOllama()
+    llm_url = fake.start()
+    try:
+        boots = asyncio.run(_boots(repeat, llm_url))
+    finally:
+        fake.stop()
+    results = {"import_server": _summary([time_import() for _ in range(repeat)])}
+    for kind, checkpoints in boots.items():
+        for name, values in checkpoints.items():
+            results[f"{name}@{kind}"] = _summary(values)
+    return {
+        "meta": {"created_at": datetime.now(timezone.utc).isoformat(),
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "repeat": repeat},
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup",
+                                 description="Server cold/warm start timings.")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--save", default=None, help="write results JSON here")
+    ap.add_argument("--compare", default=None, help="baseline results JSON")
+    ap.add_argument("--threshold", type=float, default=1.25)
+    args = ap.parse_args(argv)
+
+    current = run(repeat=args.repeat)
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        slower = compare(current, baseline, args.threshold)
+        if slower:
+            print(f"{len(slower)} case(s) slower than ×{args.threshold}", file=sys.stderr)
+            return 1
+        return 0
+    for key, timing in current["results"].items():
+        print(f"{key:<16} {timing['median_ms']:>9.1f} ms  (min {timing['min_ms']:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
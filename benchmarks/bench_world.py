@@ -0,0 +1,168 @@
+"""Scale benchmarks over synthetic worlds (nachomud.world.synth).
+
+Builds a world per scale in a temp data root, then times the hot paths
+whose cost grows with the world: the mob tick, room rendering, the
+mob/room lookups, the explored-rooms and grid maps, player save/load,
+and transcript replay. Nothing touches an LLM or the real data dir.
+
+    python -m benchmarks.bench_world                        # 1k and 10k rooms
+    python -m benchmarks.bench_world --scales 1000,10000,100000 \\
+        --save benchmarks/results/baseline.json
+    python -m benchmarks.bench_world --compare benchmarks/results/baseline.json
+
+`--compare` prints each case's median against the saved run and exits
+non-zero if any got slower than `--threshold` times the baseline.
+Timings are per call, in milliseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import nachomud.characters.save as player_mod
+import nachomud.rules.dice as dice
+import nachomud.world.map as map_mod
+import nachomud.world.store as world_store
+import nachomud.world.transcript_log as tlog
+from nachomud.characters.character import create_character
+from nachomud.engine.game import render_room
+from nachomud.rules.stats import Stats
+from nachomud.world.mobs import tick_mobs_for_rooms
+from nachomud.world.synth import synthesize_world
+
+WORLD = "bench"
+# Rooms a benchmark player has visited (capped by the world size).
+VISITED = 1000
+
+
+def _time(fn: Callable[[], object], repeat: int,
+          setup: Callable[[], object] | None = None) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3),
+            "min_ms": round(min(samples), 3)}
+
+
+def _bench_scale(rooms: int, repeat: int, seed: int) -> dict[str, dict[str, float]]:
+    report = synthesize_world(WORLD, rooms, seed=seed)
+    rng = random.Random(seed)
+    graph = world_store.load_graph(WORLD)
+    room_ids = sorted(graph)
+    visited = room_ids[:min(VISITED, len(room_ids))]
+    here = visited[-1]
+
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Bench", "Dwarf", "Warrior", s, player_id="bench",
+                         respawn_room=report.root, world_id=WORLD)
+    p.room_id = here
+    p.visited_rooms = list(visited)
+    room = world_store.load_room(WORLD, here)
+
+    for i in range(rooms):
+        tlog.append("bench", ("output", f"line {i}\r\n"))
+
+    active = set(rng.sample(room_ids, min(4, len(room_ids))))
+    dice.seed(seed)
+    return {
+        "tick_mobs_for_rooms": _time(lambda: tick_mobs_for_rooms(WORLD, active), repeat),
+        "mobs_in_room": _time(lambda: world_store.mobs_in_room(WORLD, here), repeat),
+        "render_room": _time(lambda: render_room(p, room), repeat),
+        "render_explored_text": _time(
+            lambda: map_mod.render_explored_text(WORLD, visited, current_room_id=here),
+            repeat, setup=map_mod._room_info.clear),
+        "render_map": _time(lambda: map_mod.render_map(WORLD, here, visited), repeat,
+                            setup=map_mod._room_info.clear),
+        "save_player": _time(lambda: player_mod.save_player(p), repeat),
+        "load_player": _time(lambda: player_mod.load_player("bench").dm_context, repeat),
+        "read_recent": _time(lambda: tlog.read_recent("bench"), repeat),
+    }
+
+
+def run(scales: list[int], *, repeat: int = 5, seed: int = 0) -> dict:
+    results: dict[str, dict[str, float]] = {}
+    saved = (world_store.DATA_ROOT, player_mod.DATA_ROOT, tlog.DATA_ROOT)
+    for rooms in scales:
+        root = tempfile.mkdtemp(prefix="nachomud-bench-")
+        world_store.DATA_ROOT = os.path.join(root, "world")
+        player_mod.DATA_ROOT = os.path.join(root, "players")
+        tlog.DATA_ROOT = os.path.join(root, "transcripts")
+        try:
+            for case, timing in _bench_scale(rooms, repeat, seed).items():
+                results[f"{case}@{rooms}"] = timing
+        finally:
+            world_store.DATA_ROOT, player_mod.DATA_ROOT, tlog.DATA_ROOT = saved
+            shutil.rmtree(root, ignore_errors=True)
+    return {
+        "meta": {"created_at": datetime.now(timezone.utc).isoformat(),
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "scales": scales, "repeat": repeat, "seed": seed},
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Cases whose median exceeds `threshold` × the baseline median."""
+    slower = []
+    for key, timing in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None or not base["median_ms"]:
+            continue
+        ratio = timing["median_ms"] / base["median_ms"]
+        flag = "  SLOWER" if ratio > threshold else ""
+        print(f"{key:<32} {base['median_ms']:>10.3f} → {timing['median_ms']:>10.3f} ms"
+              f"  ×{ratio:.2f}{flag}")
+        if flag:
+            slower.append(key)
+    return slower
+
+
+def _ints(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.bench_world",
+                                 description="Scale benchmarks on synthetic worlds.")
+    ap.add_argument("--scales", type=_ints, default=[1000, 10000])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--save", default=None, help="write results JSON here")
+    ap.add_argument("--compare", default=None, help="baseline results JSON")
+    ap.add_argument("--threshold", type=float, default=1.25)
+    args = ap.parse_args(argv)
+
+    current = run(args.scales, repeat=args.repeat, seed=args.seed)
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        slower = compare(current, baseline, args.threshold)
+        if slower:
+            print(f"{len(slower)} case(s) slower than ×{args.threshold}", file=sys.stderr)
+            return 1
+        return 0
+    for key, timing in current["results"].items():
+        print(f"{key:<32} {timing['median_ms']:>10.3f} ms  (min {timing['min_ms']:.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
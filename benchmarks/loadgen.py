@@ -0,0 +1,419 @@
+"""Headless WebSocket load generator and soak test for the web server.
+
+Boots `uvicorn nachomud.server:app` on a free port with throwaway data
+dirs and `nachomud.ai.fake_ollama` as its LLM (so no Ollama is needed),
+then opens many concurrent `/ws` connections against it:
+
+  * spectators — anonymous viewers subscribed to an agent or to one of
+    the load players, to measure broadcast fan-out;
+  * players — sign in through the dev-echo magic link (read back from
+    the server's log), create a character, then loop over scripted
+    movement / look / combat commands with think time between them;
+  * churn — players that drop the socket now and then and come back
+    through the "Press ENTER to continue" path.
+
+    python -m benchmarks.loadgen --players 50 --spectators 200 --duration 60
+    python -m benchmarks.loadgen --players 200 --churn 0.05 --json > soak.json
+    python -m benchmarks.loadgen --llm-latency 1.5 --llm-latency-dist lognormal --llm-drop-rate 0.05
+
+Reports p50/p99 command latency (send → the player's next prompt),
+fan-out latency (send → a spectator of that player sees the output),
+connect latency, errors, and the server's RSS sampled over the run.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+import httpx
+
+try:
+    from websockets.asyncio.client import connect as ws_connect   # websockets >= 13
+    _HEADERS_KW = "additional_headers"
+except ImportError:
+    from websockets.client import connect as ws_connect           # websockets 12
+    _HEADERS_KW = "extra_headers"
+
+from nachomud.ai.fake_ollama import LATENCY_DISTRIBUTIONS, Behaviour, FakeOllama
+from nachomud.auth.magic_link import SESSION_COOKIE_NAME
+
+# Commands a load player cycles through, with weights. Attacks and
+# flees hit the combat path whenever a mob happens to be around.
+SCRIPT: list[tuple[str, int]] = [
+    ("look", 4), ("n", 3), ("s", 3), ("e", 3), ("w", 3), ("exits", 1),
+    ("map", 1), ("i", 1), ("attack goblin", 1), ("flee", 1),
+]
+CHAR_CREATE = ["{name}", "1", "1", "standard", "{llm}", "y"]
+REPLY_TIMEOUT_SECONDS = 30.0
+_LINK_RE = re.compile(r"\[DEV\] magic link for (\S+) -> (\S+)")
+
+
+# ── Server under test ──
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid: int) -> float | None:
+    """Resident set size of `pid` in MiB (Linux /proc, else `ps`)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)],
+                             capture_output=True, text=True, check=True).stdout
+        return int(out.strip()) / 1024
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+class ServerProcess:
+    """uvicorn in a child process, its log scanned for magic links."""
+
+    def __init__(self, llm_url: str, *, agent_tick: float, workdir: str) -> None:
+        self.port = _free_port()
+        self.base = f"http://127.0.0.1:{self.port}"
+        self.links: dict[str, str] = {}
+        self._links_cv = threading.Condition()
+        env = {
+            **os.environ,
+            "NACHOMUD_AUTH_DEV_ECHO": "1",
+            "NACHOMUD_AGENT_OLLAMA_URL": llm_url,
+            "NACHOMUD_AGENT_TICK_SECONDS": str(agent_tick),
+            "NACHOMUD_DATA_ROOT": os.path.join(workdir, "world"),
+            "NACHOMUD_PLAYERS_ROOT": os.path.join(workdir, "players"),
+            "NACHOMUD_ACCOUNTS_ROOT": os.path.join(workdir, "accounts"),
+            "NACHOMUD_TRANSCRIPT_ROOT": os.path.join(workdir, "transcripts"),
+        }
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "nachomud.server:app",
+             "--host", "127.0.0.1", "--port", str(self.port), "--no-access-log"],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        threading.Thread(target=self._scan_log, name="server-log", daemon=True).start()
+
+    def _scan_log(self) -> None:
+        assert self.proc.stderr is not None
+        for line in self.proc.stderr:
+            m = _LINK_RE.search(line)
+            if m:
+                with self._links_cv:
+                    self.links[m.group(1)] = m.group(2)
+                    self._links_cv.notify_all()
+
+    def wait_link(self, email: str, timeout: float = 10.0) -> str:
+        with self._links_cv:
+            if not self._links_cv.wait_for(lambda: email in self.links, timeout):
+                raise TimeoutError(f"no magic link logged for {email}")
+            return self.links.pop(email)
+
+    async def wait_ready(self, timeout: float = 60.0) -> None:
+        deadline = time.monotonic() + timeout
+        async with httpx.AsyncClient() as http:
+            while time.monotonic() < deadline:
+                if self.proc.poll() is not None:
+                    raise RuntimeError("server exited during startup")
+                with contextlib.suppress(httpx.HTTPError):
+                    if (await http.get(f"{self.base}/health")).status_code == 200:
+                        return
+                await asyncio.sleep(0.2)
+        raise TimeoutError("server did not become healthy")
+
+    def stop(self) -> None:
+        self.proc.terminate()
+        try:
+            self.proc.wait(15)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+# ── Load ──
+
+@dataclass
+class Results:
+    command_ms: list[float] = field(default_factory=list)
+    fanout_ms: list[float] = field(default_factory=list)
+    connect_ms: list[float] = field(default_factory=list)
+    rss: list[tuple[float, float]] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    commands: int = 0
+    messages: int = 0
+    reconnects: int = 0
+
+
+@dataclass
+class _Run:
+    server: ServerProcess
+    llm_url: str
+    results: Results
+    deadline: float
+    rng: random.Random
+    think: float
+    churn: float
+    # actor_id -> (sequence number, send time) of a player's latest command
+    sent: dict[str, tuple[int, float]] = field(default_factory=dict)
+    players: list[str] = field(default_factory=list)
+    players_ready: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def ws_url(self) -> str:
+        return self.server.base.replace("http", "ws", 1) + "/ws"
+
+
+async def _recv(ws) -> dict:
+    return json.loads(await asyncio.wait_for(ws.recv(), REPLY_TIMEOUT_SECONDS))
+
+
+async def _until_prompt(ws, run: _Run) -> dict:
+    while True:
+        msg = await _recv(ws)
+        run.results.messages += 1
+        if msg.get("type") == "prompt":
+            return msg
+
+
+def _name(i: int) -> str:
+    letters = ""
+    i += 26
+    while i:
+        i, r = divmod(i, 26)
+        letters = chr(ord("a") + r) + letters
+    return f"Loadbot {letters.capitalize()}"
+
+
+async def _sign_in(run: _Run, email: str) -> str:
+    async with httpx.AsyncClient(base_url=run.server.base) as http:
+        r = await http.post("/auth/request", json={"email": email})
+        r.raise_for_status()
+        link = await asyncio.to_thread(run.server.wait_link, email)
+        r = await http.get(link, follow_redirects=False)
+        cookie = r.cookies.get(SESSION_COOKIE_NAME)
+    if not cookie:
+        raise RuntimeError(f"sign-in failed for {email}")
+    return cookie
+
+
+async def player(run: _Run, i: int) -> None:
+    email = f"loadbot{i}@example.test"
+    try:
+        cookie = await _sign_in(run, email)
+    except Exception as e:
+        run.results.errors[f"sign_in: {type(e).__name__}"] += 1
+        return
+    headers = {"Cookie": f"{SESSION_COOKIE_NAME}={cookie}"}
+    created = False
+    while time.monotonic() < run.deadline:
+        started = time.monotonic()
+        try:
+            async with ws_connect(run.ws_url, **{_HEADERS_KW: headers}) as ws:
+                await _until_prompt(ws, run)
+                steps = [""] + [s.format(name=_name(i), llm=run.llm_url) for s in CHAR_CREATE]
+                for text in (steps if not created else [""]):
+                    await ws.send(json.dumps({"type": "command", "text": text}))
+                    prompt = await _until_prompt(ws, run)
+                created = True
+                actor_id = prompt.get("actor_id", "")
+                run.results.connect_ms.append((time.monotonic() - started) * 1000)
+                if actor_id and actor_id not in run.players:
+                    run.players.append(actor_id)
+                    run.players_ready.set()
+                if await _play(ws, run, actor_id):
+                    run.results.reconnects += 1
+                    continue
+                return
+        except Exception as e:
+            run.results.errors[f"player: {type(e).__name__}"] += 1
+            await asyncio.sleep(1)
+
+
+async def _play(ws, run: _Run, actor_id: str) -> bool:
+    """Issue scripted commands until the deadline. True = drop and
+    reconnect (churn)."""
+    commands, weights = zip(*SCRIPT)
+    seq = 0
+    while time.monotonic() < run.deadline:
+        await asyncio.sleep(run.think * run.rng.uniform(0.5, 1.5))
+        text = run.rng.choices(commands, weights)[0]
+        seq += 1
+        t0 = time.monotonic()
+        run.sent[actor_id] = (seq, t0)
+        await ws.send(json.dumps({"type": "command", "text": text}))
+        await _until_prompt(ws, run)
+        run.results.command_ms.append((time.monotonic() - t0) * 1000)
+        run.results.commands += 1
+        if run.rng.random() < run.churn:
+            return True
+    return False
+
+
+async def spectator(run: _Run, i: int) -> None:
+    """Watch an agent (even i) or a load player (odd i) until the deadline."""
+    seen: dict[str, int] = {}
+    try:
+        async with ws_connect(run.ws_url) as ws:
+            first = await _recv(ws)
+            agents = [a["actor_id"] for a in first.get("actors", []) if a.get("kind") == "agent"]
+            target = ""
+            if i % 2 and run.players:
+                target = run.rng.choice(run.players)
+            elif agents:
+                target = run.rng.choice(agents)
+            if target:
+                await ws.send(json.dumps({"type": "subscribe", "actor_id": target}))
+            while time.monotonic() < run.deadline:
+                try:
+                    msg = json.loads(await asyncio.wait_for(
+                        ws.recv(), max(0.1, run.deadline - time.monotonic())))
+                except asyncio.TimeoutError:
+                    break
+                run.results.messages += 1
+                actor = msg.get("actor_id", "")
+                if msg.get("type") == "output" and actor in run.sent:
+                    seq, t0 = run.sent[actor]
+                    if seq > seen.get(actor, 0):
+                        seen[actor] = seq
+                        run.results.fanout_ms.append((time.monotonic() - t0) * 1000)
+    except Exception as e:
+        run.results.errors[f"spectator: {type(e).__name__}"] += 1
+
+
+async def _sample_rss(run: _Run, interval: float) -> None:
+    start = time.monotonic()
+    while time.monotonic() < run.deadline:
+        mb = rss_mb(run.server.proc.pid)
+        if mb is not None:
+            run.results.rss.append((round(time.monotonic() - start, 1), round(mb, 1)))
+        await asyncio.sleep(interval)
+
+
+async def run_load(*, players: int, spectators: int, duration: float, think: float,
+                   churn: float, agent_tick: float, rss_interval: float,
+                   ramp: float, seed: int, llm: Behaviour | None = None) -> Results:
+    workdir = tempfile.mkdtemp(prefix="nachomud-load-")
+    fake_llm = FakeOllama(llm or Behaviour(seed=seed))
+    llm_url = fake_llm.start()
+    server = ServerProcess(llm_url, agent_tick=agent_tick, workdir=workdir)
+    try:
+        await server.wait_ready()
+        run = _Run(server=server, llm_url=llm_url, results=Results(),
+                   deadline=time.monotonic() + duration, rng=random.Random(seed),
+                   think=think, churn=churn)
+        tasks = [asyncio.create_task(_sample_rss(run, rss_interval))]
+        for i in range(players):
+            tasks.append(asyncio.create_task(player(run, i)))
+            await asyncio.sleep(ramp / max(1, players + spectators))
+        if players:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(run.players_ready.wait(), 30)
+        for i in range(spectators):
+            tasks.append(asyncio.create_task(spectator(run, i)))
+            await asyncio.sleep(ramp / max(1, players + spectators))
+        await asyncio.gather(*tasks)
+        return run.results
+    finally:
+        server.stop()
+        fake_llm.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ── Report ──
+
+def _pct(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+
+def summarize(r: Results, duration: float) -> dict:
+    def dist(values: list[float]) -> dict:
+        return {"n": len(values), "p50_ms": _pct(values, 0.50), "p99_ms": _pct(values, 0.99),
+                "max_ms": round(max(values), 1) if values else None}
+    rss = [mb for _, mb in r.rss]
+    return {
+        "commands": r.commands,
+        "commands_per_second": round(r.commands / duration, 1) if duration else 0,
+        "messages": r.messages,
+        "reconnects": r.reconnects,
+        "command_latency": dist(r.command_ms),
+        "fanout_latency": dist(r.fanout_ms),
+        "connect_latency": dist(r.connect_ms),
+        "rss_mb": {"start": rss[0] if rss else None, "end": rss[-1] if rss else None,
+                   "peak": max(rss) if rss else None, "samples": r.rss},
+        "errors": dict(r.errors),
+    }
+
+
+def _print(summary: dict) -> None:
+    print(f"commands: {summary['commands']} ({summary['commands_per_second']}/s), "
+          f"messages: {summary['messages']}, reconnects: {summary['reconnects']}")
+    for key in ("command_latency", "fanout_latency", "connect_latency"):
+        d = summary[key]
+        print(f"{key:16s} n={d['n']:<6} p50={d['p50_ms']}ms p99={d['p99_ms']}ms max={d['max_ms']}ms")
+    rss = summary["rss_mb"]
+    print(f"server RSS MiB: start={rss['start']} end={rss['end']} peak={rss['peak']}")
+    for t, mb in rss["samples"]:
+        print(f"  t={t:>7.1f}s  {mb:8.1f} MiB")
+    if summary["errors"]:
+        print("errors:", ", ".join(f"{k}={v}" for k, v in sorted(summary["errors"].items())))
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.loadgen",
+                                 description="WebSocket load / soak test against a local server.")
+    ap.add_argument("--players", type=int, default=20)
+    ap.add_argument("--spectators", type=int, default=100)
+    ap.add_argument("--duration", type=float, default=60.0, help="seconds of load")
+    ap.add_argument("--think", type=float, default=1.0,
+                    help="mean seconds between a player's commands")
+    ap.add_argument("--churn", type=float, default=0.02,
+                    help="chance a player reconnects after each command")
+    ap.add_argument("--ramp", type=float, default=5.0, help="seconds to open all connections")
+    ap.add_argument("--agent-tick", type=float, default=2.0)
+    ap.add_argument("--rss-interval", type=float, default=5.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--llm-latency", type=float, default=0.0,
+                    help="fake LLM seconds to first token")
+    ap.add_argument("--llm-latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    ap.add_argument("--llm-tokens-per-second", type=float, default=0.0)
+    ap.add_argument("--llm-failure-rate", type=float, default=0.0)
+    ap.add_argument("--llm-drop-rate", type=float, default=0.0)
+    ap.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = ap.parse_args(argv)
+    results = asyncio.run(run_load(
+        players=args.players, spectators=args.spectators, duration=args.duration,
+        think=args.think, churn=args.churn, agent_tick=args.agent_tick,
+        rss_interval=args.rss_interval, ramp=args.ramp, seed=args.seed,
+        llm=Behaviour(latency=args.llm_latency, latency_dist=args.llm_latency_dist,
+                      tokens_per_second=args.llm_tokens_per_second,
+                      failure_rate=args.llm_failure_rate, drop_rate=args.llm_drop_rate,
+                      seed=args.seed)))
+    summary = summarize(results, args.duration)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        _print(summary)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
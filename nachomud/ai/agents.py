@@ -10,9 +10,8 @@ editing this list and the corresponding `contexts/agent_*.md` file.
 from __future__ import annotations
 
 from nachomud.ai.contexts import load as _load_context
-from nachomud.characters.character import create_character
+from nachomud.characters.character import create_character, standard_stats
 from nachomud.models import AgentState
-from nachomud.rules.stats import STAT_NAMES, Stats
 
 
 # ── Built-in agent personalities ──
@@ -61,16 +60,6 @@ AGENT_DEFINITIONS: list[dict] = [
 ]
 
 
-def _stats_for(class_name: str, primary: str) -> Stats:
-    """Standard array (15,14,13,12,10,8) with primary stat first."""
-    order = [primary] + [s for s in STAT_NAMES if s != primary]
-    values = [15, 14, 13, 12, 10, 8]
-    s = Stats()
-    for stat, v in zip(order, values, strict=False):
-        s.set(stat, v)
-    return s
-
-
 def build_agent_state(definition: dict, *, world_id: str, spawn_room: str) -> AgentState:
     """Mint a fresh AgentState for a built-in agent. Called by WorldLoop
     the first time the agent's save file doesn't exist on disk."""
@@ -78,7 +67,7 @@ def build_agent_state(definition: dict, *, world_id: str, spawn_room: str) -> Ag
         name=definition["name"],
         race=definition["race"],
         class_name=definition["class_name"],
-        base_stats=_stats_for(definition["class_name"], definition["primary"]),
+        base_stats=standard_stats(definition["primary"]),
         level=1,
         player_id=definition["actor_id"],
         respawn_room=spawn_room,
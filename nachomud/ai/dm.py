@@ -15,6 +15,7 @@ The LLM call is abstracted so tests can inject a stub.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
@@ -24,7 +25,7 @@ from collections.abc import Callable
 
 import nachomud.world.store as world_store
 from nachomud.ai.world_gen import WorldGen, _extract_json
-from nachomud.ai.llm import LLMUnavailable
+from nachomud.ai.llm import LLMUnavailable, call_site
 from nachomud.ai.contexts import load as load_context
 from nachomud.settings import DM_RECENT_EXCHANGES_CAP, LLM_SMART_MODEL
 from nachomud.models import AgentState, Item, Mob, Room
@@ -117,15 +118,38 @@ def _build_user_prompt(player: AgentState, room: Room, message: str) -> str:
     return "\n".join(parts)
 
 
-def _presence_summary(player: AgentState, room: Room) -> list[str]:
-    """Compact list of every visible NPC, mob, and item in the player's room
-    right now (NPCs filtered through the routine projection)."""
+def _build_narration_prompt(room: Room, target: str, presence: list[str]) -> str:
+    """`look at <target>` prompt. Its narration is stored on the room and
+    shown to every actor, so it carries nothing about the one asking."""
+    parts = [f"Current room: {room.name} — {room.description}"]
+    if room.exits:
+        parts.append(f"Visible exits: {', '.join(sorted(room.exits.keys()))}")
+    if room.flags:
+        parts.append("Room flags: " + ", ".join(f"{k}={v}" for k, v in room.flags.items()))
+    if presence:
+        parts.append("\nWho/what is present in this room RIGHT NOW (do not invent others):")
+        parts.extend(f"  - {line}" for line in presence)
+    else:
+        parts.append("\nNo one else is here right now (do not invent NPCs or creatures).")
+    parts.append(f"\nA traveler looks at: {target}")
+    parts.append("\nDescribe it in character as the DM (1-3 sentences). "
+                 "Address the traveler as \"you\"; do not name them. "
+                 "Stay grounded in the people/items listed above.")
+    return "\n".join(parts)
+
+
+def _presence_summary(player: AgentState, room: Room,
+                      co_residents: list[str] | None = None) -> list[str]:
+    """Compact list of every visible NPC, other adventurer, mob, and item
+    in the player's room right now (NPCs filtered through the routine
+    projection)."""
     from nachomud.world.routines import hour_from_minute, npcs_in_room
     lines: list[str] = []
     hour = hour_from_minute((player.game_clock or {}).get("minute", 480))
     for npc, activity in npcs_in_room(room.npcs, room.id, hour):
         suffix = f" ({activity})" if activity else ""
         lines.append(f"NPC {npc.name} the {npc.title}{suffix}")
+    lines.extend(f"Adventurer {name}" for name in sorted(co_residents or []))
     try:
         for m in world_store.mobs_in_room(player.world_id, room.id, alive_only=True):
             lines.append(f"Mob {m.name} (HP {m.hp}/{m.max_hp})")
@@ -138,6 +162,28 @@ def _presence_summary(player: AgentState, room: Room) -> list[str]:
 
 # ── Public API ──
 
+def _narration_key(room: Room, presence: list[str]) -> str:
+    """Digest of everything a `look at` narration depends on besides the
+    target: the room's flags and who/what is present right now."""
+    blob = json.dumps({"flags": room.flags, "presence": presence}, sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def _record_exchange(player: AgentState, room: Room, message: str, reply: str) -> str:
+    """Append one exchange to the player's rolling DM context, moving any
+    inline HINT: tag into pending_hints. Returns the reply without it."""
+    cleaned, hint = _extract_hint(reply)
+    ctx = _ctx_for(player)
+    ctx.setdefault("recent_exchanges", [])
+    ctx["recent_exchanges"].append({"player": message, "dm": cleaned})
+    ctx["recent_exchanges"] = _trim(ctx["recent_exchanges"])
+    if hint:
+        ctx.setdefault("pending_hints", [])
+        ctx["pending_hints"].append({"hint": hint, "added_at_room": room.id})
+    player.dm_context = ctx
+    return cleaned
+
+
 @dataclass
 class DM:
     llm: LLMFn | None = None
@@ -162,7 +208,8 @@ class DM:
         else:
             prompt = _build_user_prompt(player, room, message)
             try:
-                reply = self.llm(DM_PERSONA, prompt).strip()
+                with call_site("dm.respond"):
+                    reply = self.llm(DM_PERSONA, prompt).strip()
             except LLMUnavailable as e:
                 # Don't pollute dm_context with the failure — let the
                 # player retry once the LLM is back. Log so the operator
@@ -173,16 +220,37 @@ class DM:
             except Exception as e:
                 log.exception("DM.respond LLM call failed")
                 reply = f"(The DM's voice falters momentarily — {type(e).__name__}.)"
-        cleaned, hint = _extract_hint(reply)
-        ctx = _ctx_for(player)
-        ctx.setdefault("recent_exchanges", [])
-        ctx["recent_exchanges"].append({"player": message, "dm": cleaned})
-        ctx["recent_exchanges"] = _trim(ctx["recent_exchanges"])
-        if hint:
-            ctx.setdefault("pending_hints", [])
-            ctx["pending_hints"].append({"hint": hint, "added_at_room": room.id})
-        player.dm_context = ctx
-        return cleaned
+        return _record_exchange(player, room, message, reply)
+
+    def examine(self, player: AgentState, room: Room, target: str,
+                co_residents: list[str] | None = None) -> str:
+        """`look at <target>`. The narration is stored on the room and
+        reused by every actor until the room's flags or presence
+        (`co_residents` included) change. It's generated from a prompt
+        without the examiner's context and stored without its HINT: tag;
+        the hint goes to the examiner's pending_hints only."""
+        target = " ".join(target.lower().split())
+        message = f"look at {target}"
+        canned = _try_deterministic_reply(player, room, message)
+        if canned is not None:
+            return _record_exchange(player, room, message, canned)
+        presence = _presence_summary(player, room, co_residents)
+        key = _narration_key(room, presence)
+        try:
+            reply = world_store.get_room_narration(player.world_id, room.id, target, key)
+            if reply is None:
+                with call_site("dm.respond"):
+                    reply = self.llm(DM_PERSONA,
+                                     _build_narration_prompt(room, target, presence)).strip()
+                world_store.put_room_narration(player.world_id, room.id, target, key,
+                                               _extract_hint(reply)[0])
+        except LLMUnavailable as e:
+            log.warning("DM.examine unavailable for %s: %s", player.player_id, e)
+            return "(The DM is silent for the moment — the world feels still.)"
+        except Exception as e:
+            log.exception("DM.examine LLM call failed")
+            reply = f"(The DM's voice falters momentarily — {type(e).__name__}.)"
+        return _record_exchange(player, room, message, reply)
 
     def adjudicate(self, player: AgentState, room: Room, action: str) -> dict:
         """Adjudicate a free-form player action. Returns a dict with:
@@ -199,7 +267,8 @@ class DM:
         else:
             prompt = _build_adjudicate_prompt(player, room, action)
             try:
-                raw = self.llm(ADJUDICATE_PERSONA, prompt)
+                with call_site("dm.adjudicate"):
+                    raw = self.llm(ADJUDICATE_PERSONA, prompt)
                 payload = _extract_json(raw)
             except LLMUnavailable as e:
                 log.warning("DM.adjudicate unavailable for %s: %s",
@@ -260,7 +329,8 @@ class DM:
                     f"Player: {player.name} the {player.race} {player.agent_class} (L{player.level}).\n"
                     f"Current room: {room.name}.\n"
                     f"Speak briefly (1-2 sentences) in character to mark the moment.")
-            reply = self.llm(DM_PERSONA, user).strip()
+            with call_site("dm.interject"):
+                reply = self.llm(DM_PERSONA, user).strip()
         except Exception:
             log.exception("DM.interject LLM call failed")
             reply = f"(A hush falls over the world. {occasion}.)"
@@ -0,0 +1,369 @@
+"""A local stand-in for Ollama, for load and failure testing without a GPU.
+
+Speaks the two endpoints the game uses — `POST /api/chat` and
+`GET /api/tags` — and answers every call site with something the game
+can actually use: schema-valid room JSON for room generation,
+adjudication JSON for free-form actions, in-character lines for the DM
+and NPCs, and a playable one-line command for the agents (attack what's
+hostile, otherwise wander an exit). The call site is recognised from
+the persona heading in the system prompt.
+
+Replies are deterministic: the same prompt with the same seed always
+gets the same answer. The timing and failure knobs are what make it
+useful for load tests:
+
+  * latency      — time to first token, fixed or drawn from a uniform,
+                   exponential or lognormal distribution;
+  * throughput   — tokens per second, so long replies (room JSON) take
+                   longer than short ones (agent commands), like a real
+                   model;
+  * failure_rate — HTTP 500 (the host is up but the call failed);
+  * drop_rate    — the connection is closed with no reply, which
+                   chat() treats as the host being unreachable and which
+                   trips the circuit breaker;
+  * hang_rate    — the request is held open for `hang_seconds` and then
+                   dropped, to exercise the HTTP read timeout.
+
+    python -m nachomud.ai.fake_ollama --port 11434 --latency 0.8 \\
+        --latency-dist lognormal --tokens-per-second 40 --drop-rate 0.02
+
+Point NACHOMUD_AGENT_OLLAMA_URL (and the characters' DM URL) at it.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nachomud.settings import LLM_FAST_MODEL, LLM_SMART_MODEL, LLM_SUMMARY_MODEL
+
+
+log = logging.getLogger("nachomud.fake_ollama")
+
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Persona headings from nachomud/ai/contexts, checked in order.
+_KINDS: list[tuple[str, str]] = [
+    ("# Dungeon Master — room generation", "room_gen"),
+    ("# Dungeon Master — adjudication", "adjudicate"),
+    ("# Dungeon Master — conversational persona", "dm"),
+    ("# NPC dialogue summarizer", "npc_summary"),
+    ("# NPC dialogue persona", "npc"),
+    ("# Agent:", "agent"),
+]
+
+
+@dataclass
+class Behaviour:
+    latency: float = 0.0            # seconds to first token (median for lognormal)
+    latency_dist: str = "fixed"
+    latency_sigma: float = 0.5      # lognormal shape
+    tokens_per_second: float = 0.0  # 0 = the whole reply at once
+    failure_rate: float = 0.0
+    drop_rate: float = 0.0
+    hang_rate: float = 0.0
+    hang_seconds: float = 3600.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency_dist must be one of {LATENCY_DISTRIBUTIONS}")
+
+    def draw_latency(self, rng: random.Random) -> float:
+        if self.latency <= 0:
+            return 0.0
+        if self.latency_dist == "uniform":
+            return rng.uniform(0.0, 2 * self.latency)
+        if self.latency_dist == "exponential":
+            return rng.expovariate(1 / self.latency)
+        if self.latency_dist == "lognormal":
+            return self.latency * rng.lognormvariate(0.0, self.latency_sigma)
+        return self.latency
+
+
+# ── Replies ──
+
+def classify(system: str) -> str:
+    for marker, kind in _KINDS:
+        if marker in system:
+            return kind
+    return "other"
+
+
+_ROOM_NAMES = ["Mossy Hollow", "Broken Waystone", "Fern Gully", "Old Watchtower",
+               "Quiet Ford", "Thorn Thicket", "Sunken Path", "Crow's Rise"]
+_ROOM_SIGHTS = ["Tall grass sways around a weathered stone marker.",
+                "Roots knot the trail and the air smells of damp earth.",
+                "A cold stream cuts across the path, its banks churned by hooves.",
+                "Crumbling walls lean together, half swallowed by ivy."]
+_MOBS = [("Wild Boar", "wild_beast"), ("Pack Wolf", "wild_beast"),
+         ("Goblin Scout", "goblin"), ("Giant Spider", "wild_beast")]
+_LINES = ["The wind carries the smell of rain from the hills.",
+          "Somewhere beyond the trees, a bell tolls once and falls silent.",
+          "Nothing stirs but the dust in the lamplight.",
+          "The old stones here remember more than they tell."]
+_LORE = ["wolves have been bold near the ford this season.",
+         "the old watchtower burned two winters ago.",
+         "a tinker owes the innkeeper three silver."]
+_TOWN_PREFIXES = ("silverbrook", "village_", "market_")
+_FORWARD_DIRS = ("north", "south", "east", "west")
+
+
+def _room_gen_reply(rng: random.Random, user: str) -> str:
+    came = re.search(r"moved (\w+) from", user)
+    zone = re.search(r"Source zone: (\S+)", user)
+    zone_tag = zone.group(1) if zone and zone.group(1) != "unknown" else "forest_edge"
+    if zone_tag.startswith(_TOWN_PREFIXES):
+        zone_tag = "forest_edge"
+    ahead = came.group(1) if came else "north"
+    exits = [ahead, *rng.sample([d for d in _FORWARD_DIRS if d != ahead], rng.randint(0, 1))]
+    mob_name, faction = rng.choice(_MOBS)
+    room = {
+        "name": rng.choice(_ROOM_NAMES),
+        "description": " ".join(rng.sample(_ROOM_SIGHTS, 2)),
+        "zone_tag": zone_tag,
+        "exits": exits,
+        "npcs": [],
+        "mobs": [{"name": mob_name, "hp": rng.randint(6, 12), "ac": 11,
+                  "stats": {"STR": 10, "DEX": 12, "CON": 10, "INT": 6, "WIS": 8, "CHA": 6},
+                  "damage_die": "1d6", "damage_bonus": 1, "faction": faction,
+                  "aggression": rng.randint(5, 8), "xp_value": rng.randint(50, 150)}],
+        "items": [],
+    }
+    if rng.random() < 0.3:
+        room["npcs"].append({
+            "name": "Hollis", "title": "wandering tinker", "personality": "Chatty and nervous.",
+            "faction": "none",
+            "routines": [{"start_hr": 0, "end_hr": 24, "location_id": "this_room",
+                          "activity": "mending a pot"}],
+            "lore": [fact.capitalize() for fact in rng.sample(_LORE, 2)],
+        })
+    if rng.random() < 0.3:
+        room["items"].append({"name": "Healing Herb", "slot": "consumable"})
+    return json.dumps(room)
+
+
+def _adjudicate_reply(rng: random.Random) -> str:
+    reply: dict = {"narrate": rng.choice(_LINES), "skill_check": None,
+                   "actions": None, "hint": None}
+    if rng.random() < 0.3:
+        reply["skill_check"] = {"stat": rng.choice(["STR", "DEX", "WIS"]),
+                                "dc": rng.choice([10, 13, 15]),
+                                "on_success": "It gives way.", "on_fail": "It doesn't budge."}
+    return json.dumps(reply)
+
+
+def _agent_reply(rng: random.Random, user: str) -> str:
+    enemy = re.search(r"^\s+- (.+?) \(HP", user, re.MULTILINE)
+    if enemy:
+        return f"attack {enemy.group(1)}"
+    hostiles = re.search(r"^Hostiles: (.+?) \(HP", user, re.MULTILINE)
+    if hostiles:
+        return f"attack {hostiles.group(1)}"
+    exits = re.search(r"^Exits: (.+)$", user, re.MULTILINE)
+    options = ["look"] + (exits.group(1).split(", ") if exits else [])
+    return rng.choice(options)
+
+
+def reply_for(kind: str, system: str, user: str, seed: int = 0) -> str:
+    """The deterministic reply to one chat call."""
+    digest = hashlib.sha256(f"{seed}\0{system}\0{user}".encode()).digest()
+    rng = random.Random(int.from_bytes(digest[:8], "big"))
+    if kind == "room_gen":
+        return _room_gen_reply(rng, user)
+    if kind == "adjudicate":
+        return _adjudicate_reply(rng)
+    if kind == "agent":
+        return _agent_reply(rng, user)
+    if kind == "npc_summary":
+        return f"They mentioned that {rng.choice(_LORE)}"
+    if kind == "npc":
+        name = re.search(r"You are ([^,]+),", system)
+        return f"{name.group(1) if name else 'The stranger'} shrugs. \"{rng.choice(_LINES)}\""
+    return rng.choice(_LINES)
+
+
+# ── Server ──
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/api/tags":
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, {"models": [{"name": m, "model": m} for m in self.server.fake.models]})
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/api/chat":
+            self._send(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("content-length", "0"))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        fake = self.server.fake
+        messages = body.get("messages") or []
+        system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+        user = next((m.get("content", "") for m in reversed(messages)
+                     if m.get("role") == "user"), "")
+        kind = classify(system)
+        outcome, latency = fake.draw()
+        fake.record(kind, outcome)
+        if outcome == "hang":
+            fake.stopping.wait(fake.behaviour.hang_seconds)
+            self.close_connection = True
+            return
+        if fake.stopping.wait(latency):
+            return
+        if outcome == "drop":
+            self.close_connection = True
+            return
+        if outcome == "error":
+            self._send(500, {"error": "fake_ollama: injected failure"})
+            return
+        started = time.perf_counter()
+        reply = reply_for(kind, system, user, fake.behaviour.seed)
+        prompt_tokens = max(1, len(system + user) // 4)
+        tokens = max(1, len(reply) // 4)
+        if fake.behaviour.tokens_per_second > 0:
+            fake.stopping.wait(tokens / fake.behaviour.tokens_per_second)
+        generation_ns = int((time.perf_counter() - started) * 1e9)
+        self._send(200, {
+            "model": body.get("model", ""), "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "message": {"role": "assistant", "content": reply},
+            "done": True, "done_reason": "stop",
+            "total_duration": int(latency * 1e9) + generation_ns,
+            "prompt_eval_count": prompt_tokens, "eval_count": tokens,
+            "eval_duration": generation_ns,
+        })
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt: str, *args) -> None:
+        log.debug(fmt, *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: FakeOllama
+
+
+@dataclass
+class FakeOllama:
+    behaviour: Behaviour = field(default_factory=Behaviour)
+    host: str = "127.0.0.1"
+    port: int = 0                   # 0 = any free port
+    models: list[str] = field(default_factory=lambda: sorted(
+        {LLM_SMART_MODEL, LLM_FAST_MODEL, LLM_SUMMARY_MODEL}))
+
+    # (kind, outcome) -> requests, e.g. ("room_gen", "ok").
+    calls: Counter = field(default_factory=Counter)
+    stopping: threading.Event = field(default_factory=threading.Event)
+    _rng: random.Random = field(init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _server: _Server | None = None
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.behaviour.seed)
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "FakeOllama.start() first"
+        return f"http://{self.host}:{self._server.server_address[1]}"
+
+    def draw(self) -> tuple[str, float]:
+        """Outcome ("ok" / "error" / "drop" / "hang") and latency for the
+        next request, from the seeded stream."""
+        b = self.behaviour
+        with self._lock:
+            roll = self._rng.random()
+            latency = b.draw_latency(self._rng)
+        if roll < b.hang_rate:
+            return "hang", latency
+        if roll < b.hang_rate + b.drop_rate:
+            return "drop", latency
+        if roll < b.hang_rate + b.drop_rate + b.failure_rate:
+            return "error", latency
+        return "ok", latency
+
+    def record(self, kind: str, outcome: str) -> None:
+        with self._lock:
+            self.calls[(kind, outcome)] += 1
+
+    def start(self) -> str:
+        self.stopping.clear()
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.fake = self
+        threading.Thread(target=self._server.serve_forever, name="fake-ollama",
+                         daemon=True).start()
+        return self.url
+
+    def stop(self) -> None:
+        self.stopping.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _rate(text: str) -> float:
+    value = float(text)
+    if not 0.0 <= value <= 1.0:
+        raise argparse.ArgumentTypeError("rates are fractions between 0 and 1")
+    return value
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m nachomud.ai.fake_ollama",
+                                 description="Deterministic stand-in for an Ollama host.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=11434)
+    ap.add_argument("--latency", type=float, default=0.0,
+                    help="seconds to first token (median for lognormal)")
+    ap.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    ap.add_argument("--latency-sigma", type=float, default=0.5)
+    ap.add_argument("--tokens-per-second", type=float, default=0.0,
+                    help="generation speed (default: instant)")
+    ap.add_argument("--failure-rate", type=_rate, default=0.0, help="fraction answered HTTP 500")
+    ap.add_argument("--drop-rate", type=_rate, default=0.0,
+                    help="fraction whose connection is closed unanswered")
+    ap.add_argument("--hang-rate", type=_rate, default=0.0,
+                    help="fraction held open for --hang-seconds")
+    ap.add_argument("--hang-seconds", type=float, default=3600.0)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    fake = FakeOllama(Behaviour(
+        latency=args.latency, latency_dist=args.latency_dist, latency_sigma=args.latency_sigma,
+        tokens_per_second=args.tokens_per_second, failure_rate=args.failure_rate,
+        drop_rate=args.drop_rate, hang_rate=args.hang_rate, hang_seconds=args.hang_seconds,
+        seed=args.seed), host=args.host, port=args.port)
+    log.info("fake ollama listening on %s", fake.start())
+    try:
+        fake.stopping.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake.stop()
+        for (kind, outcome), n in sorted(fake.calls.items()):
+            log.info("%-12s %-6s %d", kind, outcome, n)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
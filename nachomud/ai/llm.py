@@ -1,6 +1,33 @@
 from __future__ import annotations
 
-from nachomud.settings import AGENT_OLLAMA_URL, OLLAMA_HTTP_TIMEOUT_SECONDS
+import contextlib
+import contextvars
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from nachomud.metrics import (
+    LLM_CACHE_EVICTIONS,
+    LLM_CACHE_LOOKUPS,
+    LLM_FAILURES,
+    LLM_SECONDS,
+    LLM_TOKENS,
+)
+from nachomud.settings import (
+    AGENT_OLLAMA_URL,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_TTL_SECONDS,
+    OLLAMA_CONNECT_TIMEOUT_SECONDS,
+    OLLAMA_HTTP_TIMEOUT_SECONDS,
+)
+
+
+log = logging.getLogger("nachomud.llm")
 
 # One Ollama client per host URL. The DM tier resolves a per-actor host
 # (each player's tailnet-shared Ollama), so over a session the app talks
@@ -8,6 +35,33 @@ from nachomud.settings import AGENT_OLLAMA_URL, OLLAMA_HTTP_TIMEOUT_SECONDS
 # on every chat() call.
 _clients: dict[str, object] = {}
 
+# Weight of the newest sample in the per-host latency EWMA. 0.3 tracks a
+# model swap within a handful of calls without letting one slow reply
+# dominate.
+LATENCY_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class HostStats:
+    """Rolling view of one Ollama host: latency EWMA of successful calls
+    plus how many requests are in flight right now. Updated by every
+    chat() call; read by the agent scheduler to pace the runners."""
+    ewma_seconds: float = 0.0
+    in_flight: int = 0
+    calls: int = 0
+    failures: int = 0
+
+    def observe(self, seconds: float) -> None:
+        if self.calls == 0:
+            self.ewma_seconds = seconds
+        else:
+            self.ewma_seconds += LATENCY_EWMA_ALPHA * (seconds - self.ewma_seconds)
+        self.calls += 1
+
+
+_host_stats: dict[str, HostStats] = {}
+_stats_lock = threading.Lock()
+
 
 class LLMUnavailable(Exception):
     """The LLM backend is not reachable right now (network error, host
@@ -20,15 +74,176 @@ class LLMUnavailable(Exception):
     """
 
 
+def host_stats(host: str | None = None) -> HostStats:
+    """Stats for `host` (None → AGENT_OLLAMA_URL). Creates an empty
+    record on first use so callers never have to handle a miss."""
+    target = AGENT_OLLAMA_URL if host is None else host
+    with _stats_lock:
+        stats = _host_stats.get(target)
+        if stats is None:
+            stats = HostStats()
+            _host_stats[target] = stats
+        return stats
+
+
 def _get_client(host: str):
     client = _clients.get(host)
     if client is None:
+        import httpx
         import ollama
-        client = ollama.Client(host=host, timeout=OLLAMA_HTTP_TIMEOUT_SECONDS)
+        client = ollama.Client(host=host, timeout=httpx.Timeout(
+            OLLAMA_HTTP_TIMEOUT_SECONDS, connect=OLLAMA_CONNECT_TIMEOUT_SECONDS))
         _clients[host] = client
     return client
 
 
+def preload() -> None:
+    """Import the Ollama client ahead of the first chat(). It's about
+    half a second of imports that would otherwise land on whichever
+    command first needs the LLM — often a room generation that holds
+    zone locks."""
+    import httpx  # noqa: F401
+    import ollama  # noqa: F401
+
+
+# ── Circuit breaker ──
+#
+# One per host. After CIRCUIT_FAILURE_THRESHOLD consecutive connection
+# failures the breaker opens and chat() refuses that host without touching
+# the network. A background thread probes open hosts' /api/tags; once one
+# answers, the breaker goes half-open and lets a single real call through
+# to decide between closed and open again. CIRCUIT_RESET_SECONDS is the
+# fallback for when the probe can't reach a host that chat() could.
+
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_SECONDS = 60.0
+PROBE_INTERVAL_SECONDS = 5.0
+PROBE_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass
+class CircuitBreaker:
+    host: str
+    state: str = "closed"            # "closed" | "open" | "half_open"
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+    clock: Callable[[], float] = time.monotonic
+
+    def allow(self) -> bool:
+        """May a call go to this host right now? In half-open, only one
+        trial call at a time is let through."""
+        with _breakers_lock:
+            if self.state == "open":
+                if self.clock() - self.opened_at < CIRCUIT_RESET_SECONDS:
+                    return False
+                self.state = "half_open"
+            if self.state == "half_open":
+                if self.trial_in_flight:
+                    return False
+                self.trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with _breakers_lock:
+            if self.state != "closed":
+                log.info("ollama host %s recovered; circuit closed", self.host)
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Returns True if this failure opened the circuit."""
+        with _breakers_lock:
+            self.consecutive_failures += 1
+            self.trial_in_flight = False
+            if self.state == "open":
+                return False
+            if (self.state == "half_open"
+                    or self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD):
+                self.state = "open"
+                self.opened_at = self.clock()
+                log.warning("ollama host %s unreachable %d times; circuit open",
+                            self.host, self.consecutive_failures)
+                return True
+            return False
+
+    def probe_succeeded(self) -> None:
+        with _breakers_lock:
+            if self.state == "open":
+                self.state = "half_open"
+                self.trial_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.RLock()
+_probe_thread: threading.Thread | None = None
+
+
+def circuit_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host=host)
+            _breakers[host] = breaker
+        return breaker
+
+
+def probe_host(host: str) -> bool:
+    """Cheap liveness check: Ollama's model list endpoint."""
+    import httpx
+    try:
+        r = httpx.get(host.rstrip("/") + "/api/tags", timeout=PROBE_TIMEOUT_SECONDS)
+    except httpx.HTTPError:
+        return False
+    return r.status_code == 200
+
+
+def _probe_loop() -> None:
+    while True:
+        time.sleep(PROBE_INTERVAL_SECONDS)
+        with _breakers_lock:
+            down = [b for b in _breakers.values() if b.state == "open"]
+        if not down:
+            return
+        for breaker in down:
+            if probe_host(breaker.host):
+                breaker.probe_succeeded()
+
+
+def _ensure_prober() -> None:
+    global _probe_thread
+    with _breakers_lock:
+        if _probe_thread is not None and _probe_thread.is_alive():
+            return
+        _probe_thread = threading.Thread(target=_probe_loop, name="ollama-probe",
+                                         daemon=True)
+        _probe_thread.start()
+
+
+# What a chat() call is for ("dm.respond", "npc.summary", "agent"...),
+# set by the caller around its LLM function so the metrics can tell
+# call sites apart without every LLMFn carrying a label.
+_call_site: contextvars.ContextVar[str] = contextvars.ContextVar("llm_call_site",
+                                                               default="other")
+
+
+@contextlib.contextmanager
+def call_site(name: str) -> Iterator[None]:
+    token = _call_site.set(name)
+    try:
+        yield
+    finally:
+        _call_site.reset(token)
+
+
+def _token_count(response, key: str) -> int:
+    try:
+        return int(response[key] or 0)
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
 def chat(*, system: str, message: str, model: str,
          host: str | None = None, max_tokens: int = 200) -> str:
     """Send a chat completion to Ollama and return the text response.
@@ -43,11 +258,14 @@ def chat(*, system: str, message: str, model: str,
         The DM persona surfaces the player-facing in-world message.
 
     Raises LLMUnavailable if the backend can't be reached (host down,
-    socket timeout, refused connection)."""
+    socket timeout, refused connection) — immediately, without touching
+    the network, while that host's circuit breaker is open."""
     import httpx
+    site = _call_site.get()
     if host is None:
         target = AGENT_OLLAMA_URL
     elif host == "":
+        LLM_FAILURES.inc(1, "", model, site)
         raise LLMUnavailable(
             "no DM Ollama URL configured for this actor — set one "
             "during character creation"
@@ -58,6 +276,14 @@ def chat(*, system: str, message: str, model: str,
     # this the Python ollama client sends a short default and Ollama
     # unloads after a few minutes — meaning every other call pays a
     # 100+ second model-load tax on CPU-only hosts.
+    breaker = circuit_breaker(target)
+    if not breaker.allow():
+        LLM_FAILURES.inc(1, target, model, site)
+        raise LLMUnavailable(f"ollama at {target} is down (circuit open)")
+    stats = host_stats(target)
+    with _stats_lock:
+        stats.in_flight += 1
+    started = time.monotonic()
     try:
         response = _get_client(target).chat(
             model=model,
@@ -70,5 +296,163 @@ def chat(*, system: str, message: str, model: str,
         )
     except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout,
             httpx.RemoteProtocolError, ConnectionError) as e:
+        LLM_FAILURES.inc(1, target, model, site)
+        with _stats_lock:
+            stats.failures += 1
+        if breaker.record_failure():
+            _ensure_prober()
         raise LLMUnavailable(f"ollama unreachable at {target}: {e}") from e
+    except Exception:
+        # The host answered (bad model name, malformed request...) — it's up.
+        LLM_FAILURES.inc(1, target, model, site)
+        breaker.record_success()
+        raise
+    finally:
+        with _stats_lock:
+            stats.in_flight -= 1
+    breaker.record_success()
+    elapsed = time.monotonic() - started
+    with _stats_lock:
+        stats.observe(elapsed)
+    LLM_SECONDS.observe(elapsed, target, model, site)
+    LLM_TOKENS.inc(_token_count(response, "prompt_eval_count"), target, model, site, "prompt")
+    LLM_TOKENS.inc(_token_count(response, "eval_count"), target, model, site, "completion")
     return response["message"]["content"].strip()
+
+
+# ── Response cache ──
+#
+# Opt-in per call site: the caller decides what the key is made of, so a
+# site can key on far less than the full prompt (e.g. room + target for
+# "look at fountain", ignoring the player's private DM history).
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Content-hash LLM response cache with TTL expiry and LRU eviction.
+
+    `variants` > 1 keeps that many independent replies per key and picks
+    one at random on each lookup, so a cached site doesn't say exactly the
+    same thing forever. Pass `seed=` to a lookup to pin the variant, or
+    `reseed()` the cache for reproducible picks."""
+
+    def __init__(self, name: str, *, ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+                 max_entries: int = LLM_CACHE_MAX_ENTRIES, variants: int = 1,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.variants = max(1, variants)
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+
+    def reseed(self, seed: int) -> None:
+        self._rng.seed(seed)
+
+    def key(self, *parts: object, seed: int | None = None) -> str:
+        if seed is None:
+            seed = self._rng.randrange(self.variants) if self.variants > 1 else 0
+        h = hashlib.sha256(str(seed).encode())
+        for part in parts:
+            h.update(b"\0")
+            h.update(str(part).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                LLM_CACHE_LOOKUPS.inc(1, self.name, "miss")
+                return None
+            stored_at, value = entry
+            if self.clock() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                LLM_CACHE_EVICTIONS.inc(1, self.name, "expired")
+                LLM_CACHE_LOOKUPS.inc(1, self.name, "miss")
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            LLM_CACHE_LOOKUPS.inc(1, self.name, "hit")
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+                LLM_CACHE_EVICTIONS.inc(1, self.name, "lru")
+
+    def get_or_call(self, parts: tuple, call: Callable[[], str], *,
+                    seed: int | None = None) -> str:
+        """Return the cached reply for `parts`, or run `call` and cache
+        its result. Exceptions (LLMUnavailable included) propagate and
+        nothing is cached."""
+        k = self.key(*parts, seed=seed)
+        cached = self.get(k)
+        if cached is not None:
+            return cached
+        value = call()
+        self.put(k, value)
+        return value
+
+    def wrap(self, fn: Callable[[str, str], str], *extra: object) -> Callable[[str, str], str]:
+        """Cache an LLMFn on its full (system, user) prompt. `extra` joins
+        the key — pass the model name so two tiers never share entries."""
+        def _call(system: str, user: str) -> str:
+            return self.get_or_call((*extra, system, user), lambda: fn(system, user))
+        return _call
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "expirations": self.stats.expirations,
+            "hit_rate": round(self.stats.hit_rate, 3),
+        }
+
+
+_caches: dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def response_cache(name: str, **kwargs) -> ResponseCache:
+    """Process-wide named cache, created with `kwargs` on first use."""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = ResponseCache(name, **kwargs)
+            _caches[name] = cache
+        return cache
+
+
+def response_caches() -> list[ResponseCache]:
+    """Every process-wide named cache, for sampling their sizes."""
+    with _caches_lock:
+        return list(_caches.values())
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from collections.abc import Callable
 
 from nachomud.ai.contexts import load as load_context
-from nachomud.ai.llm import LLMUnavailable
+from nachomud.ai.llm import LLMUnavailable, ResponseCache, call_site
 from nachomud.settings import LLM_SMART_MODEL, LLM_SUMMARY_MODEL, LORE_HISTORY_SIZE
 from nachomud.models import AgentState, NPC
 
@@ -32,8 +32,9 @@ def _default_llm(host: str | None = None) -> LLMFn:
     dialogue is the same tier as the DM, so it routes the same place."""
     def _call(system: str, user: str) -> str:
         from nachomud.ai.llm import chat
-        return chat(system=system, message=user, model=LLM_SMART_MODEL,
-                    host=host, max_tokens=300)
+        with call_site("npc.speak"):
+            return chat(system=system, message=user, model=LLM_SMART_MODEL,
+                        host=host, max_tokens=300)
     return _call
 
 
@@ -42,8 +43,9 @@ def _default_summary(host: str | None = None) -> LLMFn:
     call so an off-GPU player doesn't have one of two NPC calls succeed."""
     def _call(system: str, user: str) -> str:
         from nachomud.ai.llm import chat
-        return chat(system=system, message=user, model=LLM_SUMMARY_MODEL,
-                    host=host, max_tokens=120)
+        with call_site("npc.summary"):
+            return chat(system=system, message=user, model=LLM_SUMMARY_MODEL,
+                        host=host, max_tokens=120)
     return _call
 
 
@@ -66,8 +68,12 @@ def build_npc_system(npc: NPC, activity: str) -> str:
     )
 
 
-def build_npc_user_prompt(npc: NPC, player: AgentState, message: str) -> str:
-    parts = [f"A traveler approaches you. They are {player.name}, a {player.race} {player.agent_class}."]
+def build_npc_user_prompt(npc: NPC, player: AgentState, message: str,
+                          *, named: bool = True) -> str:
+    """`named=False` leaves the player's name out, for replies that are
+    cached and served to every player of the same race and class."""
+    who = f"{player.name}, a" if named else "a"
+    parts = [f"A traveler approaches you. They are {who} {player.race} {player.agent_class}."]
     if npc.wares:
         parts.append("\nYour wares for sale (use these EXACTLY — do not invent items or prices):")
         for w in npc.wares:
@@ -143,11 +149,28 @@ def build_summary_user_prompt(npc_name: str, dialogue: str) -> str:
 
 # ── Public API ──
 
+# Openers every newcomer asks. A first-time "hello" to the same NPC doing
+# the same thing gets the same answer whoever asks, so it can be cached.
+_CACHEABLE_NPC_QUESTIONS = frozenset({
+    "hi", "hello", "hey", "greetings", "who are you", "what is your name",
+    "whats your name", "what do you do", "what is this place",
+    "where am i", "any news", "any rumors", "any rumours",
+})
+
+
+def _cacheable_question(message: str) -> str | None:
+    norm = "".join(c for c in (message or "").lower() if c.isalnum() or c.isspace())
+    norm = " ".join(norm.split())
+    return norm if norm in _CACHEABLE_NPC_QUESTIONS else None
+
+
 @dataclass
 class NPCDialogue:
     llm: LLMFn | None = None
     summarizer: LLMFn | None = None
     host: str | None = None
+    # Shared across actors by the WorldLoop; None disables caching.
+    reply_cache: ResponseCache | None = None
 
     def __post_init__(self):
         if self.llm is None:
@@ -168,9 +191,20 @@ class NPCDialogue:
             return canned, ""
 
         system = build_npc_system(npc, activity)
-        user = build_npc_user_prompt(npc, player, message)
+        key = None
+        question = _cacheable_question(message)
+        if (self.reply_cache is not None and question is not None
+                and not _get_npc_chat_history(player, npc)):
+            key = (npc.name, activity, player.race, player.agent_class, question)
+        # A cached reply is shared by everyone the key matches, so its
+        # prompt carries nothing else about the player.
+        user = build_npc_user_prompt(npc, player, message, named=key is None)
         try:
-            reply = self.llm(system, user).strip()
+            if key is not None:
+                reply = self.reply_cache.get_or_call(
+                    ("reply", *key), lambda: self.llm(system, user)).strip()
+            else:
+                reply = self.llm(system, user).strip()
         except LLMUnavailable as e:
             log.warning("NPC.speak unavailable for %s talking to %s: %s",
                         player.player_id, npc.name, e)
@@ -180,8 +214,14 @@ class NPCDialogue:
             return f"({npc.name} doesn't seem to hear you.)", ""
 
         # Summary (best-effort; skip if it fails)
+        summary_prompt = build_summary_user_prompt(npc.name, reply)
         try:
-            summary = self.summarizer(SUMMARY_PERSONA, build_summary_user_prompt(npc.name, reply)).strip()
+            if key is not None:
+                summary = self.reply_cache.get_or_call(
+                    ("summary", *key),
+                    lambda: self.summarizer(SUMMARY_PERSONA, summary_prompt)).strip()
+            else:
+                summary = self.summarizer(SUMMARY_PERSONA, summary_prompt).strip()
         except Exception:
             summary = f"{npc.name}: {reply[:140]}"
 
@@ -2,9 +2,9 @@
 
 The runner builds a sensory snapshot, asks the LLM (with the agent's
 personality system prompt) for a single command, then submits it through
-the WorldLoop's command lock. LLM calls happen *outside* the lock so a
-slow LLM doesn't block other actors; the world serializes only the brief
-state-read and command-dispatch steps.
+the WorldLoop under the agent's zone locks. LLM calls happen *outside*
+the locks so a slow LLM doesn't block other actors; the world serializes
+only the brief state-read and command-dispatch steps.
 """
 from __future__ import annotations
 
@@ -15,6 +15,8 @@ from collections.abc import Callable
 import nachomud.ai.llm as llm
 import nachomud.settings as config
 import nachomud.world.store as world_store
+from nachomud.ai.scheduler import PAUSED_POLL_SECONDS, AgentScheduler
+from nachomud.combat.abilities import pick_rotation
 from nachomud.models import AgentState, Room
 from nachomud.world.loop import Actor
 from nachomud.world.routines import hour_from_minute, npcs_in_room
@@ -32,11 +34,31 @@ DEAD_TICK_SECONDS = 4.0
 
 
 LLMFn = Callable[[str, str], str]
+# A policy inspects a snapshot and either returns a command or None to
+# defer to the next policy (and, eventually, the LLM).
+Policy = Callable[[dict], "str | None"]
 
+# Below these HP fractions the fast path heals (in combat) or rests.
+COMBAT_HEAL_FRACTION = 0.35
+REST_HP_FRACTION = 0.5
+# Log each agent's LLM-call ratio every this many decisions.
+DECISION_REPORT_EVERY = 50
 
-def _default_llm(system: str, user: str) -> str:
-    return llm.chat(system=system, message=user, model=config.LLM_FAST_MODEL,
-                    max_tokens=80)
+
+# Idle agents in town rebuild byte-identical prompts tick after tick.
+# Cache their decisions, keeping a few variants per prompt so a cached
+# agent still wanders instead of repeating one command forever.
+AGENT_CACHE_VARIANTS = 3
+_decision_cache = llm.response_cache("agent_decisions", variants=AGENT_CACHE_VARIANTS)
+
+
+def _chat_fast(system: str, user: str) -> str:
+    with llm.call_site("agent"):
+        return llm.chat(system=system, message=user, model=config.LLM_FAST_MODEL,
+                        max_tokens=80)
+
+
+_default_llm = _decision_cache.wrap(_chat_fast, config.LLM_FAST_MODEL)
 
 
 def _snapshot(actor: Actor) -> dict:
@@ -51,6 +73,97 @@ def _snapshot(actor: Actor) -> dict:
     return {"state": state, "room": room, "in_combat": in_combat}
 
 
+# ── Fast-path policies ──
+#
+# Run under the actor's zone locks right after the snapshot. Each handles one
+# trivially-decidable state; anything they all pass on goes to the LLM.
+
+def _hostiles(snap: dict) -> list:
+    if "mobs" not in snap:
+        room = snap.get("room")
+        snap["mobs"] = (world_store.mobs_in_room(snap["state"].world_id, room.id,
+                                                 alive_only=True)
+                        if room is not None else [])
+    return snap["mobs"]
+
+
+def _hp_below(state: AgentState, fraction: float) -> bool:
+    return state.max_hp > 0 and state.hp < state.max_hp * fraction
+
+
+def combat_policy(snap: dict) -> str | None:
+    state = snap.get("state")
+    if state is None or not snap.get("in_combat"):
+        return None
+    mobs = _hostiles(snap)
+    if not mobs:
+        return None
+    return pick_rotation(state, [m.name for m in mobs], state.action_history,
+                         heal_below=COMBAT_HEAL_FRACTION)
+
+
+def rest_policy(snap: dict) -> str | None:
+    state = snap.get("state")
+    if state is None or snap.get("in_combat") or snap.get("room") is None:
+        return None
+    if _hp_below(state, REST_HP_FRACTION) and not _hostiles(snap):
+        return "rest"
+    return None
+
+
+def loot_policy(snap: dict) -> str | None:
+    state, room = snap.get("state"), snap.get("room")
+    if state is None or room is None or snap.get("in_combat") or _hostiles(snap):
+        return None
+    items = world_store.items_in_room(state.world_id, room.id)
+    if items:
+        return f"get {items[0].get('name', '?')}"
+    return None
+
+
+def frontier_policy(snap: dict) -> str | None:
+    """Nothing to see here and exactly one way on into the unknown: take it."""
+    state, room = snap.get("state"), snap.get("room")
+    if state is None or room is None or snap.get("in_combat") or _hostiles(snap):
+        return None
+    hour = hour_from_minute(state.game_clock.get("minute", 480))
+    if npcs_in_room(room.npcs, room.id, hour):
+        return None
+    if world_store.items_in_room(state.world_id, room.id):
+        return None
+    unexplored = [d for d, dest in room.exits.items()
+                  if dest not in state.visited_rooms]
+    if len(unexplored) == 1:
+        return unexplored[0]
+    return None
+
+
+DEFAULT_POLICIES: tuple[Policy, ...] = (
+    combat_policy, rest_policy, loot_policy, frontier_policy,
+)
+
+
+def decide_fast_path(snap: dict,
+                     policies: tuple[Policy, ...] = DEFAULT_POLICIES) -> str | None:
+    for policy in policies:
+        command = policy(snap)
+        if command:
+            return command
+    return None
+
+
+def _record_decision(actor: Actor, *, by_llm: bool) -> None:
+    if by_llm:
+        actor.llm_decisions += 1
+    else:
+        actor.policy_decisions += 1
+    total = actor.llm_decisions + actor.policy_decisions
+    if total % DECISION_REPORT_EVERY == 0:
+        log.info("agent %s: %d/%d decisions used the LLM (%.0f%%)",
+                 actor.actor_id, actor.llm_decisions, total,
+                 100 * actor.llm_call_ratio)
+
+
 def build_user_prompt(snap: dict) -> str:
     if snap["in_combat"]:
         return _build_combat_prompt(snap)
@@ -168,8 +281,13 @@ def parse_command(reply: str) -> str:
 async def agent_loop(world_loop, actor: Actor, *, llm_fn: LLMFn,
                      tick_seconds: float = AGENT_TICK_SECONDS,
                      stagger_seconds: float = 0.0,
-                     stop_event: asyncio.Event | None = None) -> None:
-    """Drive one agent forever. Cancelled by WorldLoop.stop()."""
+                     stop_event: asyncio.Event | None = None,
+                     scheduler: AgentScheduler | None = None) -> None:
+    """Drive one agent forever. Cancelled by WorldLoop.stop().
+
+    With a `scheduler`, the sleep between ticks comes from its adaptive
+    interval instead of `tick_seconds`, and the agent idles while nobody
+    is watching it."""
     if stagger_seconds > 0:
         try:
             await asyncio.sleep(stagger_seconds)
@@ -187,24 +305,40 @@ async def agent_loop(world_loop, actor: Actor, *, llm_fn: LLMFn,
             if not actor.state.alive:
                 await asyncio.sleep(DEAD_TICK_SECONDS)
                 continue
+            if scheduler is not None and not scheduler.should_run(
+                    actor.actor_id, watched=world_loop.is_watched(actor.actor_id)):
+                await asyncio.sleep(PAUSED_POLL_SECONDS)
+                continue
             await _tick_once(world_loop, actor, llm_fn)
+            if scheduler is not None:
+                scheduler.record_tick(actor.actor_id)
         except asyncio.CancelledError:
             return
         except Exception:
             log.exception("agent loop tick failed for %s", actor.actor_id)
         try:
-            await asyncio.sleep(tick_seconds)
+            await asyncio.sleep(scheduler.interval() if scheduler is not None
+                                else tick_seconds)
         except asyncio.CancelledError:
             return
 
 
 async def _tick_once(world_loop, actor: Actor, llm_fn: LLMFn) -> None:
     def _snapshot_locked():
-        with world_loop._lock:
+        with world_loop.hold_actor(actor, "(snapshot)"):
             snap = _snapshot(actor)
-            return snap, build_user_prompt(snap)
-
-    snap, user_prompt = await asyncio.to_thread(_snapshot_locked)
+            command = decide_fast_path(snap)
+            if command:
+                return snap, command, ""
+            return snap, None, build_user_prompt(snap)
+
+    snap, command, user_prompt = await asyncio.to_thread(_snapshot_locked)
+    if command:
+        _record_decision(actor, by_llm=False)
+        log.info("agent %s -> %s (policy)", actor.actor_id, command)
+        await _commit_command(world_loop, actor, command)
+        return
+    _record_decision(actor, by_llm=True)
     system_prompt = (actor.agent_def or {}).get("system_prompt", "")
 
     try:
@@ -226,6 +360,10 @@ async def _tick_once(world_loop, actor: Actor, llm_fn: LLMFn) -> None:
     if snap.get("in_combat"):
         command = _coerce_combat_command(command, actor, snap)
     log.info("agent %s -> %s", actor.actor_id, command)
+    await _commit_command(world_loop, actor, command)
+
+
+async def _commit_command(world_loop, actor: Actor, command: str) -> None:
     # Record so the next tick's prompt has self-context. Even
     # rejected commands are recorded — that's exactly what the
     # anti-repetition nudge in the prompt builder needs to spot.
@@ -0,0 +1,156 @@
+"""Adaptive pacing for the built-in agent runners.
+
+A fixed AGENT_TICK_SECONDS is wrong in both directions: on a CPU-only
+host the four agents queue behind each other (and behind humans' NPC
+chats) and the box never catches up; on a GPU box they idle most of the
+minute. The scheduler sizes every agent's sleep from what the operator's
+Ollama host is actually doing:
+
+  * latency EWMA x running agents sets a floor that keeps the host
+    below TARGET_UTILIZATION
+  * requests already in flight on the host stretch the interval while
+    the queue drains
+  * a human command in the last HUMAN_ACTIVE_WINDOW_SECONDS stretches
+    it further so interactive traffic wins
+  * an idle host with no humans around shrinks it toward
+    AGENT_TICK_MIN_SECONDS
+
+Agents no subscriber is watching are paused outright when
+AGENT_PAUSE_UNWATCHED is on. `metrics()` reports the effective rate;
+the WorldRegistry samples it into the /metrics gauges.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import nachomud.ai.llm as llm
+from nachomud.settings import (
+    AGENT_PAUSE_UNWATCHED,
+    AGENT_TICK_MAX_SECONDS,
+    AGENT_TICK_MIN_SECONDS,
+    AGENT_TICK_SECONDS,
+)
+
+
+log = logging.getLogger("nachomud.scheduler")
+
+
+# Fraction of the agent host's wall-clock the runners may keep busy.
+TARGET_UTILIZATION = 0.5
+# Interval multiplier per request already queued on the host.
+QUEUE_STRETCH = 0.5
+# Interval multiplier while humans are issuing commands.
+HUMAN_BACKOFF = 2.0
+HUMAN_ACTIVE_WINDOW_SECONDS = 60.0
+# Interval multiplier when nothing else wants the host.
+IDLE_FACTOR = 0.5
+# How often a paused agent re-checks whether someone started watching.
+PAUSED_POLL_SECONDS = 2.0
+# Window over which the measured tick rate is reported.
+RATE_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class AgentScheduler:
+    """Shared by every agent runner in one WorldLoop. Thread-safe: the
+    runners read it from the event loop while submit_command notes human
+    activity from worker threads."""
+    base_seconds: float = AGENT_TICK_SECONDS
+    min_seconds: float = AGENT_TICK_MIN_SECONDS
+    max_seconds: float = AGENT_TICK_MAX_SECONDS
+    pause_unwatched: bool = AGENT_PAUSE_UNWATCHED
+    stats_fn: Callable[[], llm.HostStats] = llm.host_stats
+    clock: Callable[[], float] = time.monotonic
+
+    _agents: set[str] = field(default_factory=set)
+    _paused: set[str] = field(default_factory=set)
+    _last_human: float | None = None
+    _ticks: deque = field(default_factory=deque)
+    _logged_interval: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def register(self, actor_id: str) -> None:
+        with self._lock:
+            self._agents.add(actor_id)
+
+    def note_human_activity(self) -> None:
+        with self._lock:
+            self._last_human = self.clock()
+
+    def should_run(self, actor_id: str, *, watched: bool) -> bool:
+        """False when the agent should sit this tick out because nobody
+        is watching it. Tracks the paused set for metrics."""
+        run = watched or not self.pause_unwatched
+        with self._lock:
+            if run:
+                self._paused.discard(actor_id)
+            else:
+                self._paused.add(actor_id)
+        return run
+
+    def record_tick(self, actor_id: str) -> None:
+        now = self.clock()
+        with self._lock:
+            self._ticks.append(now)
+            self._trim_ticks(now)
+
+    def interval(self) -> float:
+        """Seconds the calling agent should sleep before its next tick."""
+        stats = self.stats_fn()
+        with self._lock:
+            running = max(1, len(self._agents - self._paused))
+            humans = self._humans_active(self.clock())
+        floor = running * stats.ewma_seconds / TARGET_UTILIZATION
+        seconds = max(self.base_seconds, floor)
+        if stats.in_flight:
+            seconds *= 1 + QUEUE_STRETCH * stats.in_flight
+        if humans:
+            seconds *= HUMAN_BACKOFF
+        elif not stats.in_flight and floor < self.base_seconds:
+            seconds = max(floor, self.base_seconds * IDLE_FACTOR)
+        seconds = min(self.max_seconds, max(self.min_seconds, seconds))
+        self._maybe_log(seconds, running)
+        return seconds
+
+    def metrics(self) -> dict:
+        """Effective agent pacing right now. `ticks_per_minute` is what
+        actually happened over the last minute; `target_ticks_per_minute`
+        is what the current interval would produce across running agents."""
+        interval = self.interval()
+        stats = self.stats_fn()
+        now = self.clock()
+        with self._lock:
+            self._trim_ticks(now)
+            running = len(self._agents - self._paused)
+            return {
+                "interval_seconds": round(interval, 3),
+                "ticks_per_minute": len(self._ticks) * 60.0 / RATE_WINDOW_SECONDS,
+                "target_ticks_per_minute": round(running * 60.0 / interval, 3),
+                "latency_ewma_seconds": round(stats.ewma_seconds, 3),
+                "queue_depth": stats.in_flight,
+                "humans_active": self._humans_active(now),
+                "running_agents": running,
+                "paused_agents": len(self._paused),
+            }
+
+    def _humans_active(self, now: float) -> bool:
+        return (self._last_human is not None
+                and now - self._last_human < HUMAN_ACTIVE_WINDOW_SECONDS)
+
+    def _trim_ticks(self, now: float) -> None:
+        while self._ticks and now - self._ticks[0] > RATE_WINDOW_SECONDS:
+            self._ticks.popleft()
+
+    def _maybe_log(self, seconds: float, running: int) -> None:
+        with self._lock:
+            last = self._logged_interval
+            if last and abs(seconds - last) / last < 0.25:
+                return
+            self._logged_interval = seconds
+        log.info("agent interval now %.1fs (%d running, %.1f ticks/min)",
+                 seconds, running, running * 60.0 / seconds)
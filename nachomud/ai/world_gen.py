@@ -18,9 +18,10 @@ import uuid
 from collections.abc import Callable
 from dataclasses import dataclass
 
+import nachomud.world.spatial as spatial
 import nachomud.world.store as world_store
 from nachomud.ai.contexts import load as load_context
-from nachomud.ai.llm import LLMUnavailable
+from nachomud.ai.llm import LLMUnavailable, call_site
 from nachomud.models import Item, Mob, NPC, Room
 from nachomud.world.directions import VALID_DIRS, opposite
 
@@ -88,8 +89,8 @@ class WorldGen:
         Idempotent on `requested_id`: if a room with that id already
         exists (another actor raced ahead and created it on their own
         GPU), skip the LLM round-trip and return the existing room.
-        This is belt-and-suspenders — the WorldLoop._lock currently
-        serializes _cmd_move so two concurrent generations of the
+        This is belt-and-suspenders — both movers hold the zone lock
+        of the destination room, so two concurrent generations of the
         same requested_id can't actually happen. But the guard makes
         the contract explicit and survives any future change that
         releases the lock during LLM calls.
@@ -127,7 +128,8 @@ class WorldGen:
                                str(last_err) if last_err else "unknown")
 
     def _call_room_gen(self, source: Room, direction: str, new_id: str) -> dict:
-        raw = self.llm(ROOM_GEN_PERSONA, _build_room_gen_prompt(source, direction))
+        with call_site("dm.room_gen"):
+            raw = self.llm(ROOM_GEN_PERSONA, _build_room_gen_prompt(source, direction))
         return _extract_json(raw)
 
     def _materialize_room(self, source: Room, direction: str, new_id: str,
@@ -175,7 +177,8 @@ class WorldGen:
                 continue
 
         room = Room(id=new_id, name=name, description=desc, exits=exits,
-                    zone_tag=zone_tag, npcs=npcs)
+                    zone_tag=zone_tag, npcs=npcs,
+                    coords=spatial.claim(world_id, source.coords, direction, new_id))
         world_store.save_room(world_id, room)
         world_store.add_edge(world_id, source.id, direction, new_id)
         for d, dest in exits.items():
@@ -203,6 +206,7 @@ class WorldGen:
                          "perhaps the wind is to blame. (Generation fallback)"),
             exits={back_dir: source.id},
             zone_tag=source.zone_tag or "wild",
+            coords=spatial.claim(world_id, source.coords, direction, new_id),
         )
         world_store.save_room(world_id, room)
         world_store.add_edge(world_id, source.id, direction, new_id)
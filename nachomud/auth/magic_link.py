@@ -10,17 +10,23 @@ Flow:
   5. WS handler reads the cookie on connect and uses the account's
      player_id (instead of the anon localStorage UUID).
 
-Token store is in-memory; tokens are short-lived so server restart is
-acceptable. Email goes out via Fastmail SMTP (`smtplib`) — no SES, no
+Tokens live in memory by default; they're short-lived, so a server
+restart is acceptable. Set `NACHOMUD_AUTH_TOKEN_DB` to a SQLite file to
+share them between web workers (a link issued by one must verify on
+another). Session cookies are signed, not stored — every worker just
+needs the same NACHOMUD_SECRET_KEY. Email goes out via Fastmail SMTP (`smtplib`) — no SES, no
 external SDK. `NACHOMUD_AUTH_DEV_ECHO=1` logs the link to stdout
 instead, useful for local dev and tests.
 """
 from __future__ import annotations
 
+import heapq
 import logging
 import os
 import secrets
+import sqlite3
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from threading import Lock
 
@@ -35,6 +41,7 @@ log = logging.getLogger("nachomud.auth")
 TOKEN_TTL_SECONDS = 900            # 15 min
 SESSION_TTL_SECONDS = 60 * 60 * 24 * 30  # 30 days
 SESSION_COOKIE_NAME = "nachomud_session"
+TOKEN_DB_PATH = os.environ.get("NACHOMUD_AUTH_TOKEN_DB", "")
 
 SECRET_KEY = os.environ.get("NACHOMUD_SECRET_KEY") or secrets.token_hex(32)
 
@@ -61,17 +68,22 @@ class _PendingToken:
 
 
 @dataclass
-class TokenStore:
-    """In-memory single-use magic-link tokens. Thread-safe via a Lock."""
+class MemoryTokenStore:
+    """In-process single-use magic-link tokens. Thread-safe via a Lock.
+    Expiry is indexed by a min-heap, so issue/consume only ever touch
+    the tokens that actually expired."""
+    clock: Callable[[], float] = time.time
     _tokens: dict[str, _PendingToken] = field(default_factory=dict)
+    _expiry: list[tuple[float, str]] = field(default_factory=list)
     _lock: Lock = field(default_factory=Lock)
 
     def issue(self, email: str) -> str:
         token = secrets.token_urlsafe(32)
-        expires = time.time() + TOKEN_TTL_SECONDS
+        expires = self.clock() + TOKEN_TTL_SECONDS
         with self._lock:
             self._tokens[token] = _PendingToken(email=email.strip().lower(),
                                                  expires_at=expires)
+            heapq.heappush(self._expiry, (expires, token))
             self._gc_locked()
         return token
 
@@ -83,18 +95,80 @@ class TokenStore:
             self._gc_locked()
         if entry is None:
             return None
-        if entry.expires_at < time.time():
+        if entry.expires_at < self.clock():
             return None
         return entry.email
 
     def _gc_locked(self) -> None:
-        now = time.time()
-        stale = [k for k, v in self._tokens.items() if v.expires_at < now]
-        for k in stale:
-            self._tokens.pop(k, None)
+        now = self.clock()
+        while self._expiry and self._expiry[0][0] < now:
+            _, token = heapq.heappop(self._expiry)
+            self._tokens.pop(token, None)
 
 
-_token_store = TokenStore()
+@dataclass
+class SQLiteTokenStore:
+    """Tokens in a SQLite file, shared by every process that opens it.
+    `expires_at` is indexed, so GC is a range delete; consume reads and
+    deletes under BEGIN IMMEDIATE so a token verifies at most once even
+    when two workers race on it."""
+    path: str
+    clock: Callable[[], float] = time.time
+
+    def __post_init__(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        db = self._connect()
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS tokens ("
+                       "token TEXT PRIMARY KEY, email TEXT NOT NULL, "
+                       "expires_at REAL NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS tokens_expiry ON tokens (expires_at)")
+        finally:
+            db.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def issue(self, email: str) -> str:
+        token = secrets.token_urlsafe(32)
+        now = self.clock()
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("INSERT INTO tokens VALUES (?, ?, ?)",
+                       (token, email.strip().lower(), now + TOKEN_TTL_SECONDS))
+            db.execute("DELETE FROM tokens WHERE expires_at < ?", (now,))
+            db.execute("COMMIT")
+        finally:
+            db.close()
+        return token
+
+    def consume(self, token: str) -> str | None:
+        if not token:
+            return None
+        now = self.clock()
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT email, expires_at FROM tokens WHERE token = ?",
+                             (token,)).fetchone()
+            db.execute("DELETE FROM tokens WHERE token = ? OR expires_at < ?", (token, now))
+            db.execute("COMMIT")
+        finally:
+            db.close()
+        if row is None or row[1] < now:
+            return None
+        return row[0]
+
+
+def _make_token_store() -> MemoryTokenStore | SQLiteTokenStore:
+    if TOKEN_DB_PATH:
+        return SQLiteTokenStore(TOKEN_DB_PATH)
+    return MemoryTokenStore()
+
+
+_token_store = _make_token_store()
 
 
 def issue_token(email: str) -> str:
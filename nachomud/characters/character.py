@@ -13,6 +13,7 @@ from nachomud.rules.races import RACE_DEFINITIONS
 from nachomud.settings import STARTING_GOLD
 from nachomud.models import AgentState, Item
 from nachomud.rules.stats import (
+    STAT_NAMES,
     Stats,
     apply_racial_mods,
     compute_ac,
@@ -22,11 +23,24 @@ from nachomud.rules.stats import (
 )
 
 
+STANDARD_ARRAY = (15, 14, 13, 12, 10, 8)
+
+
 def _make_item(spec: dict) -> Item:
     """Build an Item from a class-default equipment spec (dict)."""
     return Item(**spec)
 
 
+def standard_stats(primary: str) -> Stats:
+    """Standard array (15,14,13,12,10,8) with `primary` first, the rest in
+    STAT_NAMES order."""
+    order = [primary] + [s for s in STAT_NAMES if s != primary]
+    stats = Stats()
+    for stat, v in zip(order, STANDARD_ARRAY, strict=True):
+        stats.set(stat, v)
+    return stats
+
+
 def create_character(
     name: str,
     race: str,
@@ -23,6 +23,7 @@ from nachomud.characters.character import (
     class_attack_bonus,
     class_damage_mod,
     spell_save_dc,
+    standard_stats,
 )
 from nachomud.rules.classes import CLASS_DEFINITIONS
 from nachomud.rules.races import RACE_DEFINITIONS
@@ -131,11 +132,7 @@ class CharCreator:
     def _handle_point_buy(self, text: str) -> list[tuple[str, str]]:
         if text.lower() == "standard":
             cdef = CLASS_DEFINITIONS[self.class_name]
-            primary = cdef["primary_stat"]
-            order_pref = [primary] + [s for s in STAT_NAMES if s != primary]
-            values = [15, 14, 13, 12, 10, 8]
-            for stat, v in zip(order_pref, values, strict=False):
-                self.stats.set(stat, v)
+            self.stats = standard_stats(cdef["primary_stat"])
             self.current_stat_idx = len(STAT_NAMES)
             self.state = "dm_url"
             return [("output", _c("Standard array assigned (primary stat first).\r\n", GREEN)), *self._prompt_for_state()]
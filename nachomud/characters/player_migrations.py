@@ -14,3 +14,12 @@ def player_v1_to_v2(payload: dict) -> dict:
     slash command, or by re-creating the character)."""
     payload.setdefault("dm_ollama_url", "")
     return payload
+
+
+@register("player", from_version=2)
+def player_v2_to_v3(payload: dict) -> dict:
+    """v3 moves `dm_context` out to a sidecar file and writes compact
+    header + body JSON. The payload itself is unchanged: an inline
+    `dm_context` from an older save is loaded eagerly, and the next save
+    writes it to the sidecar."""
+    return payload
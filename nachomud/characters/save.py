@@ -1,24 +1,47 @@
 """Player save/load.
 
-One file per player at `data/players/<player_id>.json`. The file holds the
-full AgentState (including stats, inventory, equipment, dm_context, game
-clock). Inventory items are inlined; world-resident items live in
-`world_store.items.json` keyed by item_id.
-
-The schema is versioned so future migrations can walk old saves forward.
+One file per player at `data/players/<player_id>.json`, holding the
+AgentState (stats, inventory, equipment, game clock...) as compact JSON
+on two lines: a small header (id, name, race, class, level) that
+`list_players` reads without parsing the rest, then the body. Inventory
+items are inlined; world-resident items live in `world_store.items.json`
+keyed by item_id.
+
+The DM / NPC conversation memory (`dm_context`) is the bulk of a
+long-lived save and is only needed when the DM or an NPC speaks, so it
+lives in a sidecar, `data/players/dm_context/<player_id>.json`, loaded
+the first time `AgentState.dm_context` is read. Until then saves leave
+the sidecar alone.
+
+The schema is versioned so future migrations can walk old saves forward;
+v1/v2 single-document saves still load.
+
+In the shared world, saves go through a `SaveCoordinator` rather than
+`save_player` directly: it coalesces each actor's writes to one per
+PLAYER_SAVE_DEBOUNCE_SECONDS and skips writes whose content hasn't
+changed since the last one.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import json
+import math
 import os
-from dataclasses import asdict, fields
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any
 
-from nachomud.characters import player_migrations  # noqa: F401  (registers v1→v2)
+from nachomud.characters import player_migrations  # noqa: F401  (registers player migrations)
 from nachomud.characters.migrations import migrate
+from nachomud.metrics import SAVE_WRITE_SECONDS
 from nachomud.models import AgentState, Item, StatusEffect
+from nachomud.settings import PLAYER_SAVE_DEBOUNCE_SECONDS
 
-SCHEMA_VERSION_PLAYER = 2
+SCHEMA_VERSION_PLAYER = 3
 
 DATA_ROOT = os.environ.get("NACHOMUD_PLAYERS_ROOT", os.path.join("data", "players"))
 
@@ -31,11 +54,19 @@ def player_path(player_id: str) -> str:
     return os.path.join(DATA_ROOT, f"{player_id}.json")
 
 
-def _atomic_write_json(path: str, payload: Any) -> None:
+def dm_context_path(player_id: str) -> str:
+    return os.path.join(DATA_ROOT, "dm_context", f"{player_id}.json")
+
+
+def _encode(payload: Any) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _atomic_write_text(path: str, text: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     tmp = path + ".tmp"
     with open(tmp, "w") as f:
-        json.dump(payload, f, indent=2, sort_keys=False)
+        f.write(text)
     os.replace(tmp, path)
 
 
@@ -88,18 +119,57 @@ def player_to_dict(p: AgentState) -> dict:
         "world_id": p.world_id,
         "game_clock": dict(p.game_clock),
         "gold": p.gold,
-        "dm_context": {
-            "recent_exchanges": list(p.dm_context.get("recent_exchanges", [])),
-            "summary": p.dm_context.get("summary", ""),
-            "pending_hints": list(p.dm_context.get("pending_hints", [])),
-            "npc_chats": dict(p.dm_context.get("npc_chats", {})),
-        },
         "visited_rooms": list(p.visited_rooms),
         "dm_ollama_url": p.dm_ollama_url,
         "schema_version": SCHEMA_VERSION_PLAYER,
     }
 
 
+def _header(p: AgentState) -> dict:
+    return {"player_id": p.player_id, "name": p.name, "race": p.race,
+            "class": p.agent_class, "level": p.level,
+            "schema_version": SCHEMA_VERSION_PLAYER}
+
+
+def dm_context_to_dict(p: AgentState) -> dict:
+    return {
+        "recent_exchanges": list(p.dm_context.get("recent_exchanges", [])),
+        "summary": p.dm_context.get("summary", ""),
+        "pending_hints": list(p.dm_context.get("pending_hints", [])),
+        "npc_chats": dict(p.dm_context.get("npc_chats", {})),
+    }
+
+
+def player_files(p: AgentState) -> list[tuple[str, str]]:
+    """(path, text) for every file a save of `p` writes. The dm_context
+    sidecar is included only once it's been loaded (or was never lazy)."""
+    main = _encode(_header(p)) + "\n" + _encode(player_to_dict(p)) + "\n"
+    out = [(player_path(p.player_id), main)]
+    if p.dm_context_loader is None:
+        out.append((dm_context_path(p.player_id), _encode(dm_context_to_dict(p))))
+    return out
+
+
+def load_dm_context(player_id: str) -> dict:
+    try:
+        with open(dm_context_path(player_id)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"recent_exchanges": [], "summary": "", "pending_hints": []}
+
+
+def _split_header(text: str) -> tuple[dict | None, str]:
+    """v3 files are `header\nbody`; older saves are one JSON document
+    (indented, so the first line alone never parses)."""
+    head, _, rest = text.partition("\n")
+    if not rest.strip():
+        return None, text
+    try:
+        return json.loads(head), rest
+    except json.JSONDecodeError:
+        return None, text
+
+
 def player_from_dict(d: dict) -> AgentState:
     d = migrate("player", dict(d), SCHEMA_VERSION_PLAYER)
 
@@ -141,7 +211,10 @@ def player_from_dict(d: dict) -> AgentState:
         world_id=d.get("world_id", "default"),
         player_id=d["player_id"],
         game_clock=dict(d.get("game_clock", {"day": 1, "minute": 480})),
-        dm_context=dict(d.get("dm_context", {"recent_exchanges": [], "summary": "", "pending_hints": []})),
+        # Pre-v3 saves carry dm_context inline; v3 leaves it in the sidecar.
+        _dm_context=dict(d["dm_context"]) if "dm_context" in d else {},
+        dm_context_loader=(None if "dm_context" in d
+                           else functools.partial(load_dm_context, d["player_id"])),
         visited_rooms=list(d.get("visited_rooms", [])),
         gold=int(d.get("gold", 0)),
         dm_ollama_url=str(d.get("dm_ollama_url", "")),
@@ -152,13 +225,112 @@ def player_from_dict(d: dict) -> AgentState:
 
 def save_player(p: AgentState) -> None:
     _ensure_root()
-    _atomic_write_json(player_path(p.player_id), player_to_dict(p))
+    with SAVE_WRITE_SECONDS.time():
+        for path, text in player_files(p):
+            _atomic_write_text(path, text)
+
+
+@dataclass
+class _Written:
+    digests: dict[str, bytes]
+    level: int
+    at: float
+
+
+@dataclass
+class SaveCoordinator:
+    """Debounced, change-tracked player saves for the WorldLoop.
+
+    `request()` after every state-changing command. The first request
+    after a quiet period writes straight away; later ones within
+    `interval_seconds` are parked until `flush_due()` (the world tick)
+    or a forced request. Forced: quit / disconnect / shutdown / death
+    by the caller, and automatically when level went up since the last
+    write. A write is skipped when the
+    serialized state is byte-identical to what's already on disk."""
+    interval_seconds: float = PLAYER_SAVE_DEBOUNCE_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    writes: int = 0
+    unchanged: int = 0
+    coalesced: int = 0
+
+    _pending: dict[str, AgentState] = field(default_factory=dict)
+    _written: dict[str, _Written] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def request(self, p: AgentState, *, force: bool = False) -> None:
+        pid = p.player_id
+        with self._lock:
+            if pid in self._pending:
+                self.coalesced += 1
+            self._pending[pid] = p
+            last = self._written.get(pid)
+            due = (force or last is None
+                   or self.clock() - last.at >= self.interval_seconds
+                   or p.level != last.level)
+            if due:
+                self._flush_locked(pid)
+
+    def due(self) -> list[str]:
+        """Ids of the parked saves whose interval has elapsed."""
+        now = self.clock()
+        with self._lock:
+            return [pid for pid in self._pending
+                    if now - self._written.get(pid, _NEVER).at >= self.interval_seconds]
+
+    def flush_due(self) -> int:
+        """Write every parked save whose interval has elapsed. Only safe
+        when nothing else is mutating those players; the WorldLoop uses
+        `due()` and `flush(pid)` under each actor's zone locks instead."""
+        return sum(self.flush(pid) for pid in self.due())
+
+    def flush(self, player_id: str | None = None) -> int:
+        """Write parked saves now — one player's, or everyone's."""
+        with self._lock:
+            pids = [player_id] if player_id is not None else list(self._pending)
+            return sum(self._flush_locked(pid) for pid in pids if pid in self._pending)
+
+    def forget(self, player_id: str) -> None:
+        """Drop tracking for a player whose file was written elsewhere
+        (or who left), so the next request writes unconditionally."""
+        with self._lock:
+            self._pending.pop(player_id, None)
+            self._written.pop(player_id, None)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {"writes": self.writes, "unchanged": self.unchanged,
+                    "coalesced": self.coalesced, "pending": len(self._pending)}
+
+    def _flush_locked(self, pid: str) -> int:
+        p = self._pending.pop(pid)
+        last = self._written.get(pid, _NEVER)
+        digests = dict(last.digests)
+        changed = []
+        for path, text in player_files(p):
+            digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            if digests.get(path) != digest:
+                changed.append((path, text))
+                digests[path] = digest
+        if not changed:
+            self.unchanged += 1
+            return 0
+        _ensure_root()
+        with SAVE_WRITE_SECONDS.time():
+            for path, text in changed:
+                _atomic_write_text(path, text)
+        self._written[pid] = _Written(digests=digests, level=p.level, at=self.clock())
+        self.writes += 1
+        return 1
+
+
+_NEVER = _Written(digests={}, level=0, at=-math.inf)
 
 
 def load_player(player_id: str) -> AgentState:
-    path = player_path(player_id)
-    with open(path) as f:
-        return player_from_dict(json.load(f))
+    with open(player_path(player_id)) as f:
+        _, body = _split_header(f.read())
+    return player_from_dict(json.loads(body))
 
 
 def player_exists(player_id: str) -> bool:
@@ -166,7 +338,8 @@ def player_exists(player_id: str) -> bool:
 
 
 def list_players() -> list[dict]:
-    """Return a summary of all saved players: id, name, race, class, level."""
+    """Return a summary of all saved players: id, name, race, class, level.
+    Reads only the header line of v3 saves."""
     _ensure_root()
     out = []
     for f in sorted(os.listdir(DATA_ROOT)):
@@ -174,7 +347,11 @@ def list_players() -> list[dict]:
             continue
         try:
             with open(os.path.join(DATA_ROOT, f)) as fp:
-                d = json.load(fp)
+                try:
+                    d = json.loads(fp.readline())
+                except json.JSONDecodeError:
+                    fp.seek(0)
+                    d = json.load(fp)
             out.append({
                 "player_id": d["player_id"],
                 "name": d["name"],
@@ -191,5 +368,7 @@ def delete_player(player_id: str) -> bool:
     path = player_path(player_id)
     if os.path.isfile(path):
         os.remove(path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(dm_context_path(player_id))
         return True
     return False
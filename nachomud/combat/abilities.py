@@ -26,7 +26,7 @@ from nachomud.characters.effects import (
     modify_outgoing_damage,
 )
 from nachomud.models import AgentState, GameEvent, Item, Mob, Room, StatusEffect
-from nachomud.rules.dice import roll_d20, roll_detail, roll_dice_doubled
+from nachomud.rules.dice import DiceExpr, compile_dice, roll_d20
 from nachomud.rules.stats import mod as stat_mod
 
 # ABILITY_DEFINITIONS + MULTI_WORD_ABILITIES tables appear at the bottom of this
@@ -138,32 +138,28 @@ def _mob_save_bonus(mob: Mob, stat: str) -> int:
     return stat_mod(s) + mob.proficiency_bonus  # mobs proficient in everything for v1 simplicity
 
 
-def _resolve_damage_dice(spec: str, weapon: Item) -> list[str]:
-    """Parse a damage spec into a list of dice notations to roll.
+def _resolve_damage_dice(spec: str, weapon: Item) -> DiceExpr | None:
+    """Compile a damage spec into one dice expression.
 
-    'weapon'         -> [weapon.damage_die]
-    'weapon+2d6'     -> [weapon.damage_die, '2d6']
-    '2d6'            -> ['2d6']
-    ''               -> []
+    'weapon'         -> weapon.damage_die
+    'weapon+2d6'     -> weapon.damage_die + 2d6
+    '2d6'            -> 2d6
+    ''               -> None
     """
     if not spec:
-        return []
+        return None
     weapon_die = weapon.damage_die or "1d4"
     if spec == "weapon":
-        return [weapon_die]
+        return compile_dice(weapon_die)
     if spec.startswith("weapon+"):
-        return [weapon_die, spec[len("weapon+"):]]
-    return [spec]
+        return compile_dice(f"{weapon_die}+{spec[len('weapon+'):]}")
+    return compile_dice(spec)
 
 
-def _roll_damage_total(dice_list: list[str], crit: bool) -> int:
-    total = 0
-    for notation in dice_list:
-        if crit:
-            total += roll_dice_doubled(notation)
-        else:
-            total += roll_detail(notation).total
-    return total
+def _roll_damage_total(expr: DiceExpr | None, crit: bool) -> int:
+    if expr is None:
+        return 0
+    return expr.roll_doubled() if crit else expr.roll()
 
 
 # ── Cost checking ──
@@ -193,6 +189,42 @@ def can_afford(source: AgentState, ability_name: str) -> tuple[bool, str]:
     return False, f"Unknown cost type: {cost_type}"
 
 
+HEALING_ABILITIES = ("lay_on_hands", "heal")
+
+
+def pick_rotation(source: AgentState, enemies: list[str], recent: list[str], *,
+                  heal_below: float = 0.35) -> str:
+    """Deterministic combat command: self-heal when under `heal_below` of
+    max HP, otherwise the least-recently used affordable offensive ability
+    (AoE only against 2+ enemies), otherwise a basic attack on the first
+    enemy. `recent` is the source's command history, oldest first."""
+    known = list(source.abilities or [])
+    if source.max_hp > 0 and source.hp < source.max_hp * heal_below:
+        for name in HEALING_ABILITIES:
+            if name in known and can_afford(source, name)[0]:
+                return name
+    offensive = []
+    for name in known:
+        defn = ABILITY_DEFINITIONS.get(name)
+        if name == "attack" or defn is None:
+            continue
+        if defn["target"] == "all_enemies" and len(enemies) < 2:
+            continue
+        if defn["target"] in ("enemy", "all_enemies") and can_afford(source, name)[0]:
+            offensive.append(name)
+    if not offensive:
+        return f"attack {enemies[0]}"
+    verbs = [c.split()[0].lower() for c in recent if c]
+
+    def last_used(name: str) -> int:
+        return max((i for i, v in enumerate(verbs) if v == name), default=-1)
+
+    pick = min(offensive, key=last_used)
+    if ABILITY_DEFINITIONS[pick]["target"] == "all_enemies":
+        return pick
+    return f"{pick} {enemies[0]}"
+
+
 def pay_cost(source: AgentState, ability_name: str) -> None:
     defn = ABILITY_DEFINITIONS[ability_name]
     cost = defn["cost"]
@@ -223,8 +255,7 @@ def _make_weapon_attack(source: AgentState, mob: Mob, dice_spec: str,
     if not hit:
         return False, False, d20, attack_total, 0
 
-    dice_list = _resolve_damage_dice(dice_spec, source.weapon)
-    raw = _roll_damage_total(dice_list, crit)
+    raw = _roll_damage_total(_resolve_damage_dice(dice_spec, source.weapon), crit)
     raw += class_damage_mod(source)
     damage = modify_outgoing_damage(source, raw)
     damage = max(1, damage)
@@ -245,8 +276,7 @@ def _make_spell_attack(source: AgentState, mob: Mob, dice_spec: str) -> tuple[bo
     if not hit:
         return False, False, d20, attack_total, 0
 
-    dice_list = _resolve_damage_dice(dice_spec, source.weapon)
-    raw = _roll_damage_total(dice_list, crit)
+    raw = _roll_damage_total(_resolve_damage_dice(dice_spec, source.weapon), crit)
     raw += _caster_mod(source)
     damage = modify_outgoing_damage(source, raw)
     damage = max(1, damage)
@@ -423,8 +453,7 @@ def _resolve_consecrate(source, target_name, room, tick, agents, rooms):
     parts = []
     for mob in mobs:
         saved, _d20, _ = _make_save(mob, "DEX", dc)
-        dice_list = _resolve_damage_dice("3d6", source.weapon)
-        raw = _roll_damage_total(dice_list, crit=False)
+        raw = _roll_damage_total(compile_dice("3d6"), crit=False)
         damage = max(1, raw // 2 if saved else raw)
         _, extra = _apply_damage_to_mob(mob, damage, room)
         save_tag = "saved" if saved else "failed"
@@ -442,8 +471,7 @@ def _resolve_missile(source, target_name, room, tick, agents, rooms):
         return [GameEvent(tick, source.name, f"missile {target_name}", hint, source.room_id)]
     pay_cost(source, "missile")
     # Magic missile auto-hits in 5e
-    dice_list = _resolve_damage_dice("1d4+1", source.weapon)
-    raw = _roll_damage_total(dice_list, crit=False)
+    raw = _roll_damage_total(compile_dice("1d4+1"), crit=False)
     damage = modify_outgoing_damage(source, max(1, raw))
     _, extra = _apply_damage_to_mob(mob, damage, room)
     result = f"{source.name}'s magic missile streaks at {mob.name} for {damage} force damage. ({mob.name} HP: {mob.hp}/{mob.max_hp})"
@@ -461,7 +489,7 @@ def _resolve_arcane_storm(source, target_name, room, tick, agents, rooms):
     parts = []
     for mob in mobs:
         saved, _d20, _ = _make_save(mob, "DEX", dc)
-        raw = _roll_damage_total(["4d6"], crit=False)
+        raw = _roll_damage_total(compile_dice("4d6"), crit=False)
         damage = max(1, raw // 2 if saved else raw)
         _, extra = _apply_damage_to_mob(mob, damage, room)
         save_tag = "saved" if saved else "failed"
@@ -511,7 +539,7 @@ def _resolve_heal(source, target_name, room, tick, agents, rooms):
                               f"No ally named '{target_name}' here.", source.room_id)]
         target = ally
     pay_cost(source, "heal")
-    raw = _roll_damage_total(["2d4"], crit=False)
+    raw = _roll_damage_total(compile_dice("2d4"), crit=False)
     heal = raw + _caster_mod(source)
     target.hp = min(target.max_hp, target.hp + heal)
     result = f"{source.name} heals {target.name} for {heal} HP. ({target.name} HP: {target.hp}/{target.max_hp})"
@@ -7,8 +7,11 @@ player's action and runs all subsequent mob turns until the next player
 turn or combat end. Each enter/exit transition emits a list of session
 messages.
 
-Mobs are loaded from world_store at combat start and synced back after
-every action so death/HP changes persist immediately.
+Mobs are loaded from world_store at combat start. HP/alive/AI changes are
+staged on the in-memory Mob objects and committed at combat end, touching
+only the fields that changed. An ordinary round writes nothing, so its
+cost doesn't depend on how many mobs the world holds; a round that kills
+a mob is checkpointed straight away so the kill survives a disconnect.
 """
 from __future__ import annotations
 
@@ -103,6 +106,10 @@ class Encounter:
     turn_idx: int = 0
     round_num: int = 1
     state: str = "active"  # "active" | "victory" | "defeat" | "fled"
+    # False for offline fights (combat.sim): nothing touches world_store.
+    persist: bool = True
+    # Last-written form of each mob, so _sync_mobs only writes changed fields.
+    _committed: dict[str, dict] = field(default_factory=dict, repr=False)
 
     def __post_init__(self):
         if self.decider is None:
@@ -110,10 +117,15 @@ class Encounter:
 
     # ── Public API ──
 
-    def start(self) -> list:
-        """Roll initiative, populate room.mobs, advance to player's first turn."""
-        living_mobs = world_store.mobs_in_room(self.world_id, self.room.id, alive_only=True)
+    def start(self, mobs: list[Mob] | None = None) -> list:
+        """Roll initiative, populate room.mobs, advance to player's first turn.
+        `mobs` overrides the room's living mobs from world_store."""
+        living_mobs = (mobs if mobs is not None
+                       else world_store.mobs_in_room(self.world_id, self.room.id, alive_only=True))
         self.mob_dict = {m.mob_id: m for m in living_mobs}
+        if self.persist:
+            self._committed = {mid: world_store.mob_to_dict(m)
+                               for mid, m in self.mob_dict.items()}
         self.room.mobs = list(self.mob_dict.values())
 
         if not self.mob_dict:
@@ -194,8 +206,10 @@ class Encounter:
         )
         msgs: list = [_output(self._render_event(events[0]) + "\r\n")]
 
-        # Persist mob state (HP, alive)
-        self._sync_mobs()
+        # HP stays in memory until the fight ends; only a kill is written now
+        if any(not m.alive and self._committed.get(mid, {}).get("alive", True)
+               for mid, m in self.mob_dict.items()):
+            self._sync_mobs()
 
         # Check victory
         if all(not m.alive for m in self.mob_dict.values()):
@@ -323,9 +337,9 @@ class Encounter:
         if not crit and total < self.player.ac:
             return [_output(_c(f"{mob.name} swings at {self.player.name} ({d20}+{atk_bonus}={total} vs AC {self.player.ac}) — miss.\r\n", DIM))]
         # Damage
-        from nachomud.rules.dice import roll_dice_doubled, roll_detail
-        die = mob.damage_die or "1d4"
-        dmg = roll_dice_doubled(die) if crit else roll_detail(die).total
+        from nachomud.rules.dice import compile_dice
+        die = compile_dice(mob.damage_die or "1d4")
+        dmg = die.roll_doubled() if crit else die.roll()
         dmg += mob.damage_bonus
         dmg = max(1, dmg)
         from nachomud.characters.effects import modify_incoming_damage
@@ -338,8 +352,19 @@ class Encounter:
         return [_output(_c(text + "\r\n", color))]
 
     def _sync_mobs(self) -> None:
-        for m in self.mob_dict.values():
-            world_store.update_mob(self.world_id, m)
+        """Write the fields combat changed (hp, alive...) and nothing else:
+        the mob tick may have moved or re-tasked a mob since start()."""
+        if not self.persist:
+            return
+        patches = {}
+        for mid, m in self.mob_dict.items():
+            d = world_store.mob_to_dict(m)
+            last = self._committed.get(mid, {})
+            changed = {k: v for k, v in d.items() if last.get(k) != v}
+            if changed:
+                self._committed[mid] = d
+                patches[mid] = changed
+        world_store.patch_mobs(self.world_id, patches)
 
     def _on_player_zero(self) -> list:
         p = self.player
@@ -5,6 +5,7 @@ is not yet wired (but `attack` echoes a placeholder).
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from collections import deque
 from collections.abc import Callable
 
 import nachomud.characters.save as player_mod
@@ -15,6 +16,7 @@ from nachomud.combat.encounter import Encounter, MobDecider
 from nachomud.models import AgentState, Item, Room
 from nachomud.style import BOLD, CYAN, DIM, GREEN, MAGENTA, RED, YELLOW, _c
 from nachomud.world.directions import LONG_TO_SHORT
+from nachomud.world.routes import RouteIndex
 from nachomud.world.routines import hour_from_minute, npcs_in_room
 import contextlib
 
@@ -249,11 +251,22 @@ class Game:
     # as `room_id`. Wired by WorldLoop; None for tests / standalone Game
     # (in which case "Adventurers here:" never renders).
     co_residents_fn: Callable[[str], list[str]] | None = None
+    # Debounced saver shared across the WorldLoop's actors; None saves
+    # synchronously on every _persist (tests / standalone Game).
+    saves: player_mod.SaveCoordinator | None = None
 
     # Snapshot of the current room (loaded lazily)
     _room: Room | None = None
     _encounter: Encounter | None = None
-    _pending_witness: list[str] = field(default_factory=list)
+    # deque: appended from the tick thread, drained here with popleft().
+    _pending_witness: deque[str] = field(default_factory=deque)
+    # ((graph version, rooms visited, current room, grid?), rendered `map` text)
+    _map_memo: tuple[tuple, str] | None = None
+    # Explored-room routes for `travel`, built on first use.
+    _routes: RouteIndex | None = None
+    # (from room, direction, to room) of the last exit walked through, so
+    # the WorldLoop can word "X heads north" without reading the graph.
+    last_move: tuple[str, str, str] | None = None
 
     def _co_residents(self) -> list[str]:
         if self.co_residents_fn is None or not self.player.room_id:
@@ -274,7 +287,10 @@ class Game:
         ]
         return msgs
 
-    def handle(self, text: str) -> list:
+    def handle(self, text: str, *, brief: bool = False) -> list:
+        """Run one command. `brief` only affects moves: a successful one
+        reports just the step ("You head north."), no room render, status
+        or prompt — for the middle steps of a walk (WorldLoop.submit_moves)."""
         text = text.strip()
         if not text:
             return [self._make_prompt()]
@@ -290,10 +306,10 @@ class Game:
 
         # Direction shortcut: "n", "north", etc.
         if cmd_lower in _DIRS and not arg:
-            return self._cmd_move(_DIRS[cmd_lower])
+            return self._cmd_move(_DIRS[cmd_lower], brief=brief)
         # Two-word direction: "go north"
         if cmd_lower == "go" and arg.lower() in _DIRS:
-            return self._cmd_move(_DIRS[arg.lower()])
+            return self._cmd_move(_DIRS[arg.lower()], brief=brief)
 
         # Fast path: `attack <mob>` enters combat mode immediately.
         # Other attack-flavored verbs ("punch <mob>") fall through to the DM,
@@ -315,6 +331,22 @@ class Game:
             result = handler(arg)
         return self._inject_witness(result)
 
+    def verb_of(self, text: str) -> str:
+        """The command `handle(text)` would run, as a short fixed label
+        ("move", "look", "adjudicate"...) for per-command metrics."""
+        if self._encounter is not None and self._encounter.is_active():
+            return "combat"
+        cmd, _, arg = text.strip().partition(" ")
+        cmd, arg = cmd.lower(), arg.strip()
+        if not cmd:
+            return "prompt"
+        if (cmd in _DIRS and not arg) or (cmd == "go" and arg.lower() in _DIRS):
+            return "move"
+        if cmd in _ATTACK_FAST_PATH and arg:
+            return "attack"
+        handler = None if cmd in _NO_ARG_COMMANDS and arg else self._dispatch(cmd)
+        return handler.__name__.removeprefix("_cmd_") if handler else "adjudicate"
+
     def _inject_witness(self, result: list) -> list:
         """Insert any pending mob witness messages just before the trailing prompt."""
         if not self._pending_witness:
@@ -355,6 +387,8 @@ class Game:
             "shop": self._cmd_wares,
             "buy":  self._cmd_buy,
             "equip": self._cmd_equip,
+            "travel": self._cmd_travel,
+            "goto":  self._cmd_travel,
             "wield": self._cmd_equip,
             "wear":  self._cmd_equip,
         }.get(cmd)
@@ -391,20 +425,27 @@ class Game:
 
     def queue_witness(self, lines: list[str]) -> None:
         """Push witness lines onto this actor's pending queue. Called by
-        WorldLoop during the global mob tick."""
-        for line in lines:
-            self._pending_witness.append(line)
+        WorldLoop during the global mob tick, from another thread than
+        the one running this actor's commands."""
+        self._pending_witness.extend(lines)
 
     def _drain_witness(self) -> list:
-        if not self._pending_witness:
+        # deque extend/popleft are atomic: a line queued concurrently is
+        # either popped now or left for the next drain.
+        pending = []
+        while self._pending_witness:
+            pending.append(self._pending_witness.popleft())
+        if not pending:
             return []
-        text = "\r\n".join(self._pending_witness) + "\r\n"
-        self._pending_witness = []
+        text = "\r\n".join(pending) + "\r\n"
         return [_output(_c(text, DIM))]
 
-    def _persist(self) -> None:
+    def _persist(self, *, force: bool = False) -> None:
         with contextlib.suppress(Exception):
-            player_mod.save_player(self.player)
+            if self.saves is None:
+                player_mod.save_player(self.player)
+            else:
+                self.saves.request(self.player, force=force)
 
     # ── Commands ──
 
@@ -413,8 +454,14 @@ class Game:
         if not arg:
             self._advance("look")
             return [_output(render_room(self.player, room, co_residents=self._co_residents())), self._make_prompt()]
-        # look at <thing> — let DM narrate
-        return self._cmd_dm(f"look at {arg}")  # chat-style is right for examining
+        # look at <thing> — let DM narrate (chat-style is right for examining)
+        target = arg.strip()
+        if target.lower().startswith("at "):
+            target = target[3:].strip()
+        reply = self.dm.examine(self.player, room, target, self._co_residents())
+        self._advance("dm")
+        self._persist()
+        return [_output(_c("DM: ", BOLD + MAGENTA) + reply + "\r\n"), self._make_prompt()]
 
     def _cmd_exits(self, arg: str) -> list:
         room = self._load_room()
@@ -423,7 +470,16 @@ class Game:
         return [_output(_c("Exits: ", BOLD) + ", ".join(sorted(room.exits.keys())) + "\r\n"),
                 self._make_prompt()]
 
-    def _cmd_move(self, direction: str) -> list:
+    def describe_here(self) -> list:
+        """The room the player is standing in, their status and a prompt —
+        what arriving somewhere shows."""
+        return [
+            _output(render_room(self.player, self._load_room(), co_residents=self._co_residents())),
+            _status(self.player),
+            self._make_prompt(),
+        ]
+
+    def _cmd_move(self, direction: str, *, brief: bool = False) -> list:
         room = self._load_room()
         dest = room.exits.get(direction)
         # Allow short/long forms in room data: try both
@@ -449,31 +505,99 @@ class Game:
                 return [_output(_c(f"The way {direction} resists you ({type(e).__name__}).\r\n", RED)),
                         self._make_prompt()]
 
+        self.last_move = (self.player.room_id, direction, dest)
         self.player.room_id = dest
         if dest not in self.player.visited_rooms:
             self.player.visited_rooms.append(dest)
         self._advance("move")
         self._persist()
         self._room = None  # invalidate
-        new_room = self._load_room()
         msgs: list = [_output(_c(f"You head {direction}.\r\n", DIM))]
         if gen_msg:
             msgs.append(_output(gen_msg))
-        msgs.extend([
-            _output(render_room(self.player, new_room, co_residents=self._co_residents())),
-            _status(self.player),
-            self._make_prompt(),
-        ])
+        if not brief:
+            msgs.extend(self.describe_here())
         return msgs
 
-    def _cmd_map(self, _arg: str) -> list:
-        from nachomud.world.map import render_explored_text
+    def plan_travel(self, arg: str) -> tuple[list[str], list]:
+        """The directions to the explored room named `arg` and the line
+        that starts the trip — or no directions and why not."""
+        p = self.player
+        if not arg:
+            return [], [_output(_c("Travel where? Name a room you've explored.\r\n", RED)),
+                        self._make_prompt()]
+        if self._routes is None or self._routes.world_id != p.world_id:
+            self._routes = RouteIndex(p.world_id)
+        self._routes.sync(p.visited_rooms or [], p.room_id)
+        matches = self._routes.find(arg)
+        names = sorted({self._routes.names[rid] for rid in matches})
+        if not matches:
+            return [], [_output(_c(f"You don't know anywhere called '{arg}'.\r\n", RED)),
+                        self._make_prompt()]
+        if len(names) > 1:
+            return [], [_output(_c("Which one? " + ", ".join(names) + "\r\n", YELLOW)),
+                        self._make_prompt()]
+        if p.room_id in matches:
+            return [], [_output(f"You're already in {names[0]}.\r\n"), self._make_prompt()]
+        # Several explored rooms can share a name; head for the nearest.
+        routes = [r for r in (self._routes.route(p.room_id, rid) for rid in matches)
+                  if r is not None]
+        if not routes:
+            return [], [_output(_c(f"You don't know a way to {names[0]} from here.\r\n", RED)),
+                        self._make_prompt()]
+        route = min(routes, key=len)
+        steps = f"{len(route)} step" + ("s" if len(route) != 1 else "")
+        return route, [_output(_c(f"You set off for {names[0]} ({steps}).\r\n", DIM))]
+
+    def travel_hazards(self) -> dict[str, str]:
+        """Room id -> a living mob in it, from one read of the mob
+        registry. Taken once per stretch of a trip, not once per step."""
+        hazards: dict[str, str] = {}
+        for mob in world_store.load_mobs(self.player.world_id).values():
+            if mob.alive:
+                hazards.setdefault(mob.current_room, mob.name)
+        return hazards
+
+    def travel_halt(self, hazards: dict[str, str]) -> list:
+        """What stops a trip in the room just reached: [] to keep going."""
+        name = hazards.get(self.player.room_id)
+        if name is None:
+            return []
+        return [_output(_c(f"You stop — {name} blocks the way.\r\n", YELLOW))]
+
+    def _cmd_travel(self, arg: str) -> list:
+        route, msgs = self.plan_travel(arg)
+        if not route:
+            return msgs
+        hazards = self.travel_hazards()
+        for i, direction in enumerate(route):
+            before = self.player.room_id
+            msgs.extend(self._cmd_move(direction, brief=True))
+            if self.player.room_id == before:
+                return msgs                 # blocked; that carries a prompt
+            if i < len(route) - 1 and (halt := self.travel_halt(hazards)):
+                msgs.extend(halt)
+                break
+        return msgs + self.describe_here()
+
+    def _cmd_map(self, arg: str) -> list:
+        from nachomud.world.map import render_explored_text, render_map
         self._advance("look")
-        text = render_explored_text(
-            self.player.world_id,
-            list(self.player.visited_rooms or []),
-            current_room_id=self.player.room_id or "",
-        )
+        p = self.player
+        grid = arg.strip().lower() != "list" and self._load_room().coords is not None
+        # visited_rooms is append-only, so its length versions it.
+        key = (world_store.graph_version(p.world_id), len(p.visited_rooms or []),
+               p.room_id or "", grid)
+        if self._map_memo is None or self._map_memo[0] != key:
+            visited = list(p.visited_rooms or [])
+            if grid:
+                text = (render_map(p.world_id, p.room_id, visited)
+                        + "\n\n(`map list` shows every room you've explored)")
+            else:
+                text = render_explored_text(p.world_id, visited,
+                                            current_room_id=p.room_id or "")
+            self._map_memo = (key, text)
+        text = self._map_memo[1]
         return [_output(text + "\r\n"), self._make_prompt()]
 
     def _cmd_inventory(self, arg: str) -> list:
@@ -534,6 +658,8 @@ class Game:
             "  exits                     — list available exits",
             "  inventory (i)             — show carried gear",
             "  stats                     — show full character sheet",
+            "  map [list]                — grid around you (or every room you've explored)",
+            "  travel <room>             — walk to a room you've explored (also: goto)",
             "  who                       — your name and class",
             "  get <item>                — pick up an item from the room",
             "  drop <item>               — drop an item from your inventory",
@@ -553,11 +679,11 @@ class Game:
         return [_output("\r\n".join(lines) + "\r\n"), self._make_prompt()]
 
     def _cmd_save(self, arg: str) -> list:
-        self._persist()
+        self._persist(force=True)
         return [_output(_c("Saved.\r\n", GREEN)), self._make_prompt()]
 
     def _cmd_quit(self, arg: str) -> list:
-        self._persist()
+        self._persist(force=True)
         return [_output(_c("Goodbye.\r\n", YELLOW)), ("close", "")]
 
     def _cmd_get(self, arg: str) -> list:
@@ -833,12 +959,13 @@ class Game:
     def _maybe_finish_combat(self, msgs: list) -> list:
         if self._encounter is None or self._encounter.is_active():
             return msgs
-        # Combat ended: persist player and clean up
-        self._encounter.outcome()
+        # Combat ended: persist player and clean up. A death (respawn,
+        # XP penalty) is saved at once rather than debounced.
+        defeated = self._encounter.outcome() == "defeat"
         self._encounter = None
         # Re-emit the explore prompt
         self._room = None  # invalidate (player may have fled)
-        self._persist()
+        self._persist(force=defeated)
         msgs.append(self._make_prompt())
         return msgs
 
@@ -251,17 +251,25 @@ class Session:
             return msgs
 
         if self.handler_kind == "in_game":
-            assert self.game is not None
             # World-loop path: route through the loop's serialization lock
             # so commands serialize against agent ticks and other actors.
             # Loop also broadcasts msgs to subscribers, so we return [].
             if self.world_loop is not None and self.actor_id:
                 self.world_loop.submit_command(self.actor_id, text)
                 return []
+            assert self.game is not None
             return self.game.handle(text)
 
         return [_output(_c(f"Internal error: unknown handler {self.handler_kind}\r\n", RED))]
 
+    def handle_moves(self, texts: list[str]) -> list:
+        """Several movement commands typed ahead. On a world loop they run
+        as one walk (WorldLoop.submit_moves); otherwise one by one."""
+        if self.handler_kind == "in_game" and self.world_loop is not None and self.actor_id:
+            self.world_loop.submit_moves(self.actor_id, texts)
+            return []
+        return [m for text in texts for m in self.handle(text)]
+
     # ── Transitions ──
 
     def _enter_char_create(self) -> list:
@@ -289,7 +297,8 @@ class Session:
                    f"You find yourself back at {self.spawn_room}.)\r\n", YELLOW)
             ))
         player_mod.save_player(agent)
-        # World-loop path: register with the WorldLoop, share its Game.
+        # World-loop path: register with the WorldLoop, share its Game
+        # (None when the world runs in another process).
         if self.world_loop is not None:
             actor = self.world_loop.register_human(agent)
             self.actor_id = actor.actor_id
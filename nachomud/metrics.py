@@ -0,0 +1,252 @@
+"""In-process metrics, rendered in the Prometheus text format at /metrics.
+
+Counters, gauges and histograms with fixed label names, kept in plain
+dicts behind one lock per metric: recording is a dict lookup and a few
+additions, cheap enough to leave on in production. No client library
+and no push gateway — anything that scrapes Prometheus text can read
+`render()`.
+
+The hot-path metrics are defined here so every module records into the
+same names:
+
+    COMMAND_SECONDS.observe(elapsed, "look")
+    with LOCK_WAIT_SECONDS.time("zone"): ...
+"""
+from __future__ import annotations
+
+import bisect
+import contextlib
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+
+
+# Seconds. Spans a cached fast-path command (~1ms) to a slow CPU-only
+# LLM reply (minutes).
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+# Lock waits and file writes are mostly far below a millisecond.
+FAST_BUCKETS: tuple[float, ...] = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, values: Sequence[str]) -> tuple[str, ...]:
+        if len(values) != len(self.label_names):
+            raise ValueError(f"{self.name} takes labels {self.label_names}, got {values!r}")
+        return tuple(str(v) for v in values)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}",
+                *self._samples()]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[i] += 1
+            series[-1] += value
+
+    @contextlib.contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def count(self, *labels: str) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return int(sum(series[:-1])) if series else 0
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        out: list[str] = []
+        for key, series in items:
+            cumulative = 0.0
+            for bound, n in zip((*self.buckets, math.inf), series[:-1], strict=True):
+                cumulative += n
+                le = f'le="{_fmt(bound)}"'
+                out.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} "
+                           f"{_fmt(cumulative)}")
+            out.append(f"{self.name}_sum{_labels(self.label_names, key)} {_fmt(series[-1])}")
+            out.append(f"{self.name}_count{_labels(self.label_names, key)} {_fmt(cumulative)}")
+        return out
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labels))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labels))  # type: ignore[return-value]
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labels, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(line for m in metrics for line in m.render()) + "\n"
+
+
+REGISTRY = Registry()
+
+# Prometheus' text exposition content type.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+# ── Hot-path metrics ──
+
+COMMAND_SECONDS = REGISTRY.histogram(
+    "nachomud_command_seconds", "WorldLoop.submit_command latency by command verb.",
+    ("verb",))
+LOCK_WAIT_SECONDS = REGISTRY.histogram(
+    "nachomud_lock_wait_seconds", "Time spent waiting for WorldLoop zone locks.",
+    ("scope",), FAST_BUCKETS)
+LOCK_HOLD_SECONDS = REGISTRY.histogram(
+    "nachomud_lock_hold_seconds", "Time WorldLoop zone locks were held.",
+    ("scope",))
+TICK_SECONDS = REGISTRY.histogram(
+    "nachomud_tick_seconds", "Duration of one global mob tick.", ("world",))
+MOBS_TICKED = REGISTRY.counter(
+    "nachomud_mobs_ticked_total", "Mobs advanced by the global tick.", ("world",))
+LLM_SECONDS = REGISTRY.histogram(
+    "nachomud_llm_request_seconds", "Latency of LLM calls that got an answer.",
+    ("host", "model", "site"))
+LLM_TOKENS = REGISTRY.counter(
+    "nachomud_llm_tokens_total", "Tokens reported by the LLM host.",
+    ("host", "model", "site", "kind"))
+LLM_FAILURES = REGISTRY.counter(
+    "nachomud_llm_failures_total", "LLM calls that failed or were refused.",
+    ("host", "model", "site"))
+LLM_CACHE_LOOKUPS = REGISTRY.counter(
+    "nachomud_llm_cache_lookups_total", "LLM response cache lookups by result (hit, miss).",
+    ("cache", "result"))
+LLM_CACHE_EVICTIONS = REGISTRY.counter(
+    "nachomud_llm_cache_evictions_total",
+    "LLM response cache entries dropped, by reason (lru, expired).", ("cache", "reason"))
+LLM_CACHE_ENTRIES = REGISTRY.gauge(
+    "nachomud_llm_cache_entries", "Entries held by LLM response caches.", ("cache",))
+SUBSCRIBERS = REGISTRY.gauge(
+    "nachomud_subscribers", "Connected viewers.")
+SUBSCRIBER_QUEUE_DEPTH = REGISTRY.gauge(
+    "nachomud_subscriber_queue_depth", "Undelivered messages across viewer queues.",
+    ("stat",))
+WORLD_ACTORS = REGISTRY.gauge(
+    "nachomud_world_actors", "Actors in each running world.", ("world",))
+AGENT_INTERVAL_SECONDS = REGISTRY.gauge(
+    "nachomud_agent_interval_seconds", "Sleep the agent scheduler gives each agent tick.",
+    ("world",))
+AGENT_TICKS_PER_MINUTE = REGISTRY.gauge(
+    "nachomud_agent_ticks_per_minute",
+    "Agent ticks per minute: measured over the last minute, or what the interval targets.",
+    ("world", "kind"))
+AGENT_PAUSED = REGISTRY.gauge(
+    "nachomud_agents_paused", "Agents paused because nobody is watching them.", ("world",))
+TRANSCRIPT_WRITE_SECONDS = REGISTRY.histogram(
+    "nachomud_transcript_write_seconds", "Time to append one transcript line.",
+    (), FAST_BUCKETS)
+SAVE_WRITE_SECONDS = REGISTRY.histogram(
+    "nachomud_save_write_seconds", "Time to write one player save to disk.",
+    (), FAST_BUCKETS)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 
@@ -131,6 +132,8 @@ class Room:
     # Player-mode additions
     zone_tag: str = ""
     flags: dict[str, bool] = field(default_factory=dict)
+    # Grid position (x, y, z) for the map; None if it couldn't be placed.
+    coords: tuple[int, int, int] | None = None
 
 
 @dataclass
@@ -177,7 +180,8 @@ class AgentState:
     respawn_room: str = ""
     world_id: str = "default"
     game_clock: dict = field(default_factory=lambda: {"day": 1, "minute": 480})  # day 1, 8am
-    dm_context: dict = field(default_factory=lambda: {"recent_exchanges": [], "summary": "", "pending_hints": []})
+    # Backing store for the `dm_context` property below.
+    _dm_context: dict = field(default_factory=lambda: {"recent_exchanges": [], "summary": "", "pending_hints": []}, repr=False)
     gold: int = 0
 
     # Per-character Ollama URL the DM tier hits for this player. Set
@@ -187,6 +191,22 @@ class AgentState:
     # surface "the world feels still" until the player sets a URL.
     dm_ollama_url: str = ""
 
+    # Set by the save loader when dm_context was left in its sidecar file;
+    # the first read of `dm_context` (the DM or an NPC speaking) pulls it in.
+    dm_context_loader: Callable[[], dict] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def dm_context(self) -> dict:
+        if self.dm_context_loader is not None:
+            self._dm_context = self.dm_context_loader()
+            self.dm_context_loader = None
+        return self._dm_context
+
+    @dm_context.setter
+    def dm_context(self, value: dict) -> None:
+        self._dm_context = value
+        self.dm_context_loader = None
+
 
 @dataclass
 class GameEvent:
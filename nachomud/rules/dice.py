@@ -1,15 +1,20 @@
 """Dice rolling utilities for D&D 5e-style mechanics.
 
-Supports standard dice notation (`"1d20+5"`, `"2d6"`, `"1d8-1"`).
+Supports standard dice notation (`"1d20+5"`, `"2d6"`, `"1d8-1"`) and
+composites (`"1d8+2d6+3"`). Notation is compiled once into a cached
+`DiceExpr`; hot paths can hold on to the expression and skip parsing.
 A configurable RNG seed is exposed for deterministic tests.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import random
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-_NOTATION = re.compile(r"^\s*(\d+)?\s*d\s*(\d+)\s*([+-]\s*\d+)?\s*$", re.IGNORECASE)
+_TERM = re.compile(r"([+-])?\s*(?:(\d*)\s*d\s*(\d+)|(\d+))\s*", re.IGNORECASE)
 _rng = random.Random()
 
 
@@ -19,6 +24,43 @@ def seed(value: int | None) -> None:
     _rng = random.Random(value)
 
 
+# Faces drawn per refill of a pooled RNG's per-die buffer.
+POOL_SIZE = 4096
+
+
+class _DicePool(random.Random):
+    """An RNG whose single-die rolls (`randint(1, sides)`, which is every
+    die the combat code throws) come from buffers filled `POOL_SIZE` at a
+    time by `roll_many`. Same distribution, fewer Python-level calls;
+    a different stream than an unpooled RNG with the same seed."""
+
+    def __init__(self, value: int | None = None) -> None:
+        super().__init__(value)
+        self._pools: dict[int, list[int]] = {}
+
+    def randint(self, a: int, b: int) -> int:
+        if a != 1:
+            return super().randint(a, b)
+        pool = self._pools.get(b)
+        if not pool:
+            pool = self._pools[b] = roll_many(compile_dice(f"1d{b}"), POOL_SIZE)
+        return pool.pop()
+
+
+@contextlib.contextmanager
+def seeded(value: int | None, *, pooled: bool = False) -> Iterator[None]:
+    """Temporarily seed the dice RNG, restoring the previous one on exit —
+    for offline runs (combat.sim) that shouldn't disturb live rolls.
+    `pooled` draws dice in bulk through `roll_many` (see `_DicePool`)."""
+    global _rng
+    prev = _rng
+    _rng = _DicePool(value) if pooled else random.Random(value)
+    try:
+        yield
+    finally:
+        _rng = prev
+
+
 @dataclass
 class Roll:
     notation: str
@@ -33,24 +75,78 @@ class Roll:
         return f"Roll({self.notation}: {self.rolls} + {self.modifier} = {self.total})"
 
 
+@dataclass(frozen=True)
+class DiceExpr:
+    """Compiled notation: a sum of `count`d`sides` terms plus a flat
+    modifier. Get one from `compile_dice`, not the constructor."""
+    notation: str
+    terms: tuple[tuple[int, int], ...]
+    modifier: int = 0
+
+    def roll_detail(self) -> Roll:
+        rolls = [_rng.randint(1, sides) for count, sides in self.terms for _ in range(count)]
+        return Roll(notation=self.notation, rolls=rolls, modifier=self.modifier)
+
+    def roll(self) -> int:
+        return self.roll_detail().total
+
+    def roll_doubled(self) -> int:
+        """Crit damage: every die twice, modifier once (5e)."""
+        return sum(_rng.randint(1, sides) for count, sides in self.terms
+                   for _ in range(2 * count)) + self.modifier
+
+
+@functools.lru_cache(maxsize=512)
+def compile_dice(notation: str) -> DiceExpr:
+    """Parse notation once. Raises ValueError on anything malformed,
+    including zero-count or zero-sided dice."""
+    text = notation.strip()
+    terms: list[tuple[int, int]] = []
+    modifier = 0
+    pos = 0
+    while pos < len(text):
+        m = _TERM.match(text, pos)
+        if not m or m.end() == pos or (pos and not m.group(1)):
+            raise ValueError(f"Invalid dice notation: {notation!r}")
+        sign = -1 if m.group(1) == "-" else 1
+        if m.group(4) is not None:
+            modifier += sign * int(m.group(4))
+        else:
+            count, sides = int(m.group(2) or "1"), int(m.group(3))
+            if count <= 0 or sides <= 0:
+                raise ValueError(f"Dice count and sides must be positive: {notation!r}")
+            if sign < 0:
+                raise ValueError(f"Subtracted dice are not supported: {notation!r}")
+            terms.append((count, sides))
+        pos = m.end()
+    if not terms:
+        raise ValueError(f"Invalid dice notation: {notation!r}")
+    return DiceExpr(notation=notation, terms=tuple(terms), modifier=modifier)
+
+
 def roll(notation: str) -> int:
     """Roll dice from notation, return total. `1d20+5`, `2d6`, `1d8-1`."""
-    return roll_detail(notation).total
+    return compile_dice(notation).roll()
 
 
 def roll_detail(notation: str) -> Roll:
     """Roll dice and return per-die values plus modifier."""
-    m = _NOTATION.match(notation)
-    if not m:
-        raise ValueError(f"Invalid dice notation: {notation!r}")
-    count = int(m.group(1) or "1")
-    sides = int(m.group(2))
-    mod_str = (m.group(3) or "").replace(" ", "")
-    modifier = int(mod_str) if mod_str else 0
-    if count <= 0 or sides <= 0:
-        raise ValueError(f"Dice count and sides must be positive: {notation!r}")
-    rolls = [_rng.randint(1, sides) for _ in range(count)]
-    return Roll(notation=notation, rolls=rolls, modifier=modifier)
+    return compile_dice(notation).roll_detail()
+
+
+def roll_many(expr: DiceExpr | str, n: int) -> list[int]:
+    """`n` independent totals of `expr`. Draws every die of a term in one
+    `choices` call on the module RNG — far cheaper than n x count
+    randint calls — so it stays seedable but yields a different stream
+    than calling `roll` n times."""
+    if isinstance(expr, str):
+        expr = compile_dice(expr)
+    totals = [expr.modifier] * n
+    for count, sides in expr.terms:
+        faces = _rng.choices(range(1, sides + 1), k=n * count)
+        for i in range(n):
+            totals[i] += sum(faces[i * count:(i + 1) * count])
+    return totals
 
 
 def roll_d20() -> int:
@@ -79,11 +175,4 @@ def random_choice(items):
 
 def roll_dice_doubled(notation: str) -> int:
     """Roll dice with doubled count (for crits). Modifier is NOT doubled — 5e rule."""
-    m = _NOTATION.match(notation)
-    if not m:
-        raise ValueError(f"Invalid dice notation: {notation!r}")
-    count = int(m.group(1) or "1") * 2
-    sides = int(m.group(2))
-    mod_str = (m.group(3) or "").replace(" ", "")
-    modifier = int(mod_str) if mod_str else 0
-    return sum(_rng.randint(1, sides) for _ in range(count)) + modifier
+    return compile_dice(notation).roll_doubled()
@@ -23,6 +23,7 @@ Message protocol:
 from __future__ import annotations
 
 import asyncio
+import hmac
 import json
 import logging
 import os
@@ -36,10 +37,14 @@ from fastapi.staticfiles import StaticFiles
 
 import nachomud.auth.accounts as accounts_mod
 import nachomud.auth.magic_link as auth
+import nachomud.world.lockprof as lockprof
 from nachomud.engine.session import Session
+from nachomud.settings import ADMIN_TOKEN, SESSION_QUEUE_MAX, WORLD_SOCKET
 from nachomud.style import RED, YELLOW, _c
 from nachomud.world.directions import is_direction
-from nachomud.world.loop import WorldLoop, set_world_loop
+from nachomud.world.ipc import RemoteWorldLoop, WorldUnavailable
+from nachomud.world.loop import set_world_loop
+from nachomud.world.registry import WorldRegistry
 
 
 log = logging.getLogger("nachomud.server")
@@ -48,20 +53,39 @@ logging.basicConfig(level=logging.INFO)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Boot the shared WorldLoop on startup, tear it down on shutdown.
+    """Boot the world registry (home world first) on startup, tear it
+    down on shutdown. The home world warms up in the background: the
+    app serves as soon as the registry is created, and /ready turns
+    200 once the world is up.
 
     NACHOMUD_DISABLE_AGENTS=1 (set by tests) skips spawning the 4
     LLM-driven agent runners — they'd otherwise hang waiting on Ollama
-    when the box isn't running it locally."""
+    when the box isn't running it locally.
+
+    With NACHOMUD_WORLD_SOCKET set the world runs in its own process
+    (nachomud.world.ipc) and this worker only connects to it."""
+    if WORLD_SOCKET:
+        loop = RemoteWorldLoop(WORLD_SOCKET)
+        await loop.start()
+        app.state.world_loop = loop
+        try:
+            yield
+        finally:
+            app.state.world_loop = None
+            await loop.stop()
+        return
     enable_agents = not bool(os.environ.get("NACHOMUD_DISABLE_AGENTS", ""))
-    loop = WorldLoop(enable_agent_runner=enable_agents)
-    await loop.start()
-    set_world_loop(loop)
-    app.state.world_loop = loop
+    registry = WorldRegistry(enable_agent_runner=enable_agents)
+    await registry.start()
+    set_world_loop(registry.home)
+    app.state.world_loop = registry
+    lockprof.install_dump_signal(asyncio.get_running_loop())
     try:
         yield
     finally:
-        await loop.stop()
+        lockprof.remove_dump_signal(asyncio.get_running_loop())
+        app.state.world_loop = None
+        await registry.stop()
 
 
 # OpenAPI / Swagger / ReDoc are auto-exposed by FastAPI by default. In
@@ -138,7 +162,7 @@ def _pick_thinking(text: str, session: Session | None) -> str | None:
     if cmd in ("look", "l", "exits", "inventory", "inv", "i", "stats", "who",
                "help", "save", "quit", "exit", "get", "take", "drop", "wait",
                "sleep", "rest", "attack", "flee", "run", "escape", "status",
-               "buy", "wares", "shop"):
+               "buy", "wares", "shop", "travel", "goto"):
         return None
     return random.choice(_ADJUDICATE_VERBS) + "…"
 
@@ -195,6 +219,17 @@ async def _forwarder(ws: WebSocket, queue: asyncio.Queue) -> None:
 
 # ── WS session ──
 
+def _leading_moves(texts: list[str]) -> int:
+    """How many of `texts`, from the front, are plain moves ("n", "go east")."""
+    n = 0
+    for text in texts:
+        cmd, _, arg = text.strip().lower().partition(" ")
+        if not ((is_direction(cmd) and not arg) or (cmd == "go" and is_direction(arg.strip()))):
+            break
+        n += 1
+    return n
+
+
 async def _next_command(ws: WebSocket) -> str | None:
     try:
         return await ws.receive_text()
@@ -203,17 +238,20 @@ async def _next_command(ws: WebSocket) -> str | None:
 
 
 async def game_session(ws: WebSocket) -> None:
-    world_loop: WorldLoop | None = getattr(ws.app.state, "world_loop", None)
+    world_loop: WorldRegistry | RemoteWorldLoop | None = getattr(ws.app.state, "world_loop", None)
     pid, account_email = _resolve_player_id(ws)
     # Anon viewers (no cookie) → no Session, spectator only.
     session = Session(world_loop=world_loop, anon_player_id=pid) if account_email else None
 
+    # World calls go through to_thread: with a separate world process each
+    # one is a socket round trip, and the event loop serves every socket.
     queue: asyncio.Queue = asyncio.Queue()
-    sub = world_loop.add_subscriber(queue) if world_loop is not None else None
+    sub = (await asyncio.to_thread(world_loop.add_subscriber, queue)
+           if world_loop is not None else None)
     forwarder = asyncio.create_task(_forwarder(ws, queue))
 
     if world_loop is not None:
-        await queue.put(("event", world_loop.actor_list_event()))
+        await queue.put(("event", await asyncio.to_thread(world_loop.actor_list_event)))
 
     async def push_self(item) -> None:
         await queue.put(("self", item))
@@ -224,6 +262,64 @@ async def game_session(ws: WebSocket) -> None:
         for m in session.start():
             await push_self(m)
 
+    async def run(texts: list[str]) -> None:
+        """One command, or a walk of typed-ahead moves, through the session."""
+        verb = _pick_thinking(texts[0], session)
+        if verb:
+            await queue.put(("event",
+                             {"type": "thinking", "text": verb,
+                              "actor_id": session.actor_id or ""}))
+        try:
+            if len(texts) == 1:
+                msgs = await asyncio.to_thread(session.handle, texts[0])
+            else:
+                msgs = await asyncio.to_thread(session.handle_moves, texts)
+        except Exception:
+            log.exception("session.handle raised")
+            await _send(ws, {"type": "output",
+                              "text": _c("\r\n[server error — see logs]\r\n", RED),
+                              "ansi": True})
+            if verb:
+                await queue.put(("event", {"type": "thinking", "text": ""}))
+            return
+        if verb:
+            await queue.put(("event", {"type": "thinking", "text": "",
+                                        "actor_id": session.actor_id or ""}))
+
+        # In-game with world_loop: msgs already broadcast by submit_command.
+        # Pre-actor: push to self queue.
+        if (world_loop is None
+                or session.handler_kind != "in_game"
+                or not session.actor_id):
+            for m in msgs:
+                await push_self(m)
+
+        # First time entering in_game: auto-subscribe + tell client which
+        # actor is "you" so the sidebar labels its My-Player slot.
+        if (world_loop is not None and sub is not None
+                and session.actor_id and not sub.actor_id):
+            await asyncio.to_thread(world_loop.set_subscription, sub, session.actor_id)
+            await queue.put(("event",
+                             {"type": "you", "actor_id": session.actor_id}))
+
+    # Commands typed while one is still running wait here; the worker
+    # drains whatever has piled up and walks a run of moves in one go.
+    pending: asyncio.Queue = asyncio.Queue(maxsize=SESSION_QUEUE_MAX)
+    closing = False
+
+    async def work() -> None:
+        while (text := await pending.get()) is not None:
+            batch = [text]
+            while not pending.empty():
+                batch.append(pending.get_nowait())
+            while batch and not closing:
+                walking = world_loop is not None and session.handler_kind == "in_game"
+                n = _leading_moves(batch) if walking else 0
+                await run(batch[:max(n, 1)])
+                batch = batch[max(n, 1):]
+
+    worker = asyncio.create_task(work()) if session is not None else None
+
     try:
         while True:
             raw = await _next_command(ws)
@@ -244,7 +340,7 @@ async def game_session(ws: WebSocket) -> None:
                 actor_id = (msg.get("actor_id") or "").strip()
                 if world_loop is None or sub is None:
                     continue
-                ok = world_loop.set_subscription(sub, actor_id)
+                ok = await asyncio.to_thread(world_loop.set_subscription, sub, actor_id)
                 if not ok:
                     await _send(ws, {"type": "output",
                                       "text": _c(f"[unknown actor: {actor_id}]\r\n", YELLOW),
@@ -276,48 +372,29 @@ async def game_session(ws: WebSocket) -> None:
                                   "actor_id": sub.actor_id})
                 continue
 
-            verb = _pick_thinking(text, session)
-            if verb:
-                await queue.put(("event",
-                                 {"type": "thinking", "text": verb,
-                                  "actor_id": session.actor_id or ""}))
             try:
-                msgs = await asyncio.to_thread(session.handle, text)
-            except Exception:
-                log.exception("session.handle raised")
+                pending.put_nowait(text)
+            except asyncio.QueueFull:
                 await _send(ws, {"type": "output",
-                                  "text": _c("\r\n[server error — see logs]\r\n", RED),
+                                  "text": _c(f"(Slow down — '{text}' was dropped; "
+                                             f"{SESSION_QUEUE_MAX} commands are "
+                                             "already waiting.)\r\n", YELLOW),
                                   "ansi": True})
-                if verb:
-                    await queue.put(("event", {"type": "thinking", "text": ""}))
-                continue
-            if verb:
-                await queue.put(("event", {"type": "thinking", "text": "",
-                                            "actor_id": session.actor_id or ""}))
-
-            # In-game with world_loop: msgs already broadcast by submit_command.
-            # Pre-actor: push to self queue.
-            if (world_loop is None
-                    or session.handler_kind != "in_game"
-                    or not session.actor_id):
-                for m in msgs:
-                    await push_self(m)
-
-            # First time entering in_game: auto-subscribe + tell client which
-            # actor is "you" so the sidebar labels its My-Player slot.
-            if (world_loop is not None and sub is not None
-                    and session.actor_id and not sub.actor_id):
-                world_loop.set_subscription(sub, session.actor_id)
-                await queue.put(("event",
-                                 {"type": "you", "actor_id": session.actor_id}))
     finally:
+        if worker is not None:
+            closing = True
+            while not pending.empty():
+                pending.get_nowait()
+            pending.put_nowait(None)
+            with suppress(Exception):
+                await worker
         forwarder.cancel()
         with suppress(asyncio.CancelledError, Exception):
             await forwarder
         if world_loop is not None and sub is not None:
-            world_loop.remove_subscriber(sub)
+            await asyncio.to_thread(world_loop.remove_subscriber, sub)
         if world_loop is not None and session is not None and session.actor_id:
-            world_loop.unregister_human(session.actor_id)
+            await asyncio.to_thread(world_loop.unregister_human, session.actor_id)
 
 
 @app.websocket("/ws")
@@ -334,24 +411,69 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready() -> Response:
+    """Readiness for load balancers and rolling deploys: 503 until the
+    home world has finished warming up. /health only says the process
+    is up — it answers, and /ws accepts viewers, during warmup too."""
+    loop: WorldRegistry | RemoteWorldLoop | None = getattr(app.state, "world_loop", None)
+    try:
+        ok = loop is not None and loop.ready
+    except WorldUnavailable:
+        ok = False
+    return JSONResponse({"ready": ok}, status_code=200 if ok else 503)
+
+
 @app.get("/map")
-def world_map() -> JSONResponse:
-    """Public global map view: union of every actor's explored rooms,
-    rendered as a text list with exits. The sidebar Map button calls
+def world_map(request: Request, world: str = "") -> Response:
+    """Public global map view: union of every actor's explored rooms in
+    one world (`?world=<id>`, the home world by default), rendered as a
+    text list with exits. The sidebar Map button calls
     this so anonymous spectators get a useful view too. Per-actor map
-    (with fog-of-war) is the in-terminal `map` command."""
-    from nachomud.world.map import render_explored_text
-    loop: WorldLoop | None = getattr(app.state, "world_loop", None)
+    (with fog-of-war) is the in-terminal `map` command. Rendering is
+    cached until a room is visited or created; a matching If-None-Match
+    gets a bodiless 304. A world that isn't running is a 404."""
+    from nachomud.world.map import explored_map
+    loop: WorldRegistry | RemoteWorldLoop | None = getattr(app.state, "world_loop", None)
     if loop is None:
         return JSONResponse({"map": "(world not initialized)"})
-    visited: set[str] = set()
-    world_id = "default"
-    for actor in loop.actors.values():
-        visited.update(actor.state.visited_rooms or [])
-        if actor.state.world_id:
-            world_id = actor.state.world_id
-    text = render_explored_text(world_id, sorted(visited))
-    return JSONResponse({"map": text})
+    explored = loop.explored_rooms(world or None)
+    if explored is None:
+        return JSONResponse({"error": "no such world"}, status_code=404)
+    world_id, visited = explored
+    rendered = explored_map(world_id, visited)
+    headers = {"ETag": rendered.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse({"map": rendered.text}, headers=headers)
+
+
+@app.get("/metrics")
+def metrics_endpoint() -> Response:
+    """Prometheus text exposition of the world's hot-path metrics."""
+    import nachomud.metrics as metrics
+    loop: WorldRegistry | RemoteWorldLoop | None = getattr(app.state, "world_loop", None)
+    text = loop.metrics_text() if loop is not None else metrics.render()
+    return Response(text, media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/admin/locks")
+def admin_locks(request: Request) -> Response:
+    """Lock profiler view: zone locks held right now (who, which
+    command, for how long) and the slowest critical sections, with
+    sampled stacks for the slow ones. Needs NACHOMUD_ADMIN_TOKEN as a
+    bearer token; without one configured the route doesn't exist."""
+    given = request.headers.get("authorization", "").encode()
+    if not ADMIN_TOKEN or not hmac.compare_digest(given, f"Bearer {ADMIN_TOKEN}".encode()):
+        return Response(status_code=404, content="Not found")
+    loop: WorldRegistry | RemoteWorldLoop | None = getattr(app.state, "world_loop", None)
+    report = loop.lock_report() if loop is not None else lockprof.PROFILER.snapshot()
+    return JSONResponse(report, headers={"Cache-Control": "no-store"})
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return etag in tags or "*" in tags
 
 
 # ── Auth routes ──
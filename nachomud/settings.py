@@ -26,6 +26,43 @@ LLM_SMART_MODEL = os.environ.get("LLM_SMART_MODEL", "llama3.1:8b-instruct-q4_K_M
 LLM_FAST_MODEL = os.environ.get("LLM_FAST_MODEL", "llama3.2:3b")
 LLM_SUMMARY_MODEL = os.environ.get("LLM_SUMMARY_MODEL", "llama3.2:3b")
 
+# Response cache for repeatable LLM calls (agent decisions, "look at"
+# narration, canned NPC questions). Entries older than the TTL are
+# regenerated; past MAX_ENTRIES the least-recently-used entry goes.
+LLM_CACHE_TTL_SECONDS = float(os.environ.get("NACHOMUD_LLM_CACHE_TTL_SECONDS", "600"))
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("NACHOMUD_LLM_CACHE_MAX_ENTRIES", "512"))
+
+
+# Player saves are coalesced to at most one write per actor per this many
+# seconds (quit, death, level-up and shutdown still flush immediately).
+# A crash can lose up to this much progress.
+PLAYER_SAVE_DEBOUNCE_SECONDS = float(
+    os.environ.get("NACHOMUD_PLAYER_SAVE_DEBOUNCE_SECONDS", "30")
+)
+
+
+# Unix socket of a dedicated world process (`python -m nachomud.world.ipc`).
+# When set, the web app connects to it instead of running the WorldLoop
+# in-process, so uvicorn can run with several workers. Empty = in-process.
+WORLD_SOCKET = os.environ.get("NACHOMUD_WORLD_SOCKET", "")
+
+# Lock profiler (nachomud.world.lockprof): zone-lock holds longer than
+# LOCK_SLOW_SECONDS are logged with a sampled stack (0 = off); the
+# LOCK_PROFILE_SLOWEST slowest critical sections are kept for the report.
+LOCK_SLOW_SECONDS = float(os.environ.get("NACHOMUD_LOCK_SLOW_SECONDS", "1.0"))
+LOCK_PROFILE_SLOWEST = int(os.environ.get("NACHOMUD_LOCK_PROFILE_SLOWEST", "50"))
+
+# Bearer token for the /admin/* endpoints. Unset = those routes 404.
+ADMIN_TOKEN = os.environ.get("NACHOMUD_ADMIN_TOKEN", "")
+
+# Worlds other than the home world stop their WorldLoop after sitting
+# empty this long, and boot again when someone enters.
+WORLD_HIBERNATE_SECONDS = float(os.environ.get("NACHOMUD_WORLD_HIBERNATE_SECONDS", "300"))
+
+# Commands a connection may have typed ahead of the one running. Past
+# this, new input is refused with a "slow down" line until it catches up.
+SESSION_QUEUE_MAX = int(os.environ.get("NACHOMUD_SESSION_QUEUE_MAX", "16"))
+
 
 # ── Game tunables ──
 QUEST_DESCRIPTION = "Explore Silverbrook and the wild beyond. Talk to NPCs for lore, gear up, and forge your own story."
@@ -48,6 +85,17 @@ STARTING_GOLD = 25
 # is fine.
 AGENT_TICK_SECONDS = float(os.environ.get("NACHOMUD_AGENT_TICK_SECONDS", "8"))
 
+# Bounds for the adaptive agent scheduler (nachomud.ai.scheduler). The
+# effective per-agent interval starts at AGENT_TICK_SECONDS and is
+# stretched/shrunk by observed LLM latency, queue depth and human
+# traffic, but never leaves [MIN, MAX].
+AGENT_TICK_MIN_SECONDS = float(os.environ.get("NACHOMUD_AGENT_TICK_MIN_SECONDS", "2"))
+AGENT_TICK_MAX_SECONDS = float(os.environ.get("NACHOMUD_AGENT_TICK_MAX_SECONDS", "120"))
+
+# Pause agents no spectator is watching. Set to 0 to keep them playing
+# to an empty room (e.g. to grow the world overnight).
+AGENT_PAUSE_UNWATCHED = os.environ.get("NACHOMUD_AGENT_PAUSE_UNWATCHED", "1") != "0"
+
 # Hard ceiling on how long an agent waits for the LLM before skipping a
 # tick. Without this, a wedged Ollama (memory pressure, model swap,
 # network blip) parks the agent's asyncio task forever.
@@ -63,3 +111,11 @@ AGENT_LLM_TIMEOUT_SECONDS = float(
 OLLAMA_HTTP_TIMEOUT_SECONDS = float(
     os.environ.get("NACHOMUD_OLLAMA_HTTP_TIMEOUT", "90")
 )
+
+# TCP connect budget, separate from the read timeout above. A BYO DM host
+# that's powered off should fail in seconds, not after the full read
+# timeout — and after a few such failures the per-host circuit breaker
+# in nachomud.ai.llm stops trying until a health probe sees it back.
+OLLAMA_CONNECT_TIMEOUT_SECONDS = float(
+    os.environ.get("NACHOMUD_OLLAMA_CONNECT_TIMEOUT", "3")
+)
@@ -30,6 +30,20 @@ OPPOSITES: dict[str, str] = {
 }
 
 
+# Grid step for each direction: x grows east, y grows south, z grows up.
+DELTAS: dict[str, tuple[int, int, int]] = {
+    "north": (0, -1, 0), "south": (0, 1, 0),
+    "east":  (1, 0, 0),  "west":  (-1, 0, 0),
+    "up":    (0, 0, 1),  "down":  (0, 0, -1),
+}
+
+
+def delta(direction: str) -> tuple[int, int, int] | None:
+    """Grid step for `direction` (long or short form), or None."""
+    d = direction.lower()
+    return DELTAS.get(SHORT_TO_LONG.get(d, d))
+
+
 def opposite(direction: str) -> str:
     """Return the opposite of `direction`, or "" if not a direction."""
     return OPPOSITES.get(direction.lower(), "")
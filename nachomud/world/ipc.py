@@ -0,0 +1,484 @@
+"""World process IPC: run the WorldLoop in its own process and let any
+number of web workers drive it over a local Unix socket.
+
+    NACHOMUD_WORLD_SOCKET=/run/nachomud/world.sock python -m nachomud.world.ipc
+    NACHOMUD_WORLD_SOCKET=/run/nachomud/world.sock uvicorn nachomud.server:app --workers 4
+
+The world process stays the single writer — it runs the WorldRegistry
+and every command still goes through its world's zone locks — while
+JSON encoding, WebSocket I/O, auth and static files spread across the
+web workers' cores.
+
+Wire format is newline-delimited JSON. A worker sends requests
+`{"id": n, "op": "...", ...}` and gets `{"id": n, "result": ...}` or
+`{"id": n, "error": "..."}` back, in completion order. Items the
+WorldLoop queues for a remote subscriber arrive unsolicited as
+`{"push": <sub_id>, "item": [...]}`. Tuples travel as JSON arrays and
+are rebuilt on the worker side.
+
+`RemoteWorldLoop` is the worker-side stand-in: the same methods
+server.py and Session call on an in-process WorldLoop, answered by the
+world process. Its calls block the calling thread for one round trip,
+exactly as the in-process versions block on the zone locks, so the web
+server makes them from a worker thread. If the world process restarts,
+the worker reconnects with backoff and re-registers its subscribers;
+calls made while it's disconnected fail at once with WorldUnavailable.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import itertools
+import json
+import logging
+import os
+import signal
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import nachomud.characters.save as player_mod
+import nachomud.world.lockprof as lockprof
+from nachomud.settings import WORLD_SOCKET
+from nachomud.world.loop import Subscriber, set_world_loop
+from nachomud.world.registry import WorldRegistry
+
+
+log = logging.getLogger("nachomud.ipc")
+
+
+# Longest a worker waits for one reply. Commands can sit behind an LLM
+# call inside a zone lock, so this is generous.
+CALL_TIMEOUT_SECONDS = 300.0
+# Subscriber bookkeeping, actor lists, metrics: never behind a zone lock.
+CONTROL_TIMEOUT_SECONDS = 10.0
+CONNECT_RETRY_SECONDS = 0.5
+CONNECT_ATTEMPTS = 20
+# Reconnect backoff after the world process goes away: doubles up to the cap.
+RECONNECT_MAX_SECONDS = 10.0
+# asyncio's default 64 KiB line limit is too small for a transcript-heavy
+# reply (start_actor, actor lists with many humans).
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class WorldUnavailable(RuntimeError):
+    """The world process is gone or refused the call."""
+
+
+def _encode(msg: dict) -> bytes:
+    return (json.dumps(msg, separators=(",", ":")) + "\n").encode()
+
+
+def _msg_from_wire(m: Any) -> Any:
+    return tuple(m) if isinstance(m, list) else m
+
+
+def _item_from_wire(item: list) -> tuple:
+    kind = item[0]
+    if kind == "scoped":
+        return (kind, item[1], _msg_from_wire(item[2]))
+    if kind == "self":
+        return (kind, _msg_from_wire(item[1]))
+    return tuple(item)
+
+
+# ── World side ──
+
+@dataclass
+class _Connection:
+    """One web worker. Its remote subscribers live here so they can be
+    dropped together when the worker goes away."""
+    writer: asyncio.StreamWriter
+    write_lock: asyncio.Lock
+    subs: dict[str, Subscriber]
+    pumps: dict[str, asyncio.Task]
+
+    async def send(self, msg: dict) -> None:
+        async with self.write_lock:
+            self.writer.write(_encode(msg))
+            await self.writer.drain()
+
+
+class WorldServer:
+    """Serves a WorldRegistry on a Unix socket."""
+
+    def __init__(self, loop: WorldRegistry, path: str) -> None:
+        self.loop = loop
+        self.path = path
+        self._server: asyncio.AbstractServer | None = None
+        self._sub_ids = itertools.count(1)
+
+    async def start(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=self.path, limit=STREAM_LIMIT)
+        log.info("world IPC listening on %s", self.path)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        conn = _Connection(writer=writer, write_lock=asyncio.Lock(), subs={}, pumps={})
+        calls: set[asyncio.Task] = set()
+        try:
+            while line := await reader.readline():
+                req = json.loads(line)
+                task = asyncio.create_task(self._answer(conn, req))
+                calls.add(task)
+                task.add_done_callback(calls.discard)
+        except (ConnectionError, ValueError):
+            log.exception("world IPC connection failed")
+        finally:
+            for task in list(calls) + list(conn.pumps.values()):
+                task.cancel()
+            for sub in conn.subs.values():
+                self.loop.remove_subscriber(sub)
+            writer.close()
+
+    async def _answer(self, conn: _Connection, req: dict) -> None:
+        try:
+            reply = {"id": req["id"], "result": await self._dispatch(conn, req)}
+        except Exception as e:
+            log.exception("world IPC op %s failed", req.get("op"))
+            reply = {"id": req.get("id"), "error": f"{type(e).__name__}: {e}"}
+        with contextlib.suppress(ConnectionError):
+            await conn.send(reply)
+
+    async def _dispatch(self, conn: _Connection, req: dict) -> Any:
+        op = req["op"]
+        loop = self.loop
+        if op == "add_subscriber":
+            sid = str(next(self._sub_ids))
+            queue: asyncio.Queue = asyncio.Queue()
+            conn.subs[sid] = loop.add_subscriber(queue)
+            conn.pumps[sid] = asyncio.create_task(self._pump(conn, sid, queue))
+            return sid
+        if op == "remove_subscriber":
+            sub = conn.subs.pop(req["sub"], None)
+            pump = conn.pumps.pop(req["sub"], None)
+            if pump is not None:
+                pump.cancel()
+            if sub is not None:
+                loop.remove_subscriber(sub)
+            return None
+        if op == "set_subscription":
+            return loop.set_subscription(conn.subs[req["sub"]], req["actor_id"])
+        if op == "clear_subscription":
+            # The worker replays its own pre-actor transcript.
+            conn.subs[req["sub"]].actor_id = ""
+            return None
+        if op == "actor_list_event":
+            return loop.actor_list_event()
+        if op == "ready":
+            return loop.ready
+        if op == "metrics":
+            return loop.metrics_text()
+        if op == "lock_report":
+            return loop.lock_report()
+        if op == "explored_rooms":
+            explored = loop.explored_rooms(req.get("world"))
+            return list(explored) if explored is not None else None
+        if op == "register_human":
+            state = await asyncio.to_thread(player_mod.load_player, req["player_id"])
+            actor = await asyncio.to_thread(loop.register_human, state)
+            return actor.actor_id
+        if op == "unregister_human":
+            await asyncio.to_thread(loop.unregister_human, req["actor_id"])
+            return None
+        if op == "start_actor":
+            return await asyncio.to_thread(loop.start_actor, req["actor_id"])
+        if op == "submit_command":
+            return await asyncio.to_thread(loop.submit_command, req["actor_id"],
+                                           req["text"], echo=req.get("echo", False))
+        if op == "submit_moves":
+            return await asyncio.to_thread(loop.submit_moves, req["actor_id"], req["texts"])
+        raise ValueError(f"unknown op {op!r}")
+
+    async def _pump(self, conn: _Connection, sid: str, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                await conn.send({"push": sid, "item": item})
+            except ConnectionError:
+                return
+
+
+async def serve(path: str, *, enable_agents: bool = True) -> None:
+    """Run a WorldRegistry and its IPC server until SIGINT/SIGTERM."""
+    loop = WorldRegistry(enable_agent_runner=enable_agents)
+    await loop.start()
+    set_world_loop(loop.home)
+    lockprof.install_dump_signal(asyncio.get_running_loop())
+    server = WorldServer(loop, path)
+    await server.start()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        await server.stop()
+        await loop.stop()
+
+
+# ── Web-worker side ──
+
+@dataclass
+class RemoteSubscriber(Subscriber):
+    remote_id: str = ""
+
+
+@dataclass
+class RemoteActor:
+    """What register_human hands back. No Game: it lives in the world process."""
+    actor_id: str
+    game: Any = None
+
+
+class RemoteWorldLoop:
+    """A WorldLoop in another process, behind `WorldServer`.
+
+    One socket per worker; a reader thread resolves replies and hands
+    pushed items to the local subscriber queues on the worker's event
+    loop."""
+
+    def __init__(self, path: str, *, timeout: float = CALL_TIMEOUT_SECONDS,
+                 control_timeout: float = CONTROL_TIMEOUT_SECONDS) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.control_timeout = control_timeout
+        self._sock: socket.socket | None = None
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        self._reader: threading.Thread | None = None
+        self._write_lock = threading.Lock()
+        # Guards _sock and _pending: a call registers only while a reader
+        # is running, and a reader that exits fails everything registered.
+        self._state_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._ids = itertools.count(1)
+        self._pending: dict[int, concurrent.futures.Future] = {}
+        self._subs: dict[str, RemoteSubscriber] = {}
+
+    async def start(self) -> None:
+        self._event_loop = asyncio.get_running_loop()
+        self._stopping.clear()
+        for attempt in range(CONNECT_ATTEMPTS):
+            try:
+                self._connect()
+                break
+            except OSError:
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    raise WorldUnavailable(f"no world process at {self.path}") from None
+                await asyncio.sleep(CONNECT_RETRY_SECONDS)
+        log.info("connected to world process at %s", self.path)
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        with self._state_lock:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+            sock.close()
+        if self._reader is not None:
+            await asyncio.to_thread(self._reader.join, 5)
+            self._reader = None
+
+    # ── WorldLoop surface ──
+
+    def add_subscriber(self, queue: asyncio.Queue) -> RemoteSubscriber:
+        sub = RemoteSubscriber(queue=queue, remote_id=self._control("add_subscriber"))
+        self._subs[sub.remote_id] = sub
+        return sub
+
+    def remove_subscriber(self, sub: RemoteSubscriber) -> None:
+        self._subs.pop(sub.remote_id, None)
+        with contextlib.suppress(WorldUnavailable):
+            self._control("remove_subscriber", sub=sub.remote_id)
+
+    def set_subscription(self, sub: RemoteSubscriber, actor_id: str) -> bool:
+        if actor_id:
+            ok = self._control("set_subscription", sub=sub.remote_id, actor_id=actor_id)
+            if ok:
+                sub.actor_id = actor_id
+            return ok
+        self._control("clear_subscription", sub=sub.remote_id)
+        sub.actor_id = ""
+        sub.queue.put_nowait(("event", {"type": "subscribed", "actor_id": ""}))
+        for item in list(sub.self_transcript):
+            sub.queue.put_nowait(("self", item))
+        return True
+
+    def actor_list_event(self) -> dict:
+        return self._control("actor_list_event")
+
+    def explored_rooms(self, world_id: str | None = None) -> tuple[str, list[str]] | None:
+        explored = self._control("explored_rooms", world=world_id)
+        return tuple(explored) if explored is not None else None
+
+    @property
+    def ready(self) -> bool:
+        return self._control("ready")
+
+    def metrics_text(self) -> str:
+        # Commands, locks, ticks and LLM calls all run in the world
+        # process, so its metrics are the ones worth scraping.
+        return self._control("metrics")
+
+    def lock_report(self) -> dict:
+        return self._control("lock_report")
+
+    def register_human(self, state) -> RemoteActor:
+        # Session saved `state` just before this; the world process
+        # loads it from the shared players directory.
+        return RemoteActor(actor_id=self._call("register_human", player_id=state.player_id))
+
+    def unregister_human(self, actor_id: str) -> None:
+        self._call("unregister_human", actor_id=actor_id)
+
+    def start_actor(self, actor_id: str) -> list:
+        return [_msg_from_wire(m) for m in self._call("start_actor", actor_id=actor_id)]
+
+    def submit_command(self, actor_id: str, text: str, *, echo: bool = False) -> list:
+        return [_msg_from_wire(m) for m in
+                self._call("submit_command", actor_id=actor_id, text=text, echo=echo)]
+
+    def submit_moves(self, actor_id: str, texts: list[str]) -> list:
+        return [_msg_from_wire(m) for m in
+                self._call("submit_moves", actor_id=actor_id, texts=texts)]
+
+    # ── Plumbing ──
+
+    def _control(self, op: str, **args: Any) -> Any:
+        return self._call(op, timeout=self.control_timeout, **args)
+
+    def _call(self, op: str, *, timeout: float | None = None, **args: Any) -> Any:
+        req_id = next(self._ids)
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+        with self._state_lock:
+            sock = self._sock
+            if sock is None:
+                raise WorldUnavailable("not connected to the world process")
+            self._pending[req_id] = fut
+        try:
+            with self._write_lock:
+                sock.sendall(_encode({"id": req_id, "op": op, **args}))
+        except OSError as e:
+            self._pending.pop(req_id, None)
+            raise WorldUnavailable(f"world process unreachable: {e}") from e
+        try:
+            return fut.result(timeout=self.timeout if timeout is None else timeout)
+        except concurrent.futures.TimeoutError:
+            self._pending.pop(req_id, None)
+            raise WorldUnavailable(f"world process timed out on {op}") from None
+
+    def _connect(self) -> None:
+        """Open the socket and start a reader for it. Raises OSError."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        with self._state_lock:
+            self._sock = sock
+        self._reader = threading.Thread(target=self._read_loop, args=(sock,),
+                                        name="world-ipc-reader", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self, sock: socket.socket) -> None:
+        try:
+            with sock.makefile("rb") as rfile:
+                for line in rfile:
+                    self._dispatch(json.loads(line))
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._state_lock:
+                if self._sock is sock:
+                    self._sock = None
+                pending, self._pending = self._pending, {}
+            for fut in pending.values():
+                fut.set_exception(WorldUnavailable("world process closed the connection"))
+            with contextlib.suppress(OSError):
+                sock.close()
+        if not self._stopping.is_set():
+            log.warning("lost connection to world process; reconnecting")
+            self._reconnect()
+
+    def _reconnect(self) -> None:
+        """Retry with backoff until connected (or stopped), then put every
+        live subscriber back on the new connection. Subscribers whose
+        actor didn't survive the restart fall back to the pre-actor view."""
+        delay = CONNECT_RETRY_SECONDS
+        while not self._stopping.wait(delay):
+            if self._try_connect():
+                break
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+        else:
+            return
+        log.info("reconnected to world process at %s", self.path)
+        subs, self._subs = list(self._subs.values()), {}
+        for sub in subs:
+            self._resubscribe(sub)
+
+    def _try_connect(self) -> bool:
+        try:
+            self._connect()
+        except OSError:
+            return False
+        return True
+
+    def _resubscribe(self, sub: RemoteSubscriber) -> None:
+        try:
+            sub.remote_id = self._control("add_subscriber")
+            self._subs[sub.remote_id] = sub
+            if sub.actor_id and not self.set_subscription(sub, sub.actor_id):
+                self.set_subscription(sub, "")
+        except WorldUnavailable:
+            log.exception("re-registering a subscriber failed")
+
+    def _dispatch(self, msg: dict) -> None:
+        if "push" in msg:
+            sub = self._subs.get(msg["push"])
+            if sub is None or self._event_loop is None:
+                return
+            item = _item_from_wire(msg["item"])
+            with contextlib.suppress(RuntimeError):
+                self._event_loop.call_soon_threadsafe(sub.queue.put_nowait, item)
+            return
+        fut = self._pending.pop(msg.get("id"), None)
+        if fut is None:
+            return
+        if "error" in msg:
+            fut.set_exception(WorldUnavailable(msg["error"]))
+        else:
+            fut.set_result(msg.get("result"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m nachomud.world.ipc",
+                                 description="Run the shared world as its own process.")
+    ap.add_argument("--socket", default=WORLD_SOCKET,
+                    help="Unix socket path (default: $NACHOMUD_WORLD_SOCKET)")
+    args = ap.parse_args(argv)
+    if not args.socket:
+        ap.error("set --socket or NACHOMUD_WORLD_SOCKET")
+    logging.basicConfig(level=logging.INFO)
+    enable_agents = not bool(os.environ.get("NACHOMUD_DISABLE_AGENTS", ""))
+    asyncio.run(serve(args.socket, enable_agents=enable_agents))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
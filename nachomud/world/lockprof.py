@@ -0,0 +1,194 @@
+"""Contention profiler for the WorldLoop's zone locks.
+
+Every critical section taken through ZoneLocks reports who held it
+(actor id and command text), how long it waited for the locks and how
+long it held them. The profiler keeps:
+
+  * the sections in progress right now, so a stalled world shows who
+    is sitting on which zones;
+  * the `capacity` slowest finished sections, by hold time;
+  * for a section held past `slow_seconds`, one stack of the holding
+    thread, sampled by a watchdog while it is still inside the lock —
+    that's where the time is actually going — plus a warning in the log.
+
+Read it with GET /admin/locks or `kill -USR1` on the process running
+the world, which logs `report()`.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import signal
+import sys
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+
+from nachomud.settings import LOCK_PROFILE_SLOWEST, LOCK_SLOW_SECONDS
+
+
+log = logging.getLogger("nachomud.lockprof")
+
+
+@dataclass
+class Section:
+    holder: str             # actor id, or "" for world-level work
+    what: str               # command text or a "(register)"-style tag
+    zones: tuple[str, ...]  # ("*",) for exclusive()
+    wait_seconds: float
+    hold_seconds: float = 0.0
+    started_at: float = 0.0  # wall clock, for the report
+    thread: str = ""
+    stack: str = ""
+
+
+@dataclass
+class _Active:
+    section: Section
+    since: float            # perf_counter at acquire
+    ident: int              # holding thread
+
+
+@dataclass
+class LockProfiler:
+    capacity: int = LOCK_PROFILE_SLOWEST
+    # Holds longer than this get a stack sample and a log warning.
+    # 0 turns both off.
+    slow_seconds: float = LOCK_SLOW_SECONDS
+    sample_interval: float = 0.1
+
+    # Min-heap of (hold, seq, section): the root is the fastest of the
+    # kept sections, the one a slower newcomer pushes out.
+    _slowest: list[tuple[float, int, Section]] = field(default_factory=list)
+    _active: dict[int, _Active] = field(default_factory=dict)
+    _seq: itertools.count = field(default_factory=itertools.count)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _sampler: threading.Thread | None = None
+
+    def enter(self, holder: str, what: str, zones: tuple[str, ...],
+              wait_seconds: float) -> int:
+        """Record that the calling thread now holds `zones`. Returns a
+        token for `exit`."""
+        thread = threading.current_thread()
+        section = Section(holder=holder, what=what, zones=zones,
+                          wait_seconds=wait_seconds, started_at=time.time(),
+                          thread=thread.name)
+        with self._lock:
+            token = next(self._seq)
+            self._active[token] = _Active(section, time.perf_counter(), thread.ident or 0)
+            if self.slow_seconds > 0 and self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_loop,
+                                                 name="lockprof-sampler", daemon=True)
+                self._sampler.start()
+        return token
+
+    def exit(self, token: int) -> Section:
+        now = time.perf_counter()
+        with self._lock:
+            active = self._active.pop(token)
+            section = active.section
+            section.hold_seconds = now - active.since
+            entry = (section.hold_seconds, token, section)
+            if len(self._slowest) < self.capacity:
+                heapq.heappush(self._slowest, entry)
+            elif self._slowest and entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+        if self.slow_seconds > 0 and section.hold_seconds >= self.slow_seconds:
+            log.warning("slow critical section: %s %r held %s for %.2fs (waited %.3fs)",
+                        section.holder or "-", section.what, ",".join(section.zones),
+                        section.hold_seconds, section.wait_seconds)
+        return section
+
+    # ── Stack sampling ──
+
+    def sample(self) -> int:
+        """Capture the stack of every holder past `slow_seconds` that
+        doesn't have one yet. Returns how many were captured."""
+        now = time.perf_counter()
+        with self._lock:
+            due = [a for a in self._active.values()
+                   if not a.section.stack and now - a.since >= self.slow_seconds]
+        if not due:
+            return 0
+        frames = sys._current_frames()
+        captured = 0
+        for active in due:
+            frame = frames.get(active.ident)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with self._lock:
+                active.section.stack = stack
+            captured += 1
+        return captured
+
+    def _sample_loop(self) -> None:
+        while True:
+            time.sleep(self.sample_interval)
+            try:
+                self.sample()
+            except Exception:
+                log.exception("lock stack sampling failed")
+
+    # ── Views ──
+
+    def active(self) -> list[Section]:
+        """Sections held right now, longest first, with hold time so far."""
+        now = time.perf_counter()
+        with self._lock:
+            held = [(now - a.since, a.section) for a in self._active.values()]
+        out = []
+        for hold, section in sorted(held, key=lambda h: -h[0]):
+            out.append(Section(**{**asdict(section), "hold_seconds": hold}))
+        return out
+
+    def slowest(self) -> list[Section]:
+        with self._lock:
+            entries = list(self._slowest)
+        return [s for _, _, s in sorted(entries, key=lambda e: (-e[0], e[1]))]
+
+    def snapshot(self) -> dict:
+        return {"active": [asdict(s) for s in self.active()],
+                "slowest": [asdict(s) for s in self.slowest()]}
+
+    def report(self) -> str:
+        lines = ["zone locks held now:"]
+        lines += [_line(s) for s in self.active()] or ["  (none)"]
+        lines.append(f"slowest {self.capacity} critical sections:")
+        slowest = self.slowest()
+        lines += [_line(s) for s in slowest] or ["  (none)"]
+        for s in slowest + self.active():
+            if s.stack:
+                lines.append(f"stack of {s.holder or '-'} {s.what!r}:")
+                lines.append(s.stack.rstrip())
+        return "\n".join(lines)
+
+
+def _line(s: Section) -> str:
+    when = time.strftime("%H:%M:%S", time.localtime(s.started_at))
+    return (f"  {when} hold {s.hold_seconds * 1000:9.1f}ms wait {s.wait_seconds * 1000:8.1f}ms "
+            f"{s.holder or '-'} {s.what!r} [{','.join(s.zones)}] ({s.thread})")
+
+
+PROFILER = LockProfiler()
+
+
+def install_dump_signal(loop: asyncio.AbstractEventLoop) -> bool:
+    """Log PROFILER.report() whenever the process gets SIGUSR1. Only
+    the main thread can install signal handlers; elsewhere (tests, a
+    worker thread) this is a no-op returning False."""
+    try:
+        loop.add_signal_handler(signal.SIGUSR1,
+                                lambda: log.warning("lock report\n%s", PROFILER.report()))
+    except (ValueError, RuntimeError, NotImplementedError, AttributeError):
+        return False
+    return True
+
+
+def remove_dump_signal(loop: asyncio.AbstractEventLoop) -> None:
+    with contextlib.suppress(ValueError, RuntimeError, NotImplementedError, AttributeError):
+        loop.remove_signal_handler(signal.SIGUSR1)
@@ -1,18 +1,23 @@
 """WorldLoop: the single owner of the shared world.
 
-Every actor's command flows through one threading.Lock, processed
-serially against the shared world. A background tick task runs
-`tick_mobs_for_rooms` on a wall-clock cadence and pushes witness lines
-onto the affected actors' Game queues. Both ends share the same lock
-so commands and ticks never interleave.
+Commands lock only the zones (world/zones.py) they can touch — the
+actor's room, every room one exit away, and its respawn room — so
+actors in unrelated areas run concurrently while two in the same area
+still serialize. Adding or removing actors takes every zone at once.
+
+A background tick task runs `tick_mobs_for_rooms` on a wall-clock
+cadence without any zone lock: it works from a snapshot and commits
+with compare-and-set, so a mob a command changed meanwhile keeps the
+command's version. Witness lines land on the affected actors' Game
+queues, which are safe to push onto from any thread.
 
 Sync callers (Session/Game pipeline driven via `loop.run_in_executor`)
-acquire the lock directly; the async tick task acquires it via
-`asyncio.to_thread`.
+take locks directly; the async tick task runs via `asyncio.to_thread`.
 
-The 4 built-in agents are auto-registered on first start; their AgentState
-saves are minted in `data/players/agent_<id>.json` if not already
-present. Human players register their own actor when they enter the
+Each world gets its own WorldLoop (world/registry.py boots them). The
+4 built-in agents are auto-registered when the home world starts; their
+AgentState saves are minted in `data/players/agent_<id>.json` if not
+already present. Human players register their own actor when they enter the
 game (the WS handler plumbs this through Session._enter_in_game).
 """
 from __future__ import annotations
@@ -20,9 +25,9 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-import threading
+import time
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -32,10 +37,14 @@ import nachomud.world.store as world_store
 import nachomud.world.transcript_log as transcript_log
 from nachomud.ai.agents import AGENT_DEFINITIONS, build_agent_state
 from nachomud.ai.dm import DM, LLMFn
+from nachomud.ai.llm import ResponseCache
 from nachomud.ai.npc import NPCDialogue
+from nachomud.ai.scheduler import AgentScheduler
 from nachomud.engine.game import Game
+from nachomud.metrics import COMMAND_SECONDS, TICK_SECONDS
 from nachomud.models import AgentState
 from nachomud.world.mobs import tick_mobs_for_rooms, witness_lines
+from nachomud.world.zones import ZoneLocks, zone_of
 
 
 log = logging.getLogger("nachomud.worldloop")
@@ -70,13 +79,22 @@ class Actor:
     """One participant in the shared world: human or AI agent.
 
     `kind` is "human" or "agent". `agent_def` is set only for AI actors
-    and points to the entry in AGENT_DEFINITIONS that drives them."""
+    and points to the entry in AGENT_DEFINITIONS that drives them.
+    `llm_decisions` / `policy_decisions` count how each agent tick was
+    decided (LLM vs. the runner's deterministic fast path)."""
     actor_id: str
     kind: str               # "human" | "agent"
     state: AgentState
     game: Any               # Game instance — typed Any to avoid circular import
     transcript: deque = field(default_factory=lambda: deque(maxlen=TRANSCRIPT_LIMIT))
     agent_def: dict | None = None
+    llm_decisions: int = 0
+    policy_decisions: int = 0
+
+    @property
+    def llm_call_ratio(self) -> float:
+        total = self.llm_decisions + self.policy_decisions
+        return self.llm_decisions / total if total else 0.0
 
     def record(self, msgs: Iterable) -> None:
         """Append messages to the per-actor transcript ring buffer
@@ -98,13 +116,33 @@ class WorldLoop:
 
     actors: dict[str, Actor] = field(default_factory=dict)
     subscribers: list[Subscriber] = field(default_factory=list)
-    _lock: threading.Lock = field(default_factory=threading.Lock)
+    zones: ZoneLocks = field(default_factory=ZoneLocks)
     _tick_task: Optional[asyncio.Task] = None
     _agent_tasks: list[asyncio.Task] = field(default_factory=list)
     _stopped: bool = False
     _booted: bool = False
     _event_loop: Optional[asyncio.AbstractEventLoop] = None
     enable_agent_runner: bool = True
+    agent_scheduler: Optional[AgentScheduler] = None
+    # Shared by every actor's NPCDialogue so one player's "hello" serves
+    # the next player's identical opener.
+    npc_reply_cache: ResponseCache = field(
+        default_factory=lambda: ResponseCache("npc_replies"))
+    saves: player_mod.SaveCoordinator = field(default_factory=player_mod.SaveCoordinator)
+    # Agents this world boots. Only the home world (world/registry.py)
+    # runs the built-in four; their saves are global, not per world.
+    agent_definitions: list[dict] = field(default_factory=lambda: list(AGENT_DEFINITIONS))
+    # Set by the WorldRegistry so the sidebar lists every running
+    # world's actors, not just this one's.
+    actor_list_fn: Callable[[], list[dict]] | None = None
+    # (per-actor visited counts, world_id, sorted union) from explored_rooms.
+    _explored: tuple[tuple, str, list[str]] | None = None
+    # Room occupancy: room id -> ids of the actors in it (a dict used as
+    # an ordered set), and the room each actor is filed under. Updated by
+    # _place / _unplace whenever an actor arrives, moves or leaves, so
+    # nothing has to scan every actor.
+    _occupants: dict[str, dict[str, None]] = field(default_factory=dict)
+    _room_of: dict[str, str] = field(default_factory=dict)
 
     # ── Lifecycle ──
 
@@ -114,10 +152,12 @@ class WorldLoop:
         self._booted = True
         self._event_loop = asyncio.get_event_loop()
         await asyncio.to_thread(starter.seed_world, self.world_id, "silverbrook")
-        await asyncio.to_thread(self._mint_agent_actors)
+        await self._mint_agent_actors()
         self._tick_task = asyncio.create_task(self._tick_loop(), name="worldloop.tick")
         if self.enable_agent_runner:
             self._spawn_agent_runners()
+        # Viewers may have connected while the world was warming up.
+        self.broadcast_actor_list()
         log.info("WorldLoop started — world=%s, %d actors registered",
                  self.world_id, len(self.actors))
 
@@ -134,47 +174,59 @@ class WorldLoop:
             with contextlib.suppress(asyncio.CancelledError, Exception):
                 await self._tick_task
             self._tick_task = None
-        with self._lock:
+        with self.zones.exclusive(what="(shutdown save)"):
             for actor in self.actors.values():
                 try:
-                    player_mod.save_player(actor.state)
+                    self.saves.request(actor.state, force=True)
                 except Exception:
-                    log.exception("save_player failed at shutdown for %s", actor.actor_id)
+                    log.exception("save failed at shutdown for %s", actor.actor_id)
 
     def _spawn_agent_runners(self) -> None:
         from nachomud.ai.runner import AGENT_TICK_SECONDS, _default_llm, agent_loop
         agents = [a for a in self.actors.values() if a.kind == "agent"]
         if not agents:
             return
+        if self.agent_scheduler is None:
+            self.agent_scheduler = AgentScheduler()
         stagger_step = AGENT_TICK_SECONDS / max(1, len(agents))
         for i, actor in enumerate(agents):
+            self.agent_scheduler.register(actor.actor_id)
             task = asyncio.create_task(
                 agent_loop(self, actor, llm_fn=_default_llm,
-                           stagger_seconds=i * stagger_step),
+                           stagger_seconds=i * stagger_step,
+                           scheduler=self.agent_scheduler),
                 name=f"agent_runner.{actor.actor_id}",
             )
             self._agent_tasks.append(task)
 
     # ── Registry ──
 
-    def _mint_agent_actors(self) -> None:
-        for definition in AGENT_DEFINITIONS:
+    async def _mint_agent_actors(self) -> None:
+        # Each agent is its own save file, so they load side by side;
+        # actors are still registered in definition order.
+        states = await asyncio.gather(*(asyncio.to_thread(self._load_agent_state, d)
+                                        for d in self.agent_definitions))
+        for definition, state in zip(self.agent_definitions, states, strict=True):
             actor_id = definition["actor_id"]
-            if player_mod.player_exists(actor_id):
-                state = player_mod.load_player(actor_id)
-                # Rescue: if the saved room no longer exists in the world,
-                # bounce them back to spawn rather than crash on load_room.
-                if state.room_id and not world_store.room_exists(self.world_id, state.room_id):
-                    log.info("rescuing %s from missing room %s -> %s",
-                             actor_id, state.room_id, self.spawn_room)
-                    state.room_id = self.spawn_room
-                    player_mod.save_player(state)
-            else:
-                state = build_agent_state(definition, world_id=self.world_id,
-                                          spawn_room=self.spawn_room)
+            self.actors[actor_id] = self._build_actor(actor_id, "agent", state, definition)
+            self._place(self.actors[actor_id])
+
+    def _load_agent_state(self, definition: dict) -> AgentState:
+        actor_id = definition["actor_id"]
+        if player_mod.player_exists(actor_id):
+            state = player_mod.load_player(actor_id)
+            # Rescue: if the saved room no longer exists in the world,
+            # bounce them back to spawn rather than crash on load_room.
+            if state.room_id and not world_store.room_exists(self.world_id, state.room_id):
+                log.info("rescuing %s from missing room %s -> %s",
+                         actor_id, state.room_id, self.spawn_room)
+                state.room_id = self.spawn_room
                 player_mod.save_player(state)
-            actor = self._build_actor(actor_id, "agent", state, definition)
-            self.actors[actor_id] = actor
+        else:
+            state = build_agent_state(definition, world_id=self.world_id,
+                                      spawn_room=self.spawn_room)
+            player_mod.save_player(state)
+        return state
 
     def _build_actor(self, actor_id: str, kind: str, state: AgentState,
                      definition: dict | None) -> Actor:
@@ -186,70 +238,103 @@ class WorldLoop:
         # Tests inject self.dm_llm / self.npc_llm directly and bypass
         # the host plumbing entirely.
         smart_host = state.dm_ollama_url if kind == "human" else None
-        game = Game(
+        game = self._make_game(actor_id, state, smart_host)
+        return Actor(actor_id=actor_id, kind=kind, state=state, game=game,
+                     agent_def=definition)
+
+    def _make_game(self, actor_id: str, state: AgentState,
+                   smart_host: str | None) -> Game:
+        return Game(
             player=state,
             dm=DM(llm=self.dm_llm, host=smart_host),
             npc_dialogue=NPCDialogue(llm=self.npc_llm,
                                      summarizer=self.npc_summarizer,
-                                     host=smart_host),
+                                     host=smart_host,
+                                     reply_cache=self.npc_reply_cache),
             co_residents_fn=lambda room_id, _aid=actor_id: self._co_residents(_aid, room_id),
+            saves=self.saves,
         )
-        return Actor(actor_id=actor_id, kind=kind, state=state, game=game,
-                     agent_def=definition)
 
     def _co_residents(self, exclude_actor_id: str, room_id: str) -> list[str]:
         """Display names of other actors currently in `room_id`. Called
-        by Game.render_room. Read-only over self.actors — caller already
-        holds _lock (via submit_command / start_actor)."""
+        by Game.render_room, under the zone lock of `room_id`, which every
+        move into or out of it holds too."""
         out: list[str] = []
-        for aid, a in self.actors.items():
-            if aid == exclude_actor_id:
-                continue
-            if a.state.room_id != room_id:
+        for a in self.occupants(room_id):
+            if a.actor_id == exclude_actor_id:
                 continue
-            display = (a.agent_def or {}).get("display_name") or a.state.name or aid
+            display = (a.agent_def or {}).get("display_name") or a.state.name or a.actor_id
             out.append(display)
         return out
 
+    # ── Room occupancy ──
+
+    def occupants(self, room_id: str) -> list[Actor]:
+        """The actors in `room_id`, in the order they got there."""
+        ids = list(self._occupants.get(room_id, ()))
+        return [a for a in (self.actors.get(aid) for aid in ids) if a is not None]
+
+    def _place(self, actor: Actor) -> str:
+        """File `actor` under the room it is in now. Returns the room it
+        was filed under before ("" if none). Callers hold the zones of
+        both rooms, so no two threads touch one room's set at once."""
+        room_id = actor.state.room_id or ""
+        old = self._room_of.get(actor.actor_id, "")
+        if old == room_id:
+            return old
+        self._unplace(actor.actor_id)
+        if room_id:
+            self._occupants.setdefault(room_id, {})[actor.actor_id] = None
+            self._room_of[actor.actor_id] = room_id
+        return old
+
+    def _unplace(self, actor_id: str) -> None:
+        old = self._room_of.pop(actor_id, "")
+        here = self._occupants.get(old)
+        if here is not None:
+            here.pop(actor_id, None)
+            if not here:
+                del self._occupants[old]
+
     def register_human(self, state: AgentState) -> Actor:
         """Register a human actor when they finish welcome / char-create.
         Reconnect-safe: rebinds the existing actor if there's already one
         for this player_id."""
         actor_id = f"human_{state.player_id}"
         new = False
-        with self._lock:
+        with self.zones.exclusive(holder=actor_id, what="(register)"):
             existing = self.actors.get(actor_id)
             if existing is not None:
-                existing.state = state
+                # Keep the live state: with debounced saves it can be
+                # newer than the file the session just loaded.
+                existing.state.dm_ollama_url = state.dm_ollama_url
+                state = existing.state
+                self.saves.forget(state.player_id)
+                self.saves.request(state, force=True)
                 # Same routing rule as _build_actor — re-binding for
                 # reconnect picks up the latest dm_ollama_url too.
-                smart_host = state.dm_ollama_url
-                existing.game = Game(
-                    player=state,
-                    dm=DM(llm=self.dm_llm, host=smart_host),
-                    npc_dialogue=NPCDialogue(llm=self.npc_llm,
-                                             summarizer=self.npc_summarizer,
-                                             host=smart_host),
-                    co_residents_fn=lambda room_id, _aid=actor_id: self._co_residents(_aid, room_id),
-                )
+                existing.game = self._make_game(actor_id, state, state.dm_ollama_url)
                 actor = existing
             else:
                 actor = self._build_actor(actor_id, "human", state, None)
                 self.actors[actor_id] = actor
                 new = True
+            self._place(actor)
         if new:
             self.broadcast_actor_list()
         return actor
 
     def unregister_human(self, actor_id: str) -> None:
-        with self._lock:
+        with self.zones.exclusive(holder=actor_id, what="(unregister)"):
             actor = self.actors.pop(actor_id, None)
-        if actor is None:
-            return
-        try:
-            player_mod.save_player(actor.state)
-        except Exception:
-            log.exception("save_player failed for %s", actor_id)
+            if actor is None:
+                return
+            self._unplace(actor_id)
+            try:
+                self.saves.request(actor.state, force=True)
+                self.saves.forget(actor.state.player_id)
+            except Exception:
+                log.exception("save failed for %s", actor_id)
         for sub in self.subscribers:
             if sub.actor_id == actor_id:
                 sub.actor_id = ""
@@ -260,7 +345,7 @@ class WorldLoop:
 
     def list_actors(self) -> list[dict]:
         out = []
-        for a in self.actors.values():
+        for a in list(self.actors.values()):
             display = (a.agent_def or {}).get("display_name", a.state.name)
             out.append({
                 "actor_id": a.actor_id,
@@ -274,9 +359,28 @@ class WorldLoop:
                 "max_hp": a.state.max_hp,
                 "alive": a.state.alive,
                 "room_id": a.state.room_id,
+                "world_id": self.world_id,
             })
         return out
 
+    def explored_rooms(self) -> tuple[str, list[str]]:
+        """(world_id, every room any actor has visited) for the public map.
+        visited_rooms only ever grows, so the union is rebuilt only when
+        some actor's count changes (or actors come and go)."""
+        actors = list(self.actors.values())
+        sig = tuple((a.actor_id, a.state.world_id, len(a.state.visited_rooms or []))
+                    for a in actors)
+        if self._explored is not None and self._explored[0] == sig:
+            return self._explored[1], self._explored[2]
+        visited: set[str] = set()
+        world_id = self.world_id
+        for actor in actors:
+            visited.update(actor.state.visited_rooms or [])
+            if actor.state.world_id:
+                world_id = actor.state.world_id
+        self._explored = (sig, world_id, sorted(visited))
+        return world_id, self._explored[2]
+
     # ── Subscribers ──
 
     def add_subscriber(self, queue: asyncio.Queue) -> Subscriber:
@@ -314,6 +418,9 @@ class WorldLoop:
                 self._enqueue(sub.queue, ("self", item))
         return True
 
+    def is_watched(self, actor_id: str) -> bool:
+        return any(s.actor_id == actor_id for s in self.subscribers)
+
     def _broadcast(self, actor_id: str, msgs: list) -> None:
         if not msgs:
             return
@@ -332,7 +439,8 @@ class WorldLoop:
             loop.call_soon_threadsafe(queue.put_nowait, item)
 
     def actor_list_event(self) -> dict:
-        return {"type": "actor_list", "actors": self.list_actors()}
+        actors = self.actor_list_fn() if self.actor_list_fn else self.list_actors()
+        return {"type": "actor_list", "actors": actors}
 
     def broadcast_actor_list(self) -> None:
         evt = self.actor_list_event()
@@ -341,49 +449,157 @@ class WorldLoop:
 
     # ── Command processing ──
 
+    def _zones_for(self, actor: Actor) -> set[str] | None:
+        """Every zone a command by `actor` could touch: its room, each
+        room one exit away (moves, flee, room generation) and its
+        respawn room (death). None if its room can't be read."""
+        state = actor.state
+        try:
+            room = world_store.load_room(state.world_id, state.room_id)
+        except Exception:
+            return None
+        zones = {zone_of(state.room_id), zone_of(state.respawn_room)}
+        zones.update(zone_of(dest) for dest in room.exits.values() if isinstance(dest, str))
+        return zones
+
+    @contextlib.contextmanager
+    def hold_actor(self, actor: Actor, what: str = ""):
+        """Lock the zones around `actor` for one command (`what`, shown
+        by the lock profiler) and yield the zones held, None when that is
+        every zone. Retries if the actor moved before the locks were all
+        held."""
+        label = {"holder": actor.actor_id, "what": what}
+        while True:
+            room_id = actor.state.room_id
+            zones = self._zones_for(actor)
+            with (self.zones.hold(zones, **label) if zones is not None
+                  else self.zones.exclusive(**label)):
+                if actor.state.room_id == room_id:
+                    yield zones
+                    return
+
     def submit_command(self, actor_id: str, text: str, *,
                        echo: bool = False) -> list:
-        """Run a single command for the named actor under the world lock.
+        """Run a single command for the named actor under its zone locks.
         Returns the messages produced and broadcasts them to subscribers.
         Cross-actor witnesses are queued onto bystanders if the mover
         changed rooms.
 
         `echo`: prepend a "> {text}" line so spectators see what an agent
         decided. Humans don't need this — they see their own keystrokes
-        locally in xterm."""
+        locally in xterm.
+
+        `travel` is planned here and walked by submit_moves, which takes
+        the locks of each stretch of the route in turn."""
         actor = self.actors.get(actor_id)
         if actor is None:
             log.warning("submit_command for unknown actor %s", actor_id)
             return []
+        if actor.kind == "human" and self.agent_scheduler is not None:
+            self.agent_scheduler.note_human_activity()
         echo_msg = None
         if echo and text:
             echo_msg = ("output", f"\x1b[2;36m> {text}\x1b[0m\r\n")
-        with self._lock:
+        started = time.perf_counter()
+        with self.hold_actor(actor, text):
             if echo_msg is not None:
                 actor.record([echo_msg])
-            old_room = actor.state.room_id
+            verb = actor.game.verb_of(text)
+            route: list[str] = []
             try:
-                msgs = actor.game.handle(text)
+                if verb == "travel":
+                    route, msgs = actor.game.plan_travel(text.strip().partition(" ")[2].strip())
+                else:
+                    msgs = actor.game.handle(text)
             except Exception:
                 log.exception("game.handle failed for %s", actor_id)
+                self._publish_move(actor)
                 if echo_msg is not None:
                     self._broadcast(actor_id, [echo_msg])
                 return []
-            new_room = actor.state.room_id
-            if new_room != old_room:
-                self._cross_actor_witness(actor, old_room, new_room)
+            self._publish_move(actor)
             actor.record(msgs)
             self._sync_visited(actor)
+        COMMAND_SECONDS.observe(time.perf_counter() - started, verb)
         if echo_msg is not None:
             self._broadcast(actor_id, [echo_msg])
         self._broadcast(actor_id, msgs)
+        if route:
+            return msgs + self.submit_moves(actor_id, route, travel=True)
         return msgs
 
+    def submit_moves(self, actor_id: str, texts: list[str], *,
+                     travel: bool = False) -> list:
+        """Run typed-ahead movement commands ("n", "n", "go east") as one
+        walk. Steps share a lock acquisition for as long as every zone the
+        next step could touch is already held, and only the last one
+        renders the room; the others report just "You head north." The
+        walk stops at a blocked exit. Once a step is no longer a plain
+        move (combat started), it and the rest run as ordinary commands.
+
+        `travel`: the moves are a planned route rather than typed input,
+        so the walk also stops where Game.travel_halt says (mobs are read
+        once per lock acquisition), and whatever is left of the route is
+        dropped rather than run."""
+        actor = self.actors.get(actor_id)
+        if actor is None:
+            log.warning("submit_moves for unknown actor %s", actor_id)
+            return []
+        if actor.kind == "human" and self.agent_scheduler is not None:
+            self.agent_scheduler.note_human_activity()
+        out: list = []
+        remaining = list(texts)
+        leftover: list[str] = []
+        shown_room = True
+        while remaining:
+            with self.hold_actor(actor, " ".join(remaining)) as held:
+                hazards = actor.game.travel_hazards() if travel else {}
+                first = True
+                while remaining:
+                    if actor.game.verb_of(remaining[0]) != "move":
+                        leftover, remaining = ([] if travel else remaining), []
+                        break
+                    if not first and held is not None:
+                        needed = self._zones_for(actor)
+                        if needed is None or not needed <= held:
+                            break           # re-lock around where we are now
+                    first = False
+                    started = time.perf_counter()
+                    text = remaining.pop(0)
+                    brief = bool(remaining)
+                    try:
+                        msgs = actor.game.handle(text, brief=brief)
+                    except Exception:
+                        log.exception("game.handle failed for %s", actor_id)
+                        self._publish_move(actor)
+                        remaining = []
+                        break
+                    if self._publish_move(actor):
+                        if travel and remaining and (halt := actor.game.travel_halt(hazards)):
+                            msgs, remaining = msgs + halt, []
+                        shown_room = not brief
+                    else:
+                        remaining = []      # blocked: the walk ends here
+                    actor.record(msgs)
+                    self._sync_visited(actor)
+                    out.extend(msgs)
+                    COMMAND_SECONDS.observe(time.perf_counter() - started, "move")
+                if not remaining and not shown_room:
+                    if out and isinstance(out[-1], tuple) and out[-1][0] == "prompt":
+                        out.pop()           # the arrival ends with its own
+                    arrival = actor.game.describe_here()
+                    actor.record(arrival)
+                    out.extend(arrival)
+        self._broadcast(actor_id, out)
+        for text in leftover:
+            out.extend(self.submit_command(actor_id, text))
+        return out
+
     def start_actor(self, actor_id: str) -> list:
         actor = self.actors.get(actor_id)
         if actor is None:
             return []
-        with self._lock:
+        with self.hold_actor(actor, "(start)"):
             try:
                 msgs = actor.game.start()
             except Exception:
@@ -400,35 +616,38 @@ class WorldLoop:
         if rid and rid not in actor.state.visited_rooms:
             actor.state.visited_rooms.append(rid)
 
-    def _cross_actor_witness(self, mover: Actor, old_room: str, new_room: str) -> None:
-        """When `mover` changed rooms, queue 'X heads east' / 'X arrives
-        from the south' onto every other actor in old/new room."""
-        if not old_room and not new_room:
-            return
+    def _publish_move(self, mover: Actor) -> bool:
+        """Refile `mover` if its command changed its room, and tell the
+        actors in the room it left ("X heads east") and the one it
+        entered ("X arrives from the west"). Returns whether it moved."""
+        new_room = mover.state.room_id or ""
+        old_room = self._place(mover)
+        if old_room == new_room:
+            return False
         name = mover.state.name or mover.actor_id
-        direction_left = ""
-        if old_room and new_room:
-            try:
-                graph = world_store.load_graph(self.world_id)
-                for d, dest in graph.get(old_room, {}).items():
-                    if dest == new_room:
-                        direction_left = d
-                        break
-            except Exception:
-                pass
+        direction_left = self._exit_between(mover, old_room, new_room) if old_room else ""
         direction_arrived = (world_store.opposite_direction(direction_left)
                              if direction_left else "")
-        for other in self.actors.values():
-            if other.actor_id == mover.actor_id:
-                continue
-            if old_room and other.state.room_id == old_room:
-                line = (f"{name} heads {direction_left}." if direction_left
-                        else f"{name} departs.")
-                other.game.queue_witness([line])
-            elif new_room and other.state.room_id == new_room:
-                line = (f"{name} arrives from the {direction_arrived}."
-                        if direction_arrived else f"{name} appears.")
-                other.game.queue_witness([line])
+        left = f"{name} heads {direction_left}." if direction_left else f"{name} departs."
+        arrived = (f"{name} arrives from the {direction_arrived}."
+                   if direction_arrived else f"{name} appears.")
+        for room_id, line in ((old_room, left), (new_room, arrived)):
+            for other in self.occupants(room_id) if room_id else ():
+                if other.actor_id != mover.actor_id:
+                    other.game.queue_witness([line])
+        return True
+
+    def _exit_between(self, mover: Actor, old_room: str, new_room: str) -> str:
+        """The exit of `old_room` leading to `new_room`. A plain move says
+        which one it took; a flee or a respawn falls back to the graph."""
+        last = mover.game.last_move
+        if last is not None and last[0] == old_room and last[2] == new_room:
+            return last[1]
+        with contextlib.suppress(Exception):
+            for d, dest in world_store.load_graph(self.world_id).get(old_room, {}).items():
+                if dest == new_room:
+                    return d
+        return ""
 
     # ── Global tick ──
 
@@ -436,35 +655,48 @@ class WorldLoop:
         while not self._stopped:
             try:
                 await asyncio.sleep(GLOBAL_TICK_SECONDS)
-                await asyncio.to_thread(self._global_tick_locked)
+                await asyncio.to_thread(self._tick_and_flush)
             except asyncio.CancelledError:
                 return
             except Exception:
                 log.exception("global tick failed")
                 await asyncio.sleep(GLOBAL_TICK_SECONDS)
 
-    def _global_tick_locked(self) -> None:
-        with self._lock:
+    def _tick_and_flush(self) -> None:
+        with TICK_SECONDS.time(self.world_id):
             self._global_tick()
+        try:
+            self._flush_saves()
+        except Exception:
+            log.exception("debounced player saves failed")
+
+    def _flush_saves(self) -> None:
+        """Write the parked saves that are due, each under its actor's
+        zone locks so no command mutates the state while it serializes."""
+        by_player = {a.state.player_id: a for a in list(self.actors.values())}
+        for pid in self.saves.due():
+            actor = by_player.get(pid)
+            if actor is None:
+                self.saves.flush(pid)
+                continue
+            with self.hold_actor(actor, "(save)"):
+                self.saves.flush(pid)
 
     def _global_tick(self) -> None:
-        if not self.actors:
-            return
         active_rooms: set[str] = {
-            a.state.room_id for a in self.actors.values()
-            if a.state.alive and a.state.room_id
+            room_id for room_id in list(self._occupants)
+            if any(a.state.alive for a in self.occupants(room_id))
         }
         if not active_rooms:
             return
         witness_by_room = tick_mobs_for_rooms(self.world_id, active_rooms,
                                               minutes=MINUTES_PER_TICK)
-        if not witness_by_room:
-            return
-        for actor in self.actors.values():
-            w = witness_by_room.get(actor.state.room_id)
+        for room_id, w in (witness_by_room or {}).items():
             if not w or not w.has_any:
                 continue
-            actor.game.queue_witness(witness_lines(w))
+            lines = witness_lines(w)
+            for actor in self.occupants(room_id):
+                actor.game.queue_witness(lines)
 
 
 # ── Module-level singleton ──
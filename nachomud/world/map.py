@@ -2,20 +2,34 @@
 
 `render_explored_text(world_id, visited_rooms, current_room_id="")`
 returns a text listing of every visited room and its exits — used by
-the in-terminal `map` command and the global /map endpoint. Doesn't
-need 2D coordinates; just walks the world graph.
+`map list` and the global /map endpoint. Doesn't need coordinates;
+just walks the world graph.
 
-The (older) `render_map(...)` ASCII-grid renderer below is kept for
-backward compat but expects a `coords` field on Room that was never
-implemented — it'll raise AttributeError if called. Use
-`render_explored_text` instead.
+`render_map(world_id, current_room_id, visited_rooms)` draws the ASCII
+grid around the player for the plain `map` command. It reads only the
+rooms the spatial index (world/spatial.py) puts inside the viewport.
+
+Room names never change once a room exists and the exits only change
+when graph.json is rewritten, so rendered listings are cached against
+`world_store.graph_version` — `explored_map` for the public /map view,
+`Game` per actor for the `map` command.
 """
 from __future__ import annotations
 
+import hashlib
+from dataclasses import dataclass
+from threading import Lock
+
+import nachomud.world.spatial as spatial
 import nachomud.world.store as world_store
+from nachomud.world.directions import delta
 
 
 _MIN_NAME_W = 6
+_MAX_NAME_W = 12
+# Grid viewport: cells either side of the player.
+VIEW_RADIUS_X = 2
+VIEW_RADIUS_Y = 3
 
 
 def render_explored_text(world_id: str, visited_rooms: list[str],
@@ -32,13 +46,9 @@ def render_explored_text(world_id: str, visited_rooms: list[str],
     graph = world_store.load_graph(world_id)
     rooms: list[tuple[str, str]] = []  # (room_id, name)
     for rid in sorted(visited):
-        if not world_store.room_exists(world_id, rid):
-            continue
-        try:
-            r = world_store.load_room(world_id, rid)
-        except Exception:
-            continue
-        rooms.append((rid, r.name or rid))
+        name = _room_name(world_id, rid)
+        if name is not None:
+            rooms.append((rid, name))
 
     if not rooms:
         return "(nothing explored yet)"
@@ -60,47 +70,85 @@ def render_explored_text(world_id: str, visited_rooms: list[str],
     return "\n".join(lines)
 
 
-def render_map(world_id: str, current_room_id: str,
-               visited_rooms: list[str], *, max_rooms: int = 200) -> str:
+# room file path -> (display name, exits). Keyed by path so each
+# DATA_ROOT (and each test's tmp world) gets its own entries.
+_room_info: dict[str, tuple[str, dict[str, str]]] = {}
+
+
+def _load_info(world_id: str, room_id: str) -> tuple[str, dict[str, str]] | None:
+    path = world_store.room_path(world_id, room_id)
+    info = _room_info.get(path)
+    if info is not None:
+        return info
+    if not world_store.room_exists(world_id, room_id):
+        return None
+    try:
+        r = world_store.load_room(world_id, room_id)
+    except Exception:
+        return None
+    info = _room_info[path] = (r.name or room_id, dict(r.exits))
+    return info
+
+
+def _room_name(world_id: str, room_id: str) -> str | None:
+    info = _load_info(world_id, room_id)
+    return info[0] if info is not None else None
+
+
+@dataclass(frozen=True)
+class RenderedMap:
+    text: str
+    etag: str
+
+
+# world dir -> ((graph version, visited rooms), rendered)
+_explored: dict[str, tuple[tuple, RenderedMap]] = {}
+_explored_lock = Lock()
+
+
+def explored_map(world_id: str, visited_rooms: list[str]) -> RenderedMap:
+    """The global explored-rooms listing, re-rendered only when the
+    visited set or the world graph has changed since the last call."""
+    key = (world_store.graph_version(world_id), tuple(visited_rooms))
+    wdir = world_store.world_dir(world_id)
+    with _explored_lock:
+        hit = _explored.get(wdir)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        text = render_explored_text(world_id, visited_rooms)
+        etag = '"' + hashlib.sha1(text.encode()).hexdigest()[:20] + '"'
+        rendered = RenderedMap(text=text, etag=etag)
+        _explored[wdir] = (key, rendered)
+        return rendered
+
+
+def render_map(world_id: str, current_room_id: str, visited_rooms: list[str], *,
+               radius_x: int = VIEW_RADIUS_X, radius_y: int = VIEW_RADIUS_Y) -> str:
+    """ASCII grid of the rooms around the player on their z-layer.
+    Fog-of-war: visited rooms show, and so does anything one exit away
+    from a visited room. Cost follows the viewport, not the world size."""
+    index = spatial.load_index(world_id)
+    here = index.coords.get(current_room_id)
+    if here is None:
+        return "(map unavailable — this room isn't on the grid; try `map list`)"
     visited: set[str] = set(visited_rooms or []) | {current_room_id}
+    cx, cy, cz = here
+    window = index.query(cz, cx - radius_x, cy - radius_y, cx + radius_x, cy + radius_y)
 
-    # Fog-of-war reveal: a visited room "sees" its immediate neighbors
-    # via the world graph, even if the player hasn't stepped into them.
-    graph = world_store.load_graph(world_id)
-    eligible: set[str] = set(visited)
-    for rid in visited:
-        for dest in graph.get(rid, {}).values():
-            if isinstance(dest, str):
-                eligible.add(dest)
-
-    placed: dict[str, tuple[int, int, int]] = {}
     names: dict[str, str] = {}
-    for rid in eligible:
-        if not world_store.room_exists(world_id, rid):
+    exits: dict[str, dict[str, str]] = {}
+    same_z: dict[str, tuple[int, int]] = {}
+    for rid, (x, y, _) in window.items():
+        info = _load_info(world_id, rid)
+        if info is None:
             continue
-        try:
-            r = world_store.load_room(world_id, rid)
-        except Exception:
+        if rid not in visited and not visited.intersection(info[1].values()):
             continue
-        if world_store.is_orphan_coords(r.coords):
-            continue
-        placed[rid] = r.coords
-        names[rid] = r.name or rid
-        if len(placed) >= max_rooms:
-            break
-
-    if current_room_id not in placed:
+        names[rid], exits[rid] = info
+        same_z[rid] = (x, y)
+    if current_room_id not in same_z:
         return "(map unavailable — current room not in the world store)"
 
-    cur_z = placed[current_room_id][2]
-    same_z: dict[str, tuple[int, int]] = {
-        rid: (c[0], c[1]) for rid, c in placed.items() if c[2] == cur_z
-    }
-    other_z: list[tuple[str, int]] = sorted(
-        [(rid, c[2]) for rid, c in placed.items() if c[2] != cur_z],
-        key=lambda t: (t[1], names.get(t[0], "")),
-    )
-
     name_counts: dict[str, int] = {}
     for nm in names.values():
         name_counts[nm] = name_counts.get(nm, 0) + 1
@@ -109,15 +157,12 @@ def render_map(world_id: str, current_room_id: str,
             tail = rid.rsplit(".", 1)[-1][:6]
             names[rid] = f"{nm} #{tail}"
 
-    placed_names = [names[rid] for rid in same_z]
-    name_w = max((len(n) for n in placed_names), default=_MIN_NAME_W)
-    name_w = max(name_w, _MIN_NAME_W)
+    name_w = max((len(n) for n in names.values()), default=_MIN_NAME_W)
+    name_w = min(max(name_w, _MIN_NAME_W), _MAX_NAME_W)
     cell_w = name_w + 4
 
-    xs = [p[0] for p in same_z.values()]
-    ys = [p[1] for p in same_z.values()]
-    minx, maxx = min(xs), max(xs)
-    miny, maxy = min(ys), max(ys)
+    minx, maxx = cx - radius_x, cx + radius_x
+    miny, maxy = cy - radius_y, cy + radius_y
     cols = maxx - minx + 1
     rows = maxy - miny + 1
 
@@ -147,21 +192,19 @@ def render_map(world_id: str, current_room_id: str,
                 canvas[row][label_start + i] = ch
 
     for rid in same_z:
-        if rid not in label_span:
-            continue
         row_a, start_a, end_a = label_span[rid]
-        for direction, dest in graph.get(rid, {}).items():
+        for direction, dest in exits[rid].items():
             if dest not in label_span:
                 continue
-            delta = world_store.coord_delta(direction)
-            if delta is None or delta[2] != 0:
+            step = delta(direction)
+            if step is None or step[2] != 0:
                 continue
             row_b, start_b, _ = label_span[dest]
-            if delta[0] == 1 and row_a == row_b:  # east
+            if step[0] == 1 and row_a == row_b:  # east
                 for c in range(end_a, start_b):
                     if 0 <= c < canvas_w and canvas[row_a][c] == ' ':
                         canvas[row_a][c] = '─'
-            elif delta[1] == 1:  # south
+            elif step[1] == 1:  # south
                 center_col = (start_a + end_a) // 2
                 for r in range(row_a + 1, row_b):
                     if (0 <= r < canvas_h and 0 <= center_col < canvas_w
@@ -169,21 +212,19 @@ def render_map(world_id: str, current_room_id: str,
                         canvas[r][center_col] = '│'
 
     grid_lines = ["".join(r).rstrip() for r in canvas]
+    while grid_lines and not grid_lines[0]:
+        grid_lines.pop(0)
+    while grid_lines and not grid_lines[-1]:
+        grid_lines.pop()
     out = "\n".join(grid_lines)
 
-    cur_graph = graph.get(current_room_id, {})
     notes: list[str] = []
     for direction in ("up", "down"):
-        dest = cur_graph.get(direction)
-        if dest and dest in placed:
+        dest = exits[current_room_id].get(direction)
+        if dest:
             arrow = "↑" if direction == "up" else "↓"
-            notes.append(f"  {arrow} {direction}: {names.get(dest, dest)}")
+            dest_name = (_room_name(world_id, dest) if dest in visited else None) or "?"
+            notes.append(f"  {arrow} {direction}: {dest_name}")
     if notes:
         out += "\n\nVertical exits from here:\n" + "\n".join(notes)
-
-    if other_z:
-        out += "\n\nVisited rooms on other layers:"
-        for rid, z in other_z:
-            out += f"\n  • {names[rid]}  (z={z})"
-
     return out
@@ -14,6 +14,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import nachomud.world.store as world_store
+from nachomud.metrics import MOBS_TICKED
 from nachomud.rules.dice import random_chance, random_choice
 from nachomud.models import Mob
 from nachomud.world.directions import opposite as _opposite
@@ -204,7 +205,7 @@ def tick_mobs_for_rooms(world_id: str, active_rooms: set[str],
         return witnesses
 
     graph = world_store.load_graph(world_id)
-    mobs = world_store.load_mobs(world_id)
+    mobs, base = world_store.snapshot_mobs(world_id)
     if not mobs:
         return witnesses
 
@@ -216,15 +217,27 @@ def tick_mobs_for_rooms(world_id: str, active_rooms: set[str],
     # Pursue logic needs *some* target. Pick any active room.
     pursue_target = next(iter(active_rooms), "") if active_rooms else ""
 
+    MOBS_TICKED.inc(len(mobs) * minutes, world_id)
+    changed_ids: set[str] = set()
+    # Each mob's witness lines are kept apart until its move is committed.
+    seen: dict[str, dict[str, Witness]] = {}
     for _ in range(minutes):
-        changed_ids = []
         for mob_id, mob in list(mobs.items()):
             hot = mob.current_room in hot_room_ids
             if _tick_one_mob(mob, world_id, graph, pursue_target,
-                              witnesses, active_rooms, hot=hot):
-                changed_ids.append(mob_id)
-        if changed_ids:
-            world_store.save_mobs(world_id, mobs)
+                              seen.setdefault(mob_id, {}), active_rooms, hot=hot):
+                changed_ids.add(mob_id)
+    # Commands in other zones keep running while we tick, so only mobs
+    # nobody touched since the snapshot are written back — and only
+    # their moves are reported.
+    skipped = set(world_store.commit_mobs(world_id, (mobs[m] for m in changed_ids), base))
+    for mob_id, by_room in seen.items():
+        if mob_id in skipped:
+            continue
+        for room_id, w in by_room.items():
+            merged = witnesses.setdefault(room_id, Witness())
+            merged.entered.extend(w.entered)
+            merged.left.extend(w.left)
 
     return witnesses
 
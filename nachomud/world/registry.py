@@ -0,0 +1,312 @@
+"""WorldRegistry: one WorldLoop per world, booted on demand.
+
+Storage is already keyed by world_id; the registry gives each world its
+own running WorldLoop too — its own zone locks, mob tick and actors —
+so a private or themed world never waits on the shared one. The home
+world boots at startup, carries the four built-in agents and never
+sleeps. Any other world boots when the first character in it enters
+the game, and hibernates once it has sat empty for
+`WORLD_HIBERNATE_SECONDS`: its tick stops and the loop is dropped.
+Everything it owned is already on disk, so waking it is just a boot.
+
+The registry has the same surface server.py, Session and the IPC
+server call on a WorldLoop and routes each call to the loop that owns
+the actor. All loops share one subscriber list, so a viewer can switch
+between actors in different worlds, and the sidebar lists the actors
+of every running world.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Optional
+
+import nachomud.ai.llm as llm
+import nachomud.metrics as metrics
+import nachomud.world.lockprof as lockprof
+from nachomud.ai.agents import AGENT_DEFINITIONS
+from nachomud.ai.scheduler import AgentScheduler
+from nachomud.models import AgentState
+from nachomud.settings import WORLD_HIBERNATE_SECONDS
+from nachomud.world.loop import Actor, Subscriber, WorldLoop
+
+
+log = logging.getLogger("nachomud.registry")
+
+
+HOME_WORLD = "default"
+# How often idle worlds are checked for hibernation.
+REAP_INTERVAL_SECONDS = 30.0
+
+
+@dataclass
+class WorldRegistry:
+    home_world: str = HOME_WORLD
+    enable_agent_runner: bool = True
+    hibernate_seconds: float = WORLD_HIBERNATE_SECONDS
+    # Builds each world's loop; tests pass a partial with stub LLMs.
+    loop_factory: Callable[..., WorldLoop] = WorldLoop
+    clock: Callable[[], float] = time.monotonic
+
+    loops: dict[str, WorldLoop] = field(default_factory=dict)
+    subscribers: list[Subscriber] = field(default_factory=list)
+    # One scheduler for all worlds: humans anywhere share the LLM host
+    # with the home world's agents, so they all count as activity.
+    agent_scheduler: AgentScheduler = field(default_factory=AgentScheduler)
+    _started: dict[str, concurrent.futures.Future] = field(default_factory=dict)
+    _actor_world: dict[str, str] = field(default_factory=dict)
+    _idle_since: dict[str, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _event_loop: Optional[asyncio.AbstractEventLoop] = None
+    _reaper: Optional[asyncio.Task] = None
+    _preload: Optional[asyncio.Task] = None
+
+    # ── Lifecycle ──
+
+    async def start(self) -> None:
+        """Schedule the home world's boot and return without waiting for
+        it, so the server takes connections while the world warms up.
+        Viewers get the actor list once it's ready; anything that needs
+        a running world (entering the game) waits in `loop_for`."""
+        self._event_loop = asyncio.get_running_loop()
+        started_at = time.perf_counter()
+        with self._lock:
+            home = self._open(self.home_world)
+            started = self._started[self.home_world]
+        started.add_done_callback(lambda f: self._log_warm(f, started_at))
+        self._preload = asyncio.create_task(asyncio.to_thread(llm.preload),
+                                            name="registry.preload")
+        self._reaper = asyncio.create_task(self._reap_loop(), name="registry.reaper")
+        log.info("WorldRegistry started — home world %s warming up", home.world_id)
+
+    def _log_warm(self, started: concurrent.futures.Future, started_at: float) -> None:
+        if started.cancelled():
+            return
+        if started.exception() is not None:
+            log.error("home world failed to boot", exc_info=started.exception())
+            return
+        log.info("home world %s ready in %.0fms", self.home_world,
+                 (time.perf_counter() - started_at) * 1000)
+
+    @property
+    def ready(self) -> bool:
+        """Has the home world finished booting?"""
+        with self._lock:
+            started = self._started.get(self.home_world)
+        return (started is not None and started.done() and not started.cancelled()
+                and started.exception() is None)
+
+    async def wait_ready(self) -> None:
+        with self._lock:
+            started = self._started[self.home_world]
+        await asyncio.wrap_future(started)
+
+    async def stop(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._reaper
+            self._reaper = None
+        if self._preload is not None:
+            with contextlib.suppress(Exception):
+                await self._preload
+            self._preload = None
+        with self._lock:
+            loops = list(self.loops.values())
+            booting = list(self._started.values())
+            self.loops.clear()
+            self._started.clear()
+        # A world stopped mid-boot would go on to start its tick and agents.
+        for started in booting:
+            with contextlib.suppress(Exception):
+                await asyncio.wrap_future(started)
+        for loop in loops:
+            await loop.stop()
+
+    @property
+    def home(self) -> WorldLoop:
+        return self.loops[self.home_world]
+
+    def _open(self, world_id: str) -> WorldLoop:
+        """The loop for `world_id`, created and scheduled to start on the
+        event loop if it isn't running. Caller holds _lock."""
+        loop = self.loops.get(world_id)
+        if loop is None:
+            assert self._event_loop is not None, "WorldRegistry.start() first"
+            loop = self.loop_factory(
+                world_id=world_id,
+                enable_agent_runner=self.enable_agent_runner,
+                agent_definitions=(list(AGENT_DEFINITIONS)
+                                   if world_id == self.home_world else []),
+                subscribers=self.subscribers,
+                agent_scheduler=self.agent_scheduler,
+                actor_list_fn=self.list_actors,
+            )
+            self.loops[world_id] = loop
+            self._started[world_id] = asyncio.run_coroutine_threadsafe(
+                loop.start(), self._event_loop)
+            log.info("booting world %s", world_id)
+        self._idle_since.pop(world_id, None)
+        return loop
+
+    def loop_for(self, world_id: str) -> WorldLoop:
+        """The running loop for `world_id`, booting it if needed. Blocks
+        until it has started, so call it from a worker thread, not the
+        event loop."""
+        with self._lock:
+            loop = self._open(world_id or self.home_world)
+            started = self._started[loop.world_id]
+        started.result()
+        return loop
+
+    def _loop_of(self, actor_id: str) -> WorldLoop | None:
+        with self._lock:
+            world_id = self._actor_world.get(actor_id, self.home_world)
+            return self.loops.get(world_id)
+
+    # ── Hibernation ──
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(REAP_INTERVAL_SECONDS)
+            try:
+                await self.reap_idle()
+            except Exception:
+                log.exception("world hibernation sweep failed")
+
+    async def reap_idle(self) -> list[str]:
+        """Stop every non-home world that has had no actors for
+        `hibernate_seconds`. Returns the world ids put to sleep."""
+        now = self.clock()
+        sleeping: list[WorldLoop] = []
+        with self._lock:
+            for world_id, loop in list(self.loops.items()):
+                if world_id == self.home_world or loop.actors:
+                    self._idle_since.pop(world_id, None)
+                    continue
+                since = self._idle_since.setdefault(world_id, now)
+                if now - since >= self.hibernate_seconds:
+                    del self.loops[world_id]
+                    del self._idle_since[world_id]
+                    self._started.pop(world_id, None)
+                    sleeping.append(loop)
+        for loop in sleeping:
+            await loop.stop()
+            log.info("world %s hibernating", loop.world_id)
+        return [loop.world_id for loop in sleeping]
+
+    # ── WorldLoop surface, routed per actor ──
+
+    def register_human(self, state: AgentState) -> Actor:
+        loop = self.loop_for(state.world_id)
+        actor_id = f"human_{state.player_id}"
+        previous = self._loop_of(actor_id)
+        if previous is not None and previous is not loop:
+            previous.unregister_human(actor_id)
+        actor = loop.register_human(state)
+        with self._lock:
+            self._actor_world[actor.actor_id] = loop.world_id
+        return actor
+
+    def unregister_human(self, actor_id: str) -> None:
+        loop = self._loop_of(actor_id)
+        with self._lock:
+            self._actor_world.pop(actor_id, None)
+        if loop is not None:
+            loop.unregister_human(actor_id)
+
+    def get_actor(self, actor_id: str) -> Actor | None:
+        loop = self._loop_of(actor_id)
+        return loop.get_actor(actor_id) if loop is not None else None
+
+    def submit_command(self, actor_id: str, text: str, *, echo: bool = False) -> list:
+        loop = self._loop_of(actor_id)
+        if loop is None:
+            log.warning("submit_command for actor %s in no running world", actor_id)
+            return []
+        return loop.submit_command(actor_id, text, echo=echo)
+
+    def submit_moves(self, actor_id: str, texts: list[str]) -> list:
+        loop = self._loop_of(actor_id)
+        if loop is None:
+            log.warning("submit_moves for actor %s in no running world", actor_id)
+            return []
+        return loop.submit_moves(actor_id, texts)
+
+    def start_actor(self, actor_id: str) -> list:
+        loop = self._loop_of(actor_id)
+        return loop.start_actor(actor_id) if loop is not None else []
+
+    def list_actors(self) -> list[dict]:
+        with self._lock:
+            loops = list(self.loops.values())
+        return [a for loop in loops for a in loop.list_actors()]
+
+    def actor_list_event(self) -> dict:
+        return {"type": "actor_list", "actors": self.list_actors()}
+
+    def explored_rooms(self, world_id: str | None = None) -> tuple[str, list[str]] | None:
+        """Like WorldLoop.explored_rooms for one world (home by default),
+        or None unless that world is running. A hibernating world has
+        nobody in it to have explored anything, and an id that isn't a
+        running world is never handed on to the map cache."""
+        world_id = world_id or self.home_world
+        with self._lock:
+            loop = self.loops.get(world_id)
+        return loop.explored_rooms() if loop is not None else None
+
+    def lock_report(self) -> dict:
+        """Zone locks held right now and the slowest critical sections,
+        across every world (they share one profiler)."""
+        return lockprof.PROFILER.snapshot()
+
+    def metrics_text(self) -> str:
+        """Sample the gauges that are read rather than recorded (viewer
+        queues, actors per world, agent pacing, LLM cache sizes), then
+        render every metric. Cache hits, misses and evictions are counted
+        as they happen."""
+        depths = [s.queue.qsize() for s in list(self.subscribers)]
+        metrics.SUBSCRIBERS.set(len(depths))
+        metrics.SUBSCRIBER_QUEUE_DEPTH.set(sum(depths), "total")
+        metrics.SUBSCRIBER_QUEUE_DEPTH.set(max(depths, default=0), "max")
+        with self._lock:
+            loops = list(self.loops.values())
+        for gauge in (metrics.WORLD_ACTORS, metrics.AGENT_INTERVAL_SECONDS,
+                      metrics.AGENT_TICKS_PER_MINUTE, metrics.AGENT_PAUSED,
+                      metrics.LLM_CACHE_ENTRIES):
+            gauge.clear()
+        # Every world has its own NPC reply cache under one name; sum them.
+        sizes: dict[str, int] = {}
+        for cache in [*llm.response_caches(), *(loop.npc_reply_cache for loop in loops)]:
+            sizes[cache.name] = sizes.get(cache.name, 0) + cache.metrics()["size"]
+        for name, size in sizes.items():
+            metrics.LLM_CACHE_ENTRIES.set(size, name)
+        for loop in loops:
+            metrics.WORLD_ACTORS.set(len(loop.actors), loop.world_id)
+            if loop.agent_scheduler is None:
+                continue
+            pacing = loop.agent_scheduler.metrics()
+            metrics.AGENT_INTERVAL_SECONDS.set(pacing["interval_seconds"], loop.world_id)
+            metrics.AGENT_TICKS_PER_MINUTE.set(pacing["ticks_per_minute"], loop.world_id, "actual")
+            metrics.AGENT_TICKS_PER_MINUTE.set(pacing["target_ticks_per_minute"],
+                                               loop.world_id, "target")
+            metrics.AGENT_PAUSED.set(pacing["paused_agents"], loop.world_id)
+        return metrics.render()
+
+    # ── Subscribers (shared by every loop) ──
+
+    def add_subscriber(self, queue: asyncio.Queue) -> Subscriber:
+        return self.home.add_subscriber(queue)
+
+    def remove_subscriber(self, sub: Subscriber) -> None:
+        self.home.remove_subscriber(sub)
+
+    def set_subscription(self, sub: Subscriber, actor_id: str) -> bool:
+        loop = self._loop_of(actor_id) if actor_id else self.home
+        return loop is not None and loop.set_subscription(sub, actor_id)
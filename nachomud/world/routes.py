@@ -0,0 +1,145 @@
+"""Route planning over the rooms an actor has explored.
+
+`RouteIndex` backs the `travel` command. It keeps the explored subgraph
+(the actor's visited rooms and the exits between them) and one
+shortest-path tree per start room asked about so far. Exploring only
+ever adds rooms and exits, and an added exit can only shorten paths, so
+instead of replanning, each cached tree is relaxed outward from the new
+exit. A tree is dropped only when an exit is re-pointed somewhere else,
+which can make paths longer.
+
+New exits are picked up when `world_store.graph_version` moves (every
+`add_edge` rewrites graph.json); new rooms when `visited_rooms` grows.
+Room names never change once a room exists, so each is read once.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+import nachomud.world.store as world_store
+
+
+# Start rooms whose shortest-path trees are kept; the oldest goes first.
+MAX_TREES = 32
+
+
+@dataclass
+class RouteIndex:
+    world_id: str
+    names: dict[str, str] = field(default_factory=dict)
+    # Explored subgraph: room -> {direction: room}, both ends explored.
+    exits: dict[str, dict[str, str]] = field(default_factory=dict)
+    # start room -> {room: (steps, previous room, direction taken)}
+    _trees: dict[str, dict[str, tuple[int, str, str]]] = field(default_factory=dict)
+    _graph: dict[str, dict[str, str]] = field(default_factory=dict)
+    _incoming: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    _graph_key: tuple = ()
+    _visited_seen: int = 0
+
+    def sync(self, visited_rooms: list[str], here: str) -> None:
+        """Catch up with the world graph and with rooms visited since the
+        last call. `visited_rooms` is append-only, so only its tail is read."""
+        key = world_store.graph_version(self.world_id)
+        if key != self._graph_key:
+            self._graph_key = key
+            self._graph = world_store.load_graph(self.world_id)
+            self._incoming = {}
+            for src, out in self._graph.items():
+                for direction, dest in out.items():
+                    self._incoming.setdefault(dest, []).append((src, direction))
+            for room_id in list(self.names):
+                self._link(room_id)
+        fresh = visited_rooms[self._visited_seen:]
+        self._visited_seen = len(visited_rooms)
+        for room_id in [*fresh, here]:
+            if room_id and room_id not in self.names:
+                self._add_room(room_id)
+
+    def find(self, query: str) -> list[str]:
+        """Explored rooms matching `query`: an exact name (or room id) if
+        there is one, otherwise every name containing it."""
+        q = query.strip().lower()
+        exact = [rid for rid, name in self.names.items() if q in (name.lower(), rid.lower())]
+        if exact:
+            return exact
+        return [rid for rid, name in self.names.items() if q in name.lower()]
+
+    def route(self, start: str, goal: str) -> list[str] | None:
+        """Directions from `start` to `goal` through explored rooms only,
+        fewest steps first; None if they aren't connected that way."""
+        tree = self._trees.get(start)
+        if tree is None:
+            tree = self._grow(start)
+        if goal not in tree:
+            return None
+        steps: list[str] = []
+        while goal != start:
+            _, goal, direction = tree[goal]
+            steps.append(direction)
+        steps.reverse()
+        return steps
+
+    # ── Maintenance ──
+
+    def _add_room(self, room_id: str) -> None:
+        try:
+            self.names[room_id] = world_store.load_room(self.world_id, room_id).name or room_id
+        except Exception:
+            return
+        self.exits.setdefault(room_id, {})
+        self._link(room_id)
+
+    def _link(self, room_id: str) -> None:
+        """Add every graph exit between `room_id` and explored rooms."""
+        for direction, dest in self._graph.get(room_id, {}).items():
+            if isinstance(dest, str) and dest in self.names:
+                self._add_exit(room_id, direction, dest)
+        for src, direction in self._incoming.get(room_id, ()):
+            if src in self.names:
+                self._add_exit(src, direction, room_id)
+
+    def _add_exit(self, src: str, direction: str, dest: str) -> None:
+        out = self.exits.setdefault(src, {})
+        known = out.get(direction)
+        if known == dest:
+            return
+        out[direction] = dest
+        if known is not None:
+            self._trees.clear()
+            return
+        for tree in self._trees.values():
+            if src in tree:
+                self._relax(tree, src, direction, dest)
+
+    def _relax(self, tree: dict[str, tuple[int, str, str]],
+               src: str, direction: str, dest: str) -> None:
+        """Shorten `tree` through the new exit src→dest, then onward from
+        every room whose distance that improved."""
+        steps = tree[src][0] + 1
+        if dest in tree and tree[dest][0] <= steps:
+            return
+        tree[dest] = (steps, src, direction)
+        frontier = deque([dest])
+        while frontier:
+            room_id = frontier.popleft()
+            steps = tree[room_id][0] + 1
+            for d, nxt in self.exits.get(room_id, {}).items():
+                if nxt not in tree or tree[nxt][0] > steps:
+                    tree[nxt] = (steps, room_id, d)
+                    frontier.append(nxt)
+
+    def _grow(self, start: str) -> dict[str, tuple[int, str, str]]:
+        tree: dict[str, tuple[int, str, str]] = {start: (0, start, "")}
+        frontier = deque([start])
+        while frontier:
+            room_id = frontier.popleft()
+            steps = tree[room_id][0] + 1
+            for direction, nxt in sorted(self.exits.get(room_id, {}).items()):
+                if nxt not in tree:
+                    tree[nxt] = (steps, room_id, direction)
+                    frontier.append(nxt)
+        if len(self._trees) >= MAX_TREES:
+            del self._trees[next(iter(self._trees))]
+        self._trees[start] = tree
+        return tree
@@ -0,0 +1,190 @@
+"""Map coordinates and the spatial index over them.
+
+Every room gets an integer (x, y, z) when it's created: one step from
+the room it was reached from, in the direction taken. If that cell is
+already taken (the world graph isn't a grid — loops don't have to close)
+the room is pushed further along the same direction, keeping it in line
+with its source so the connector still draws; past `MAX_STRETCH` cells
+it stays off the grid (coords None) and only shows in the text listing.
+
+The room file is the source of truth for coords. `spatial.json` is a
+derived lookup (room_id → coords) loaded into a `SpatialIndex`, which
+buckets rooms into BUCKET x BUCKET tiles per z-layer so a viewport query
+touches only the tiles it overlaps. A newly generated room's coords are
+appended to `spatial.log` rather than rewriting the whole file; the log
+is folded back into spatial.json once it passes `LOG_COMPACT_BYTES`.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+
+import nachomud.world.store as world_store
+from nachomud.world.directions import delta
+
+Coords = tuple[int, int, int]
+
+BUCKET = 16
+MAX_STRETCH = 4
+LOG_COMPACT_BYTES = 256 * 1024
+
+
+@dataclass
+class SpatialIndex:
+    coords: dict[str, Coords] = field(default_factory=dict)
+    _by_cell: dict[Coords, str] = field(default_factory=dict)
+    _buckets: dict[Coords, set[str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for rid, c in list(self.coords.items()):
+            self._index(rid, c)
+
+    @staticmethod
+    def _bucket(c: Coords) -> Coords:
+        return (c[0] // BUCKET, c[1] // BUCKET, c[2])
+
+    def _index(self, room_id: str, c: Coords) -> None:
+        self._by_cell[c] = room_id
+        self._buckets.setdefault(self._bucket(c), set()).add(room_id)
+
+    def add(self, room_id: str, c: Coords) -> None:
+        old = self.coords.get(room_id)
+        if old is not None:
+            self._buckets[self._bucket(old)].discard(room_id)
+            if self._by_cell.get(old) == room_id:
+                del self._by_cell[old]
+        self.coords[room_id] = c
+        self._index(room_id, c)
+
+    def at(self, c: Coords) -> str | None:
+        return self._by_cell.get(c)
+
+    def place(self, origin: Coords | None, direction: str) -> Coords | None:
+        """First free cell stepping from `origin` towards `direction`."""
+        step = delta(direction)
+        if origin is None or step is None:
+            return None
+        x, y, z = origin
+        for _ in range(MAX_STRETCH):
+            x, y, z = x + step[0], y + step[1], z + step[2]
+            if (x, y, z) not in self._by_cell:
+                return (x, y, z)
+        return None
+
+    def query(self, z: int, x0: int, y0: int, x1: int, y1: int) -> dict[str, Coords]:
+        """Rooms on layer `z` inside the inclusive box (x0, y0)-(x1, y1)."""
+        out: dict[str, Coords] = {}
+        for bx in range(x0 // BUCKET, x1 // BUCKET + 1):
+            for by in range(y0 // BUCKET, y1 // BUCKET + 1):
+                for rid in self._buckets.get((bx, by, z), ()):
+                    x, y, _ = self.coords[rid]
+                    if x0 <= x <= x1 and y0 <= y <= y1:
+                        out[rid] = self.coords[rid]
+        return out
+
+
+# spatial.json path -> (signature of it and the log, index). Re-read
+# only when either file changes, so a map render doesn't re-parse them.
+_cache: dict[str, tuple[tuple, SpatialIndex]] = {}
+_cache_lock = Lock()
+
+
+def _stat(path: str) -> tuple:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _signature(world_id: str) -> tuple:
+    return (_stat(world_store.spatial_path(world_id)),
+            _stat(world_store.spatial_log_path(world_id)))
+
+
+def load_index(world_id: str) -> SpatialIndex:
+    path = world_store.spatial_path(world_id)
+    with _cache_lock:
+        sig = _signature(world_id)
+        hit = _cache.get(path)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        index = SpatialIndex(coords=world_store.load_spatial(world_id))
+        _cache[path] = (sig, index)
+        return index
+
+
+def _remember(world_id: str, index: SpatialIndex) -> None:
+    with _cache_lock:
+        _cache[world_store.spatial_path(world_id)] = (_signature(world_id), index)
+
+
+def save_index(world_id: str, index: SpatialIndex) -> None:
+    world_store.save_spatial(world_id, index.coords)
+    _remember(world_id, index)
+
+
+def claim(world_id: str, origin: Coords | None, direction: str,
+          room_id: str) -> Coords | None:
+    """Pick coords for a room being created `direction` of `origin` and
+    record them in the index. Returns None if it can't be placed."""
+    with world_store.registry_lock:
+        index = load_index(world_id)
+        c = index.place(origin, direction)
+        if c is not None:
+            index.add(room_id, c)
+            world_store.append_spatial(world_id, room_id, c)
+            if _stat(world_store.spatial_log_path(world_id))[1] > LOG_COMPACT_BYTES:
+                save_index(world_id, index)
+            else:
+                _remember(world_id, index)
+    return c
+
+
+def layout_world(world_id: str, root: str) -> int:
+    """Give coords to every room reachable from `root` that lacks them
+    (the starter town, worlds generated before rooms had coords) and
+    bring the index in line with the room files. Returns how many rooms
+    were newly placed. Cheap once everything is placed: no room file is
+    read for rooms the index already knows."""
+    index = load_index(world_id)
+    graph = world_store.load_graph(world_id)
+    placed = 0
+    changed = False
+
+    def adopt(rid: str, origin: Coords | None, direction: str) -> bool:
+        nonlocal placed, changed
+        room = world_store.load_room(world_id, rid)
+        c = room.coords
+        if c is None or index.at(c) not in (None, rid):
+            c = index.place(origin, direction) if origin is not None else (
+                (0, 0, 0) if index.at((0, 0, 0)) is None else None)
+            if c is None:
+                return False
+            world_store.set_room_coords(world_id, rid, c)
+            placed += 1
+        index.add(rid, c)
+        changed = True
+        return True
+
+    if root not in index.coords and world_store.room_exists(world_id, root):
+        adopt(root, None, "")
+    queue = deque(rid for rid in index.coords if rid in graph)
+    seen = set(queue)
+    while queue:
+        rid = queue.popleft()
+        for direction, dest in sorted(graph.get(rid, {}).items()):
+            if not isinstance(dest, str) or dest in seen:
+                continue
+            seen.add(dest)
+            if dest not in index.coords:
+                if not world_store.room_exists(world_id, dest):
+                    continue
+                if not adopt(dest, index.coords[rid], direction):
+                    continue
+            queue.append(dest)
+    if changed:
+        save_index(world_id, index)
+    return placed
@@ -6,9 +6,11 @@ that already exist (so player progress isn't blown away on reboot).
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 
+import nachomud.world.spatial as spatial
 import nachomud.world.store as world_store
 from nachomud.models import NPC, Room
 
@@ -23,6 +25,13 @@ def load_starter_doc(name: str = "silverbrook") -> dict:
         return json.load(f)
 
 
+def _room_hash(room_doc: dict, npcs: list[NPC]) -> str:
+    """Digest of everything the starter JSON puts into one room."""
+    blob = json.dumps({"room": room_doc, "npcs": [world_store.npc_to_dict(n) for n in npcs]},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
 def seed_world(world_id: str = "default", town: str = "silverbrook",
                refresh: bool = True) -> int:
     """Seed the world's rooms + graph from the named starter town.
@@ -30,7 +39,11 @@ def seed_world(world_id: str = "default", town: str = "silverbrook",
     Starter-town rooms are *hand-authored canonical content* — they belong to
     the developer, not to the procedural world. By default this refreshes them
     on every boot, picking up any JSON edits (new NPCs, new wares, fixed
-    descriptions) while preserving the room's mutable flags (e.g. door_unlocked).
+    descriptions) while preserving the room's mutable flags (e.g. door_unlocked)
+    and map coords. A room whose authored content hashes the same as at
+    its last refresh (digests kept in the world's meta) is left alone, so
+    a reboot with no JSON edits writes nothing. Finishes by laying out
+    anything reachable from the spawn room that has no coords yet.
 
     Pass refresh=False to behave like the old idempotent seed (skip existing
     rooms entirely).
@@ -70,15 +83,22 @@ def seed_world(world_id: str = "default", town: str = "silverbrook",
             npcs_by_starting_location.setdefault(location, []).append(npc)
 
     # Persist rooms
+    meta = world_store.load_meta(world_id)
+    hashes: dict[str, str] = dict(meta.get("starter_hashes") or {})
     written = 0
     for r in doc["rooms"]:
         rid = r["room_id"]
+        npcs = npcs_by_starting_location.get(rid, [])
+        digest = _room_hash(r, npcs)
         existing_flags: dict[str, bool] = {}
+        existing_coords = None
         if world_store.room_exists(world_id, rid):
-            if not refresh:
+            if not refresh or hashes.get(rid) == digest:
                 continue
             try:
-                existing_flags = dict(world_store.load_room(world_id, rid).flags)
+                existing = world_store.load_room(world_id, rid)
+                existing_flags = dict(existing.flags)
+                existing_coords = existing.coords
             except Exception:
                 existing_flags = {}
 
@@ -92,19 +112,32 @@ def seed_world(world_id: str = "default", town: str = "silverbrook",
             description=r["description"],
             exits=dict(r.get("exits", {})),
             zone_tag=r.get("zone_tag", ""),
-            npcs=npcs_by_starting_location.get(rid, []),
+            npcs=npcs,
             flags=flags,
+            coords=existing_coords,
         )
         world_store.save_room(world_id, room)
+        hashes[rid] = digest
         written += 1
+    if hashes != meta.get("starter_hashes"):
+        world_store.save_meta(world_id, {**meta, "starter_hashes": hashes})
 
-    # Persist graph (always, idempotently)
+    # Persist graph (idempotently; untouched when every edge is there)
     g = world_store.load_graph(world_id)
+    graph_changed = False
     for r in doc["rooms"]:
         rid = r["room_id"]
+        exits = g.get(rid)
+        if exits is None:
+            exits = g[rid] = {}
+            graph_changed = True
         for direction, dest in r.get("exits", {}).items():
-            g.setdefault(rid, {})[direction] = dest
-    world_store.save_graph(world_id, g)
+            if exits.get(direction) != dest:
+                exits[direction] = dest
+                graph_changed = True
+    if graph_changed:
+        world_store.save_graph(world_id, g)
+    spatial.layout_world(world_id, starter_spawn_room(town))
 
     return written
 
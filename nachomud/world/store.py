@@ -2,20 +2,32 @@
 
 Three first-class stores per world (DESIGN.md §8):
   data/world/<world_id>/rooms/<room_id>.json   — immutable skeleton + flags
+                                                 (+ cached "look at" narration)
   data/world/<world_id>/mobs.json              — all mob instances by mob_id
   data/world/<world_id>/items.json             — all item instances by item_id
   data/world/<world_id>/graph.json             — adjacency map
+  data/world/<world_id>/spatial.json           — room_id → map coords
+                                                 (derived; see world/spatial.py)
+  data/world/<world_id>/spatial.log            — coords placed since
+                                                 spatial.json was last written
   data/world/<world_id>/meta.json              — world-level metadata
 
 Plus a hand-authored `factions.json` (read-only, optional override).
 
 All writes are atomic (write to .tmp, rename) so a crash mid-write can't leave
 a partial file. All loads route through `migrations.migrate()`.
+
+mobs.json, items.json and graph.json are shared by every zone, and the
+WorldLoop runs commands in different zones concurrently, so their
+read-modify-write helpers run under `registry_lock`.
 """
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import threading
+from collections.abc import Iterable
 from dataclasses import asdict, fields
 from typing import Any
 
@@ -28,6 +40,10 @@ SCHEMA_VERSION_MOB = 1
 SCHEMA_VERSION_ITEM = 1
 SCHEMA_VERSION_GRAPH = 1
 SCHEMA_VERSION_META = 1
+SCHEMA_VERSION_SPATIAL = 1
+
+# Serializes read-modify-write of the world-wide registry files.
+registry_lock = threading.RLock()
 
 # ── Paths ──
 DATA_ROOT = os.environ.get("NACHOMUD_DATA_ROOT", os.path.join("data", "world"))
@@ -119,6 +135,7 @@ def room_to_dict(room: Room) -> dict:
         "zone_tag": room.zone_tag,
         "spawned_npcs": [npc_to_dict(n) for n in room.npcs],
         "state": {"flags": dict(room.flags)},
+        "coords": list(room.coords) if room.coords is not None else None,
         "schema_version": SCHEMA_VERSION_ROOM,
     }
 
@@ -127,6 +144,7 @@ def room_from_dict(d: dict) -> Room:
     d = migrate("room", dict(d), SCHEMA_VERSION_ROOM)
     npcs = [npc_from_dict(n) for n in d.get("spawned_npcs", [])]
     flags = d.get("state", {}).get("flags", {})
+    coords = d.get("coords")
     return Room(
         id=d["room_id"],
         name=d.get("name", d["room_id"]),
@@ -135,6 +153,7 @@ def room_from_dict(d: dict) -> Room:
         zone_tag=d.get("zone_tag", ""),
         npcs=npcs,
         flags=dict(flags),
+        coords=tuple(coords) if coords is not None else None,
     )
 
 
@@ -158,12 +177,53 @@ def room_exists(world_id: str, room_id: str) -> bool:
 
 
 def update_room_flags(world_id: str, room_id: str, flags: dict[str, bool]) -> None:
-    """Merge `flags` into the room's mutable state.flags dict."""
+    """Merge `flags` into the room's mutable state.flags dict. Drops any
+    cached narration — it described the room before the change."""
+    payload = _read_json(room_path(world_id, room_id))
+    state = payload.setdefault("state", {})
+    state.setdefault("flags", {}).update(flags)
+    state.pop("narration", None)
+    _atomic_write_json(room_path(world_id, room_id), payload)
+
+
+def set_room_coords(world_id: str, room_id: str, coords: tuple[int, int, int]) -> None:
+    """Place an existing room on the map grid, leaving the rest of its
+    file (flags, cached narration) untouched."""
     payload = _read_json(room_path(world_id, room_id))
-    payload.setdefault("state", {}).setdefault("flags", {}).update(flags)
+    payload["coords"] = list(coords)
     _atomic_write_json(room_path(world_id, room_id), payload)
 
 
+# Most targets a room remembers narration for; the oldest goes first.
+ROOM_NARRATION_CAP = 32
+
+
+def get_room_narration(world_id: str, room_id: str, target: str, key: str) -> str | None:
+    """Cached DM narration for `target` in this room, if it was generated
+    under the same `key` (flags + presence digest)."""
+    try:
+        payload = _read_json(room_path(world_id, room_id))
+    except (OSError, ValueError):
+        return None
+    entry = payload.get("state", {}).get("narration", {}).get(target)
+    if entry and entry.get("key") == key:
+        return entry.get("text")
+    return None
+
+
+def put_room_narration(world_id: str, room_id: str, target: str, key: str, text: str) -> None:
+    path = room_path(world_id, room_id)
+    if not os.path.isfile(path):
+        return
+    payload = _read_json(path)
+    cache = payload.setdefault("state", {}).setdefault("narration", {})
+    cache.pop(target, None)
+    cache[target] = {"key": key, "text": text}
+    while len(cache) > ROOM_NARRATION_CAP:
+        cache.pop(next(iter(cache)))
+    _atomic_write_json(path, payload)
+
+
 def list_rooms(world_id: str) -> list[str]:
     d = rooms_dir(world_id)
     if not os.path.isdir(d):
@@ -196,9 +256,71 @@ def get_mob(world_id: str, mob_id: str) -> Mob | None:
 
 
 def update_mob(world_id: str, mob: Mob) -> None:
-    mobs = load_mobs(world_id)
-    mobs[mob.mob_id] = mob
-    save_mobs(world_id, mobs)
+    update_mobs(world_id, [mob])
+
+
+def update_mobs(world_id: str, mobs: Iterable[Mob]) -> None:
+    """Write several mobs in one atomic read-modify-write of mobs.json:
+    one parse and one rewrite of the whole file however many mobs
+    changed, so the cost still grows with the world's mob count. Other
+    entries are carried over as parsed JSON without building Mob objects."""
+    changed = {m.mob_id: mob_to_dict(m) for m in mobs}
+    if not changed:
+        return
+    path = mobs_path(world_id)
+    with registry_lock:
+        raw = _read_json(path) if os.path.isfile(path) else {}
+        raw.update(changed)
+        _ensure_world_dirs(world_id)
+        _atomic_write_json(path, raw)
+
+
+def patch_mobs(world_id: str, patches: dict[str, dict]) -> None:
+    """Write only the given fields of each mob ({mob_id: {field: value}})
+    in one read-modify-write of mobs.json. Fields nobody patched keep
+    what's on disk, so combat writing hp doesn't undo a move the mob
+    tick committed meanwhile. Mobs no longer in the registry are skipped."""
+    patches = {mid: fields for mid, fields in patches.items() if fields}
+    if not patches:
+        return
+    path = mobs_path(world_id)
+    with registry_lock:
+        raw = _read_json(path) if os.path.isfile(path) else {}
+        for mid, fields in patches.items():
+            if mid in raw:
+                raw[mid] = {**raw[mid], **fields}
+        _ensure_world_dirs(world_id)
+        _atomic_write_json(path, raw)
+
+
+def snapshot_mobs(world_id: str) -> tuple[dict[str, Mob], dict[str, dict]]:
+    """(mobs, their raw JSON) — the raw half is the `base` for commit_mobs."""
+    path = mobs_path(world_id)
+    raw = _read_json(path) if os.path.isfile(path) else {}
+    return {mid: mob_from_dict(d) for mid, d in raw.items()}, raw
+
+
+def commit_mobs(world_id: str, mobs: Iterable[Mob], base: dict[str, dict]) -> list[str]:
+    """Compare-and-set write: each mob is written only if its entry on
+    disk still matches `base`, so work computed from a snapshot never
+    overwrites a change another writer made since. Returns the ids
+    that were skipped."""
+    changed = {m.mob_id: mob_to_dict(m) for m in mobs}
+    if not changed:
+        return []
+    path = mobs_path(world_id)
+    skipped = []
+    with registry_lock:
+        raw = _read_json(path) if os.path.isfile(path) else {}
+        for mid, d in changed.items():
+            if raw.get(mid) == base.get(mid):
+                raw[mid] = d
+            else:
+                skipped.append(mid)
+        if len(skipped) < len(changed):
+            _ensure_world_dirs(world_id)
+            _atomic_write_json(path, raw)
+    return skipped
 
 
 def add_mob(world_id: str, mob: Mob) -> None:
@@ -242,21 +364,29 @@ def get_item(world_id: str, item_id: str) -> dict | None:
 
 def add_item(world_id: str, item_id: str, item: Item, location: str) -> None:
     """Register a new item instance at `location` (e.g. 'room:silverbrook.smithy')."""
-    items = load_items(world_id)
-    payload = item_to_dict(item) or {}
-    payload["item_id"] = item_id
-    payload["location"] = location
-    payload["schema_version"] = SCHEMA_VERSION_ITEM
-    items[item_id] = payload
-    save_items(world_id, items)
+    add_items(world_id, [(item_id, item, location)])
+
+
+def add_items(world_id: str, entries: Iterable[tuple[str, Item, str]]) -> None:
+    """Register several (item_id, item, location) instances in one write."""
+    with registry_lock:
+        items = load_items(world_id)
+        for item_id, item, location in entries:
+            payload = item_to_dict(item) or {}
+            payload["item_id"] = item_id
+            payload["location"] = location
+            payload["schema_version"] = SCHEMA_VERSION_ITEM
+            items[item_id] = payload
+        save_items(world_id, items)
 
 
 def update_item_location(world_id: str, item_id: str, new_location: str) -> None:
-    items = load_items(world_id)
-    if item_id not in items:
-        raise KeyError(f"Unknown item: {item_id}")
-    items[item_id]["location"] = new_location
-    save_items(world_id, items)
+    with registry_lock:
+        items = load_items(world_id)
+        if item_id not in items:
+            raise KeyError(f"Unknown item: {item_id}")
+        items[item_id]["location"] = new_location
+        save_items(world_id, items)
 
 
 def items_in_room(world_id: str, room_id: str) -> list[dict]:
@@ -285,6 +415,17 @@ def load_graph(world_id: str) -> dict[str, dict[str, str]]:
     return raw
 
 
+def graph_version(world_id: str) -> tuple[int, int, int]:
+    """Changes whenever graph.json is rewritten — every new room adds an
+    edge — so callers can cache anything derived from the graph. Stat
+    based so it also sees writes from another process."""
+    try:
+        st = os.stat(graph_path(world_id))
+    except OSError:
+        return (0, 0, 0)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def save_graph(world_id: str, graph: dict[str, dict[str, str]]) -> None:
     _ensure_world_dirs(world_id)
     payload = dict(graph)
@@ -294,19 +435,68 @@ def save_graph(world_id: str, graph: dict[str, dict[str, str]]) -> None:
 
 def add_edge(world_id: str, from_room: str, direction: str, to_room: str,
              bidirectional: bool = True) -> None:
-    g = load_graph(world_id)
-    g.setdefault(from_room, {})[direction] = to_room
-    if bidirectional:
-        opp = opposite_direction(direction)
-        if opp:
-            g.setdefault(to_room, {})[opp] = from_room
-    save_graph(world_id, g)
+    with registry_lock:
+        g = load_graph(world_id)
+        g.setdefault(from_room, {})[direction] = to_room
+        if bidirectional:
+            opp = opposite_direction(direction)
+            if opp:
+                g.setdefault(to_room, {})[opp] = from_room
+        save_graph(world_id, g)
 
 
 # Re-exported for back-compat with code that calls world_store.opposite_direction.
 from nachomud.world.directions import opposite as opposite_direction  # noqa: E402
 
 
+# ── Spatial index ──
+
+def spatial_path(world_id: str) -> str:
+    return os.path.join(world_dir(world_id), "spatial.json")
+
+
+def spatial_log_path(world_id: str) -> str:
+    return os.path.join(world_dir(world_id), "spatial.log")
+
+
+def load_spatial(world_id: str) -> dict[str, tuple[int, int, int]]:
+    """spatial.json plus every placement appended to spatial.log since."""
+    path = spatial_path(world_id)
+    coords: dict[str, tuple[int, int, int]] = {}
+    if os.path.isfile(path):
+        raw = _read_json(path)
+        coords = {rid: tuple(c) for rid, c in raw.get("rooms", {}).items()}
+    try:
+        with open(spatial_log_path(world_id)) as f:
+            for line in f:
+                try:
+                    rid, c = json.loads(line)
+                except ValueError:
+                    continue        # torn last line from a crash mid-append
+                coords[rid] = tuple(c)
+    except FileNotFoundError:
+        pass
+    return coords
+
+
+def append_spatial(world_id: str, room_id: str, coords: tuple[int, int, int]) -> None:
+    """Record one room's coords without rewriting spatial.json."""
+    _ensure_world_dirs(world_id)
+    with open(spatial_log_path(world_id), "a") as f:
+        f.write(json.dumps([room_id, list(coords)]) + "\n")
+
+
+def save_spatial(world_id: str, coords: dict[str, tuple[int, int, int]]) -> None:
+    """Write every room's coords to spatial.json and start a fresh log."""
+    _ensure_world_dirs(world_id)
+    _atomic_write_json(spatial_path(world_id), {
+        "rooms": {rid: list(c) for rid, c in coords.items()},
+        "schema_version": SCHEMA_VERSION_SPATIAL,
+    })
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(spatial_log_path(world_id))
+
+
 # ── Meta ──
 
 def meta_path(world_id: str) -> str:
@@ -0,0 +1,164 @@
+"""Deterministic synthetic worlds, no LLM required.
+
+Rooms normally only appear when WorldGen asks the DM for one, so there
+is no way to see how the stores, mob tick, map or broadcast behave at
+10k+ rooms. `synthesize_world` grows a world of any size from a seed
+and writes it through the same world_store calls the live game reads:
+one file per room, then graph.json, mobs.json, items.json and the
+spatial index in a single write each.
+
+The layout is a random growth on the map grid: every room sits on its
+own cell, most edges lead to a new cell, and a fraction of attempts
+that hit an existing neighbour close a loop instead, so the graph has
+cycles like a hand-walked world. Zones are square regions of the grid.
+
+    python -m nachomud.world.synth --rooms 10000 --world synth10k
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import dataclass
+
+import nachomud.world.spatial as spatial
+import nachomud.world.store as world_store
+from nachomud.models import Item, Mob, Room
+from nachomud.world.directions import DELTAS, opposite
+
+# Cells per side of a zone.
+ZONE_SIZE = 12
+
+MOB_KINDS: list[dict] = [
+    {"name": "Goblin", "hp": 7, "ac": 13, "damage_die": "1d6", "damage_bonus": 2,
+     "faction": "goblin_clan", "xp_value": 25},
+    {"name": "Wolf", "hp": 11, "ac": 13, "damage_die": "2d4", "damage_bonus": 2,
+     "faction": "wild_beast", "xp_value": 50},
+    {"name": "Bandit", "hp": 11, "ac": 12, "damage_die": "1d6", "damage_bonus": 1,
+     "faction": "bandits", "xp_value": 25},
+]
+ITEM_KINDS: list[dict] = [
+    {"name": "Rusty Dagger", "slot": "weapon", "damage_die": "1d4", "damage_type": "piercing"},
+    {"name": "Leather Scrap", "slot": "armor", "armor_base": 11},
+    {"name": "Healing Draught", "slot": "consumable"},
+]
+
+_HORIZONTAL = ("north", "south", "east", "west")
+
+
+@dataclass
+class SynthReport:
+    world_id: str
+    rooms: int
+    edges: int
+    mobs: int
+    items: int
+    root: str
+
+
+def _zone(x: int, y: int) -> str:
+    return f"zone_{x // ZONE_SIZE}_{y // ZONE_SIZE}".replace("-", "m")
+
+
+def synthesize_world(world_id: str, rooms: int, *, seed: int = 0,
+                     mob_density: float = 0.3, item_density: float = 0.2,
+                     loop_chance: float = 0.15, vertical_chance: float = 0.02) -> SynthReport:
+    """Write a `rooms`-room world into `world_id`, which should be
+    empty. Same arguments, same world."""
+    if rooms < 1:
+        raise ValueError("rooms must be >= 1")
+    rng = random.Random(seed)
+    world_store.init_world(world_id, seed=seed, theme="synthetic")
+
+    index = spatial.SpatialIndex()
+    graph: dict[str, dict[str, str]] = {}
+    ids: list[str] = []
+
+    def new_room(c: tuple[int, int, int]) -> str:
+        rid = f"{_zone(c[0], c[1])}.r{len(ids):06d}"
+        ids.append(rid)
+        index.add(rid, c)
+        graph[rid] = {}
+        return rid
+
+    root = new_room((0, 0, 0))
+    frontier = [root]
+    tried: set[tuple[str, str]] = set()
+    while len(ids) < rooms:
+        pos = rng.randrange(len(frontier))
+        src = frontier[pos]
+        dirs = _HORIZONTAL + (("up", "down") if rng.random() < vertical_chance else ())
+        free = [d for d in dirs if d not in graph[src] and (src, d) not in tried]
+        if not free:
+            frontier[pos] = frontier[-1]
+            frontier.pop()
+            continue
+        direction = rng.choice(free)
+        x, y, z = index.coords[src]
+        dx, dy, dz = DELTAS[direction]
+        cell = (x + dx, y + dy, z + dz)
+        back = opposite(direction)
+        dest = index.at(cell)
+        if dest is None:
+            dest = new_room(cell)
+            frontier.append(dest)
+        elif back in graph[dest] or rng.random() >= loop_chance:
+            tried.add((src, direction))
+            continue
+        graph[src][direction] = dest
+        graph[dest][back] = src
+
+    for rid in ids:
+        c = index.coords[rid]
+        world_store.save_room(world_id, Room(
+            id=rid, name=f"Synthetic Room {rid.rsplit('.r', 1)[1]}",
+            description="A featureless test chamber.", exits=dict(graph[rid]),
+            zone_tag=rid.split(".", 1)[0], coords=c,
+        ))
+    world_store.save_graph(world_id, graph)
+    spatial.save_index(world_id, index)
+
+    mobs: list[Mob] = []
+    for rid in ids:
+        if rng.random() >= mob_density:
+            continue
+        kind = rng.choice(MOB_KINDS)
+        mobs.append(Mob(
+            name=kind["name"], hp=kind["hp"], max_hp=kind["hp"], atk=2, ac=kind["ac"],
+            stats={"STR": 10, "DEX": 12, "CON": 10, "INT": 6, "WIS": 8, "CHA": 6},
+            damage_die=kind["damage_die"], damage_bonus=kind["damage_bonus"],
+            faction=kind["faction"], xp_value=kind["xp_value"],
+            home_room=rid, current_room=rid, zone_tag=rid.split(".", 1)[0],
+            mob_id=f"mob_{len(mobs):06d}", kind=kind["name"].lower(),
+        ))
+    world_store.update_mobs(world_id, mobs)
+
+    items = []
+    for rid in ids:
+        if rng.random() < item_density:
+            items.append((f"item_{len(items):06d}", Item(**rng.choice(ITEM_KINDS)),
+                          f"room:{rid}"))
+    world_store.add_items(world_id, items)
+
+    edges = sum(len(e) for e in graph.values())
+    return SynthReport(world_id=world_id, rooms=len(ids), edges=edges,
+                       mobs=len(mobs), items=len(items), root=root)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m nachomud.world.synth",
+                                 description="Build a synthetic world without an LLM.")
+    ap.add_argument("--rooms", type=int, required=True)
+    ap.add_argument("--world", default="synth")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--mob-density", type=float, default=0.3)
+    ap.add_argument("--item-density", type=float, default=0.2)
+    args = ap.parse_args(argv)
+    r = synthesize_world(args.world, args.rooms, seed=args.seed,
+                         mob_density=args.mob_density, item_density=args.item_density)
+    print(f"{r.world_id}: {r.rooms} rooms, {r.edges} edges, {r.mobs} mobs, "
+          f"{r.items} items (root {r.root})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,6 +22,8 @@ import os
 import time
 from pathlib import Path
 
+from nachomud.metrics import TRANSCRIPT_WRITE_SECONDS
+
 log = logging.getLogger("nachomud.transcriptlog")
 
 # Default to <data>/transcripts/. Tests override via the env var.
@@ -48,7 +50,7 @@ def append(actor_id: str, item) -> None:
     payload = list(item) if isinstance(item, tuple) else item
     record = {"ts": time.time(), "item": payload}
     try:
-        with _path(actor_id).open("a", encoding="utf-8") as f:
+        with TRANSCRIPT_WRITE_SECONDS.time(), _path(actor_id).open("a", encoding="utf-8") as f:
             f.write(json.dumps(record, default=str) + "\n")
     except Exception:
         log.exception("transcript append failed for %s", actor_id)
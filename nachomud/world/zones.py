@@ -0,0 +1,77 @@
+"""Per-zone locks for the WorldLoop.
+
+A zone is the prefix of a room id (`silverbrook.inn` → `silverbrook`).
+Generated rooms are named after the zone of the room they were reached
+from, so the prefix groups rooms into contiguous regions without reading
+any room file. Commands lock only the zones they can touch; two actors
+in different regions run at the same time.
+
+Locks are always taken in sorted zone order, so a command spanning two
+zones (a move across a border) can't deadlock against one going the
+other way. `exclusive()` takes every zone at once for structural
+changes — actors joining or leaving, shutdown.
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from nachomud.metrics import LOCK_HOLD_SECONDS, LOCK_WAIT_SECONDS
+from nachomud.world.lockprof import PROFILER, LockProfiler
+
+
+def zone_of(room_id: str) -> str:
+    return room_id.split(".", 1)[0] if room_id else ""
+
+
+@dataclass
+class ZoneLocks:
+    _locks: dict[str, threading.Lock] = field(default_factory=dict)
+    # Guards _locks; held for the whole of exclusive() so no new zone
+    # lock appears while every existing one is held.
+    _registry: threading.Lock = field(default_factory=threading.Lock)
+    profiler: LockProfiler = field(default_factory=lambda: PROFILER)
+
+    def _get(self, zones: Iterable[str]) -> list[threading.Lock]:
+        with self._registry:
+            return [self._locks.setdefault(z, threading.Lock()) for z in zones]
+
+    @contextlib.contextmanager
+    def _acquire_all(self, locks: list[threading.Lock], scope: str, started: float,
+                     holder: str, what: str, zones: tuple[str, ...]) -> Iterator[None]:
+        held: list[threading.Lock] = []
+        token = None
+        try:
+            for lock in locks:
+                lock.acquire()
+                held.append(lock)
+            wait = time.perf_counter() - started
+            LOCK_WAIT_SECONDS.observe(wait, scope)
+            token = self.profiler.enter(holder, what, zones, wait)
+            yield
+        finally:
+            for lock in reversed(held):
+                lock.release()
+            if token is not None:
+                section = self.profiler.exit(token)
+                LOCK_HOLD_SECONDS.observe(section.hold_seconds, scope)
+
+    @contextlib.contextmanager
+    def hold(self, zones: Iterable[str], *, holder: str = "",
+             what: str = "") -> Iterator[None]:
+        """Hold the locks of `zones`. `holder` (actor id) and `what`
+        (command text) label the section in the lock profiler."""
+        started = time.perf_counter()
+        zones = tuple(sorted(set(zones)))
+        with self._acquire_all(self._get(zones), "zone", started, holder, what, zones):
+            yield
+
+    @contextlib.contextmanager
+    def exclusive(self, *, holder: str = "", what: str = "") -> Iterator[None]:
+        started = time.perf_counter()
+        with self._registry, self._acquire_all([self._locks[z] for z in sorted(self._locks)],
+                                               "exclusive", started, holder, what, ("*",)):
+            yield
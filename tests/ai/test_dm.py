@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import pytest
 
+import nachomud.world.store as world_store
 from nachomud.characters.character import create_character
 from nachomud.ai.dm import DM, DM_PERSONA, _build_user_prompt
-from nachomud.models import Room
+from nachomud.ai.llm import LLMUnavailable
+from nachomud.models import Item, Room
 from nachomud.rules.stats import Stats
 
 
@@ -87,3 +89,87 @@ def test_prompt_includes_summary_when_present():
     a.dm_context["summary"] = "Aric arrived in town this morning."
     prompt = _build_user_prompt(a, _room(), "what's next?")
     assert "Aric arrived" in prompt
+
+
+# ── `look at` narration stored on the room ──
+
+@pytest.fixture
+def stored_room(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    room = _room()
+    world_store.save_room("default", room)
+    return room
+
+
+def _counting_llm():
+    calls = []
+
+    def _llm(system: str, user: str) -> str:
+        calls.append(user)
+        return f"The hearth glows. ({len(calls)})"
+    return _llm, calls
+
+
+def test_examine_reuses_room_narration_across_actors(stored_room):
+    llm, calls = _counting_llm()
+    first = DM(llm=llm).examine(_agent(), stored_room, "the Hearth")
+    second = DM(llm=llm).examine(_agent(), stored_room, "the hearth")
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_examine_invalidated_by_flag_change(stored_room):
+    llm, calls = _counting_llm()
+    DM(llm=llm).examine(_agent(), stored_room, "hearth")
+    world_store.update_room_flags("default", stored_room.id, {"fire_out": True})
+    room = world_store.load_room("default", stored_room.id)
+    DM(llm=llm).examine(_agent(), room, "hearth")
+    assert len(calls) == 2
+
+
+def test_examine_invalidated_by_presence_change(stored_room):
+    llm, calls = _counting_llm()
+    DM(llm=llm).examine(_agent(), stored_room, "hearth")
+    world_store.add_item("default", "i1", Item(name="Poker", slot="weapon"),
+                         f"room:{stored_room.id}")
+    DM(llm=llm).examine(_agent(), stored_room, "hearth")
+    assert len(calls) == 2
+
+
+def test_examine_does_not_store_failures(stored_room):
+    def down(s, u):
+        raise LLMUnavailable("down")
+    DM(llm=down).examine(_agent(), stored_room, "hearth")
+    llm, calls = _counting_llm()
+    DM(llm=llm).examine(_agent(), stored_room, "hearth")
+    assert len(calls) == 1
+
+
+def test_examine_prompt_and_stored_text_carry_nothing_of_the_examiner(stored_room):
+    calls = []
+
+    def llm(system: str, user: str) -> str:
+        calls.append(user)
+        return "The hearth glows.\nHINT: Aric owes the innkeeper 5 gp."
+    examiner = _agent()
+    examiner.gold = 4321
+    examiner.dm_context["summary"] = "Aric robbed the mill."
+    first = DM(llm=llm).examine(examiner, stored_room, "hearth")
+    assert first == "The hearth glows."
+    assert examiner.dm_context["pending_hints"][-1]["hint"] == "Aric owes the innkeeper 5 gp."
+    assert not any(s in calls[0] for s in ("Aric", "4321", "robbed"))
+
+    reader = _agent()
+    assert DM(llm=llm).examine(reader, stored_room, "hearth") == "The hearth glows."
+    assert len(calls) == 1
+    assert reader.dm_context["pending_hints"] == []
+
+
+def test_examine_invalidated_by_co_resident_change(stored_room):
+    llm, calls = _counting_llm()
+    DM(llm=llm).examine(_agent(), stored_room, "hearth", ["Bryn"])
+    DM(llm=llm).examine(_agent(), stored_room, "hearth", ["Bryn"])
+    assert len(calls) == 1
+    assert "Adventurer Bryn" in calls[0]
+    DM(llm=llm).examine(_agent(), stored_room, "hearth", [])
+    assert len(calls) == 2
@@ -0,0 +1,73 @@
+"""Tests for fake_ollama — the local Ollama stand-in, driven through the
+real ollama client via llm.chat()."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.ai.llm as llm
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+from nachomud.ai.contexts import load as load_context
+from nachomud.ai.fake_ollama import Behaviour, FakeOllama, classify, reply_for
+from nachomud.ai.runner import parse_command
+from nachomud.ai.world_gen import WorldGen
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setattr(llm, "_breakers", {})
+    servers: list[FakeOllama] = []
+
+    def _start(**behaviour) -> FakeOllama:
+        f = FakeOllama(Behaviour(**behaviour))
+        f.start()
+        servers.append(f)
+        return f
+
+    yield _start
+    for f in servers:
+        f.stop()
+
+
+def _chat_fn(url: str):
+    return lambda s, u: llm.chat(system=s, message=u, model="m", host=url, max_tokens=600)
+
+
+def test_room_gen_reply_materializes_a_real_room(fake, tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    starter.seed_world("default")
+    f = fake(tokens_per_second=0)
+    source = world_store.load_room("default", "silverbrook.watchtower")
+
+    room = WorldGen(llm=_chat_fn(f.url)).generate_room(source, "north", "default")
+
+    assert room.name != "Uncharted Place"           # not the stub fallback
+    assert len(room.exits) >= 2                      # back-edge + forward
+    assert world_store.mobs_in_room("default", room.id)
+    assert f.calls[("room_gen", "ok")] == 1
+
+
+def test_call_sites_are_recognised_and_answered_deterministically():
+    assert classify(load_context("dm_room_gen")) == "room_gen"
+    assert classify(load_context("dm_adjudicate")) == "adjudicate"
+    assert classify(load_context("npc_summary")) == "npc_summary"
+    assert classify(load_context("agent_berserker")) == "agent"
+
+    prompt = "You are Grosh.\n\nHostiles: Wild Boar (HP 8/8)\nExits: north, south"
+    assert parse_command(reply_for("agent", "", prompt)) == "attack Wild Boar"
+    wander = "You are Pippin.\n\nExits: east, west"
+    assert reply_for("agent", "", wander, seed=3) == reply_for("agent", "", wander, seed=3)
+    assert reply_for("agent", "", wander) in ("look", "east", "west")
+
+
+def test_dropped_connections_trip_the_circuit_breaker(fake):
+    f = fake(drop_rate=1.0)
+    chat = _chat_fn(f.url)
+    for _ in range(llm.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(llm.LLMUnavailable):
+            chat("sys", "hello")
+    assert llm.circuit_breaker(f.url).state == "open"
+
+    with pytest.raises(llm.LLMUnavailable, match="circuit open"):
+        chat("sys", "hello")
+    assert f.calls[("other", "drop")] == llm.CIRCUIT_FAILURE_THRESHOLD
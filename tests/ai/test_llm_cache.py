@@ -0,0 +1,119 @@
+"""Tests for the LLM response cache (ai/llm.py) and its opt-in call
+sites."""
+from __future__ import annotations
+
+import pytest
+
+from nachomud.ai.llm import LLMUnavailable, ResponseCache
+from nachomud.ai.npc import NPCDialogue
+from nachomud.characters.character import create_character
+from nachomud.models import NPC
+from nachomud.rules.stats import Stats
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting(reply: str = "ok."):
+    calls = []
+
+    def _llm(system: str, user: str) -> str:
+        calls.append(user)
+        return f"{reply} #{len(calls)}"
+    return _llm, calls
+
+
+# ── ResponseCache ──
+
+def test_wrap_serves_identical_prompts_from_cache():
+    cache = ResponseCache("t")
+    fn, calls = _counting()
+    cached = cache.wrap(fn, "model-a")
+    assert cached("sys", "look") == "ok. #1"
+    assert cached("sys", "look") == "ok. #1"
+    assert cached("sys", "north") == "ok. #2"
+    assert len(calls) == 2
+    m = cache.metrics()
+    assert (m["hits"], m["misses"], m["size"]) == (1, 2, 2)
+    assert m["hit_rate"] == pytest.approx(0.333)
+
+
+def test_lookups_and_evictions_reach_the_metrics_registry():
+    import nachomud.metrics as metrics
+    cache = ResponseCache("t_metrics", max_entries=1)
+    cache.get_or_call(("a",), lambda: "A")
+    cache.get_or_call(("a",), lambda: "A2")
+    cache.get_or_call(("b",), lambda: "B")      # evicts a
+    assert metrics.LLM_CACHE_LOOKUPS.value("t_metrics", "hit") == 1
+    assert metrics.LLM_CACHE_LOOKUPS.value("t_metrics", "miss") == 2
+    assert metrics.LLM_CACHE_EVICTIONS.value("t_metrics", "lru") == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = ResponseCache("t", ttl_seconds=10, clock=clock)
+    fn, calls = _counting()
+    cache.get_or_call(("k",), lambda: fn("", ""))
+    clock.now = 11
+    assert cache.get_or_call(("k",), lambda: fn("", "")) == "ok. #2"
+    assert cache.stats.expirations == 1
+
+
+def test_lru_eviction_drops_least_recently_used():
+    cache = ResponseCache("t", max_entries=2)
+    cache.get_or_call(("a",), lambda: "A")
+    cache.get_or_call(("b",), lambda: "B")
+    cache.get_or_call(("a",), lambda: "A2")      # touch a
+    cache.get_or_call(("c",), lambda: "C")       # evicts b
+    assert cache.get_or_call(("a",), lambda: "miss") == "A"
+    assert cache.get_or_call(("b",), lambda: "B2") == "B2"
+    assert cache.stats.evictions == 2
+
+
+def test_seed_selects_variant():
+    cache = ResponseCache("t", variants=3)
+    cache.get_or_call(("k",), lambda: "zero", seed=0)
+    cache.get_or_call(("k",), lambda: "one", seed=1)
+    assert cache.get_or_call(("k",), lambda: "miss", seed=0) == "zero"
+    assert cache.get_or_call(("k",), lambda: "miss", seed=1) == "one"
+
+
+def test_failures_are_not_cached():
+    cache = ResponseCache("t")
+
+    def down() -> str:
+        raise LLMUnavailable("down")
+
+    with pytest.raises(LLMUnavailable):
+        cache.get_or_call(("k",), down)
+    assert cache.get_or_call(("k",), lambda: "back") == "back"
+
+
+# ── Call sites ──
+
+def _player(name: str, pid: str):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character(name, "Dwarf", "Warrior", s, player_id=pid,
+                         respawn_room="r1", world_id="default")
+    p.room_id = "r1"
+    return p
+
+
+def test_npc_opener_cached_across_players_but_not_follow_ups():
+    fn, calls = _counting("Aye.")
+    npc = NPC(npc_id="john", name="Old John", title="Smith")
+    dialogue = NPCDialogue(llm=fn, summarizer=lambda s, u: "John grunts.",
+                           reply_cache=ResponseCache("npc"))
+    first, _ = dialogue.speak(_player("Aric", "p1"), npc, "forging", "Hello!")
+    second, _ = dialogue.speak(_player("Bryn", "p2"), npc, "forging", "hello")
+    assert first == second
+    assert len(calls) == 1
+    assert "Aric" not in calls[0]
+    dialogue.speak(_player("Cael", "p3"), npc, "forging", "Where is the mine?")
+    assert len(calls) == 2
+    assert "Cael" in calls[1]
@@ -102,3 +102,65 @@ def test_chat_none_host_uses_default():
         # Network/model errors are fine — we're only verifying the
         # config-error branch isn't taken.
         pass
+
+
+# ── Circuit breaker ──
+
+class _DeadClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def chat(self, **_kw):
+        import httpx
+        self.calls += 1
+        raise httpx.ConnectError("refused")
+
+
+class _LiveClient:
+    def chat(self, **_kw):
+        return {"message": {"content": "hi"}}
+
+
+@pytest.fixture
+def dead_host(monkeypatch):
+    import nachomud.ai.llm as llm
+    host = "http://gpu.test:11434"
+    client = _DeadClient()
+    monkeypatch.setitem(llm._clients, host, client)
+    monkeypatch.setattr(llm, "_breakers", {})
+    monkeypatch.setattr(llm, "_ensure_prober", lambda: None)
+    return llm, host, client
+
+
+def test_breaker_opens_and_fails_fast(dead_host):
+    llm, host, client = dead_host
+    for _ in range(llm.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(LLMUnavailable):
+            llm.chat(system="x", message="y", model="m", host=host)
+    assert llm.circuit_breaker(host).state == "open"
+    with pytest.raises(LLMUnavailable, match="circuit open"):
+        llm.chat(system="x", message="y", model="m", host=host)
+    assert client.calls == llm.CIRCUIT_FAILURE_THRESHOLD
+
+
+def test_probe_half_opens_and_trial_call_closes(dead_host):
+    llm, host, _client = dead_host
+    for _ in range(llm.CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(LLMUnavailable):
+            llm.chat(system="x", message="y", model="m", host=host)
+    breaker = llm.circuit_breaker(host)
+    breaker.probe_succeeded()
+    assert breaker.state == "half_open"
+    llm._clients[host] = _LiveClient()
+    assert llm.chat(system="x", message="y", model="m", host=host) == "hi"
+    assert breaker.state == "closed"
+
+
+def test_failed_trial_reopens(dead_host):
+    llm, host, client = dead_host
+    breaker = llm.circuit_breaker(host)
+    breaker.state = "half_open"
+    with pytest.raises(LLMUnavailable):
+        llm.chat(system="x", message="y", model="m", host=host)
+    assert breaker.state == "open"
+    assert client.calls == 1
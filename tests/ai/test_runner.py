@@ -11,12 +11,16 @@ import nachomud.ai.runner as runner
 
 
 class _FakeLoop:
-    """Minimum surface _tick_once touches: a lock and submit_command."""
+    """Minimum surface _tick_once touches: hold_actor and submit_command.
+    Fake actors also carry the llm/policy decision counters."""
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self.submitted: list[tuple[str, str]] = []
 
+    def hold_actor(self, _actor, _what: str = "") -> threading.Lock:
+        return self._lock
+
     def submit_command(self, actor_id: str, command: str, *, echo: bool = False) -> None:
         self.submitted.append((actor_id, command))
 
@@ -26,6 +30,7 @@ def _fake_actor() -> SimpleNamespace:
         actor_id="agent_test",
         agent_def={"system_prompt": "be brief"},
         state=SimpleNamespace(action_history=[], abilities=[]),
+        llm_decisions=0, policy_decisions=0,
     )
 
 
@@ -88,7 +93,8 @@ def _combat_actor(abilities=("attack", "defend")):
         room_id="room_1", game_clock={"minute": 480},
     )
     return SimpleNamespace(actor_id="agent_test", state=state,
-                           agent_def={"system_prompt": "be brief"})
+                           agent_def={"system_prompt": "be brief"},
+                           llm_decisions=0, policy_decisions=0)
 
 
 def test_combat_prompt_lists_actual_abilities_and_strips_exits():
@@ -140,6 +146,7 @@ def test_tick_populates_action_history(monkeypatch):
         actor_id="agent_test",
         agent_def={"system_prompt": "be brief"},
         state=SimpleNamespace(action_history=[], abilities=[]),
+        llm_decisions=0, policy_decisions=0,
     )
     world_loop = _FakeLoop()
 
@@ -162,6 +169,7 @@ def test_tick_caps_action_history_to_size(monkeypatch):
         actor_id="agent_test",
         agent_def={"system_prompt": "be brief"},
         state=SimpleNamespace(action_history=[], abilities=[]),
+        llm_decisions=0, policy_decisions=0,
     )
     world_loop = _FakeLoop()
 
@@ -203,3 +211,71 @@ def test_explore_prompt_no_nudge_when_actions_vary():
     snap = {"state": state, "room": None, "in_combat": False}
     prompt = runner.build_user_prompt(snap)
     assert "three times in a row" not in prompt
+
+
+# ── Fast-path policies ──
+
+def _explore_room(exits=None):
+    return SimpleNamespace(id="room_1", npcs=[], exits=exits or {})
+
+
+def _no_world(monkeypatch, *, mobs=(), items=()):
+    monkeypatch.setattr(runner.world_store, "mobs_in_room",
+                        lambda _w, _r, alive_only=True: list(mobs))
+    monkeypatch.setattr(runner.world_store, "items_in_room",
+                        lambda _w, _r: list(items))
+
+
+def test_combat_policy_rotates_affordable_abilities(monkeypatch):
+    _no_world(monkeypatch, mobs=[SimpleNamespace(name="Wild Boar")])
+    actor = _combat_actor(abilities=("attack", "cleave", "defend", "smite"))
+    actor.state.mp, actor.state.max_mp = 2, 2
+    snap = {"state": actor.state, "room": _FakeRoom(), "in_combat": True}
+    # cleave is AoE — skipped against a single mob; defend targets self.
+    assert runner.combat_policy(snap) == "smite Wild Boar"
+    actor.state.mp = 0
+    assert runner.combat_policy(dict(snap)) == "attack Wild Boar"
+
+
+def test_combat_policy_heals_when_low(monkeypatch):
+    _no_world(monkeypatch, mobs=[SimpleNamespace(name="Wild Boar")])
+    actor = _combat_actor(abilities=("attack", "smite", "lay_on_hands"))
+    actor.state.hp, actor.state.mp, actor.state.max_mp = 3, 5, 5
+    snap = {"state": actor.state, "room": _FakeRoom(), "in_combat": True}
+    assert runner.combat_policy(snap) == "lay_on_hands"
+
+
+def test_rest_and_loot_policies(monkeypatch):
+    _no_world(monkeypatch, items=[{"name": "Rusty Dagger"}])
+    actor = _combat_actor()
+    snap = {"state": actor.state, "room": _explore_room(), "in_combat": False}
+    assert runner.rest_policy(snap) is None
+    assert runner.loot_policy(snap) == "get Rusty Dagger"
+    actor.state.hp = 4
+    assert runner.decide_fast_path(dict(snap)) == "rest"
+
+
+def test_frontier_policy_takes_the_only_unexplored_exit(monkeypatch):
+    _no_world(monkeypatch)
+    actor = _combat_actor()
+    actor.state.visited_rooms = ["room_0", "room_1"]
+    room = _explore_room({"south": "room_0", "north": "room_2"})
+    snap = {"state": actor.state, "room": room, "in_combat": False}
+    assert runner.frontier_policy(snap) == "north"
+    room.exits["east"] = "room_3"
+    assert runner.frontier_policy(dict(snap)) is None
+
+
+def test_tick_uses_policy_without_calling_llm(monkeypatch):
+    monkeypatch.setattr(runner, "_snapshot", lambda _actor: {"in_combat": False})
+    monkeypatch.setattr(runner, "decide_fast_path", lambda _snap: "rest")
+
+    def boom(_system: str, _user: str) -> str:
+        raise AssertionError("LLM must not be called")
+
+    world_loop = _FakeLoop()
+    actor = _fake_actor()
+    asyncio.run(runner._tick_once(world_loop, actor, boom))
+
+    assert world_loop.submitted == [("agent_test", "rest")]
+    assert (actor.llm_decisions, actor.policy_decisions) == (0, 1)
@@ -0,0 +1,90 @@
+"""Tests for ai/scheduler.py — the adaptive agent tick interval."""
+from __future__ import annotations
+
+from nachomud.ai.llm import HostStats
+from nachomud.ai.scheduler import HUMAN_ACTIVE_WINDOW_SECONDS, AgentScheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sched(stats: HostStats, *, agents: int = 4, clock=None, **kw) -> AgentScheduler:
+    s = AgentScheduler(base_seconds=8.0, min_seconds=2.0, max_seconds=120.0,
+                       stats_fn=lambda: stats, clock=clock or _Clock(), **kw)
+    for i in range(agents):
+        s.register(f"agent_{i}")
+    return s
+
+
+def test_idle_fast_host_shrinks_interval():
+    s = _sched(HostStats(ewma_seconds=0.5))
+    assert s.interval() == 4.0
+
+
+def test_slow_host_stretches_to_keep_utilization_bounded():
+    # 4 agents × 6s per call at 50% target utilization → 48s apart.
+    s = _sched(HostStats(ewma_seconds=6.0))
+    assert s.interval() == 48.0
+
+
+def test_queue_depth_stretches_interval():
+    s = _sched(HostStats(ewma_seconds=0.5, in_flight=2))
+    assert s.interval() == 16.0
+
+
+def test_human_activity_backs_off_then_expires():
+    clock = _Clock()
+    s = _sched(HostStats(ewma_seconds=0.5), clock=clock)
+    s.note_human_activity()
+    assert s.interval() == 16.0
+    clock.now += HUMAN_ACTIVE_WINDOW_SECONDS + 1
+    assert s.interval() == 4.0
+
+
+def test_interval_is_clamped():
+    s = _sched(HostStats(ewma_seconds=60.0))
+    assert s.interval() == 120.0
+
+
+def test_unwatched_agents_pause_and_leave_the_budget():
+    s = _sched(HostStats(ewma_seconds=6.0), pause_unwatched=True)
+    assert s.should_run("agent_0", watched=True)
+    for i in range(1, 4):
+        assert not s.should_run(f"agent_{i}", watched=False)
+    # Only one agent is competing for the host now.
+    assert s.interval() == 12.0
+    m = s.metrics()
+    assert m["running_agents"] == 1
+    assert m["paused_agents"] == 3
+
+
+def test_pause_unwatched_disabled_runs_everyone():
+    s = _sched(HostStats(), pause_unwatched=False)
+    assert s.should_run("agent_0", watched=False)
+
+
+def test_metrics_report_measured_rate():
+    clock = _Clock()
+    s = _sched(HostStats(ewma_seconds=0.5, in_flight=1), clock=clock)
+    for _ in range(3):
+        s.record_tick("agent_0")
+    clock.now += 61
+    s.record_tick("agent_0")
+    m = s.metrics()
+    assert m["ticks_per_minute"] == 1.0
+    assert m["queue_depth"] == 1
+    assert m["interval_seconds"] == 12.0
+    assert m["target_ticks_per_minute"] == 20.0
+
+
+def test_host_stats_ewma():
+    stats = HostStats()
+    stats.observe(2.0)
+    assert stats.ewma_seconds == 2.0
+    stats.observe(4.0)
+    assert round(stats.ewma_seconds, 3) == 2.6
@@ -0,0 +1,61 @@
+"""Tests for the magic-link token stores (auth/magic_link.py)."""
+from __future__ import annotations
+
+import pytest
+
+from nachomud.auth.magic_link import (
+    TOKEN_TTL_SECONDS,
+    MemoryTokenStore,
+    SQLiteTokenStore,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_and_clock(request, tmp_path):
+    clock = _Clock()
+    if request.param == "memory":
+        return MemoryTokenStore(clock=clock), clock
+    return SQLiteTokenStore(str(tmp_path / "auth" / "tokens.db"), clock=clock), clock
+
+
+def test_token_is_single_use(store_and_clock):
+    store, _ = store_and_clock
+    token = store.issue("  Aric@Example.COM ")
+    assert store.consume(token) == "aric@example.com"
+    assert store.consume(token) is None
+    assert store.consume("") is None
+    assert store.consume("bogus") is None
+
+
+def test_expired_token_is_rejected(store_and_clock):
+    store, clock = store_and_clock
+    token = store.issue("a@example.com")
+    clock.now += TOKEN_TTL_SECONDS + 1
+    assert store.consume(token) is None
+
+
+def test_memory_store_gc_drops_only_expired():
+    clock = _Clock()
+    store = MemoryTokenStore(clock=clock)
+    old = store.issue("old@example.com")
+    clock.now += TOKEN_TTL_SECONDS + 1
+    fresh = store.issue("new@example.com")
+    assert old not in store._tokens
+    assert len(store._expiry) == 1
+    assert store.consume(fresh) == "new@example.com"
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    issuer, verifier = SQLiteTokenStore(path), SQLiteTokenStore(path)
+    token = issuer.issue("a@example.com")
+    assert verifier.consume(token) == "a@example.com"
+    assert issuer.consume(token) is None
@@ -11,6 +11,7 @@ from nachomud.characters.character import (
     save_throw_bonus,
     spell_attack,
     spell_save_dc,
+    standard_stats,
 )
 from nachomud.rules.stats import Stats
 
@@ -19,6 +20,12 @@ def _standard() -> Stats:
     return Stats(STR=15, DEX=14, CON=13, INT=12, WIS=10, CHA=8)
 
 
+def test_standard_stats_puts_primary_first():
+    assert standard_stats("STR") == _standard()
+    s = standard_stats("INT")
+    assert (s.INT, s.STR, s.DEX, s.CON, s.WIS, s.CHA) == (15, 14, 13, 12, 10, 8)
+
+
 # ── Construction ──
 
 def test_create_l1_warrior():
@@ -334,15 +334,125 @@ def test_v1_player_save_loads_with_empty_dm_url(tmp_data_dirs):
     import json
     s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
     p = create_character("Aric", "Dwarf", "Warrior", s, player_id="player-1")
-    player_mod.save_player(p)
-    path = player_mod.player_path("player-1")
-    with open(path) as f:
-        payload = json.load(f)
+    payload = player_mod.player_to_dict(p)
+    payload["dm_context"] = player_mod.dm_context_to_dict(p)
     payload["schema_version"] = 1
     payload.pop("dm_ollama_url", None)
-    with open(path, "w") as f:
-        json.dump(payload, f)
+    os.makedirs(player_mod.DATA_ROOT, exist_ok=True)
+    with open(player_mod.player_path("player-1"), "w") as f:
+        json.dump(payload, f, indent=2)
 
     p2 = player_mod.load_player("player-1")
     assert p2.name == "Aric"
     assert p2.dm_ollama_url == ""
+
+
+# ── SaveCoordinator ──
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _saver(tmp_data_dirs):
+    clock = _Clock()
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1")
+    return player_mod.SaveCoordinator(interval_seconds=30, clock=clock), clock, p
+
+
+def test_coordinator_coalesces_writes_within_interval(tmp_data_dirs):
+    saves, clock, p = _saver(tmp_data_dirs)
+    saves.request(p)                       # leading edge writes
+    for room in ("r1", "r2", "r3"):
+        p.room_id = room
+        clock.now += 5
+        saves.request(p)
+    assert saves.writes == 1
+    assert player_mod.load_player("p1").room_id == ""
+    assert saves.flush_due() == 0
+    clock.now += 30
+    assert saves.flush_due() == 1
+    assert player_mod.load_player("p1").room_id == "r3"
+    assert saves.metrics()["coalesced"] == 2
+
+
+def test_coordinator_skips_unchanged_state(tmp_data_dirs):
+    saves, clock, p = _saver(tmp_data_dirs)
+    saves.request(p)
+    clock.now += 60
+    saves.request(p, force=True)
+    assert (saves.writes, saves.unchanged) == (1, 1)
+
+
+def test_coordinator_flushes_level_up_immediately(tmp_data_dirs):
+    saves, clock, p = _saver(tmp_data_dirs)
+    saves.request(p)
+    p.level += 1
+    saves.request(p)
+    assert player_mod.load_player("p1").level == p.level
+    assert saves.writes == 2
+
+
+def test_coordinator_forget_forces_next_write(tmp_data_dirs):
+    saves, clock, p = _saver(tmp_data_dirs)
+    saves.request(p)
+    player_mod.delete_player("p1")
+    saves.forget("p1")
+    saves.request(p)
+    assert player_mod.player_exists("p1")
+
+
+# ── v3 layout ──
+
+def test_list_players_reads_only_the_header(tmp_data_dirs):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1")
+    player_mod.save_player(p)
+    path = player_mod.player_path("p1")
+    with open(path) as f:
+        header = f.readline()
+    with open(path, "w") as f:
+        f.write(header + "not json\n")      # body never parsed
+    assert player_mod.list_players() == [
+        {"player_id": "p1", "name": "Aric", "race": "Dwarf", "class": "Warrior", "level": 1}]
+
+
+def test_dm_context_loads_lazily_from_sidecar(tmp_data_dirs, monkeypatch):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1")
+    p.dm_context["summary"] = "Met the smith."
+    player_mod.save_player(p)
+    reads = []
+    real = player_mod.load_dm_context
+    monkeypatch.setattr(player_mod, "load_dm_context",
+                        lambda pid: reads.append(pid) or real(pid))
+
+    p2 = player_mod.load_player("p1")
+    p2.room_id = "r2"
+    assert [path for path, _ in player_mod.player_files(p2)] == [player_mod.player_path("p1")]
+    player_mod.save_player(p2)
+    assert reads == []
+    assert p2.dm_context["summary"] == "Met the smith."
+    assert reads == ["p1"]
+
+
+def test_legacy_v2_save_moves_dm_context_to_sidecar(tmp_data_dirs):
+    import json
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1")
+    payload = player_mod.player_to_dict(p)
+    payload["schema_version"] = 2
+    payload["dm_context"] = {"recent_exchanges": [], "summary": "Old.", "pending_hints": []}
+    os.makedirs(player_mod.DATA_ROOT, exist_ok=True)
+    with open(player_mod.player_path("p1"), "w") as f:
+        json.dump(payload, f, indent=2)
+
+    p2 = player_mod.load_player("p1")
+    assert p2.dm_context["summary"] == "Old."
+    player_mod.save_player(p2)
+    assert os.path.isfile(player_mod.dm_context_path("p1"))
+    assert player_mod.load_player("p1").dm_context["summary"] == "Old."
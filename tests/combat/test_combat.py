@@ -152,6 +152,64 @@ def test_mob_state_persists_across_combat(player):
     assert not m.alive
 
 
+def test_mob_sync_writes_nothing_until_a_kill_or_the_end(player, monkeypatch):
+    """Ordinary rounds stay in memory; the fight's end commits once, and
+    only the fields that changed."""
+    dice.seed(1)
+    _spawn_goblin(player.world_id, player.room_id, mob_id="g1", hp=999, ac=1)
+    _spawn_goblin(player.world_id, player.room_id, mob_id="g2", hp=999, ac=99)
+    room = world_store.load_room(player.world_id, player.room_id)
+    enc = Encounter(player=player, room=room, world_id=player.world_id)
+    enc.start()
+    writes = []
+    real = world_store.patch_mobs
+    monkeypatch.setattr(world_store, "patch_mobs",
+                        lambda w, patches: (writes.append(patches), real(w, patches)))
+    enc.handle_player_input("attack goblin")
+    assert writes == []
+    assert world_store.get_mob(player.world_id, "g1").hp == 999
+
+    player.hp = 999
+    enc.handle_player_input("flee")
+    assert len(writes) == 1 and sorted(writes[0]) == ["g1", "g2"]
+    assert set(writes[0]["g1"]) <= {"hp", "alive", "ai_state", "ai_target"}
+    assert world_store.get_mob(player.world_id, "g1").hp < 999
+    assert world_store.get_mob(player.world_id, "g2").hp == 999
+
+
+def test_a_kill_is_checkpointed_mid_fight(player):
+    dice.seed(1)
+    _spawn_goblin(player.world_id, player.room_id, mob_id="g1", hp=1, ac=1)
+    _spawn_goblin(player.world_id, player.room_id, mob_id="g2", hp=999, ac=99)
+    room = world_store.load_room(player.world_id, player.room_id)
+    enc = Encounter(player=player, room=room, world_id=player.world_id)
+    enc.start()
+    player.hp = 999
+    for _ in range(20):
+        if not enc.mob_dict["g1"].alive:
+            break
+        enc.handle_player_input("attack goblin")
+    assert not enc.mob_dict["g1"].alive and enc.is_active()
+    assert not world_store.get_mob(player.world_id, "g1").alive
+
+
+def test_mob_sync_leaves_tick_fields_alone(player):
+    """A tick that re-tasks a mob mid-fight isn't undone by combat's write."""
+    dice.seed(1)
+    _spawn_goblin(player.world_id, player.room_id, mob_id="g1", hp=999, ac=1)
+    room = world_store.load_room(player.world_id, player.room_id)
+    enc = Encounter(player=player, room=room, world_id=player.world_id)
+    enc.start()
+    ticked = world_store.get_mob(player.world_id, "g1")
+    ticked.ai_state = "pursue"
+    world_store.update_mob(player.world_id, ticked)
+    enc.handle_player_input("attack goblin")
+    enc.state = "fled"
+    enc._sync_mobs()
+    m = world_store.get_mob(player.world_id, "g1")
+    assert m.hp < 999 and m.ai_state == "pursue"
+
+
 def test_unknown_ability_rejected(player):
     _spawn_goblin(player.world_id, player.room_id, ac=99)
     room = world_store.load_room(player.world_id, player.room_id)
@@ -187,6 +245,21 @@ def test_game_attack_triggers_combat(player):
     assert g._encounter.is_active()
 
 
+def test_game_saves_a_death_at_once_even_with_no_xp_to_lose(player):
+    dice.seed(0xDEAD)
+    _spawn_goblin(player.world_id, player.room_id, hp=999, ac=99)
+    player.xp = 0
+    player.respawn_room = "silverbrook.market_square"
+    saves = player_mod.SaveCoordinator(interval_seconds=3600)
+    saves.request(player)                  # first write; the rest are debounced
+    g = Game(player=player, dm=_stub_dm(), npc_dialogue=_stub_npc(), saves=saves)
+    g.start()
+    g.handle("attack goblin")
+    while g._encounter is not None:
+        g.handle("attack goblin")
+    assert player_mod.load_player("p1").room_id == "silverbrook.market_square"
+
+
 def test_game_attack_unknown_target(player):
     g = Game(player=player, dm=_stub_dm(), npc_dialogue=_stub_npc())
     g.start()
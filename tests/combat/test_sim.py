@@ -0,0 +1,53 @@
+"""Tests for combat/sim.py — the offline balance simulator."""
+from __future__ import annotations
+
+import random
+
+import nachomud.rules.dice as dice
+import nachomud.world.store as world_store
+from nachomud.combat import sim
+
+
+def test_seeded_matchup_is_reproducible():
+    a = sim.run_matchup("Dwarf", "Warrior", 1, "goblin", sim.MOB_TEMPLATES["goblin"],
+                        fights=50, seed=7)
+    b = sim.run_matchup("Dwarf", "Warrior", 1, "goblin", sim.MOB_TEMPLATES["goblin"],
+                        fights=50, seed=7)
+    assert a == b
+    assert 0.0 <= a.win_rate <= 1.0
+    assert a.mean_rounds_to_kill is not None
+    assert a.hp_curve and all(0.0 <= f <= 1.0 for f in a.hp_curve)
+
+
+def test_seeded_run_leaves_live_rng_alone():
+    dice.seed(3)
+    expected = random.Random(3).randint(1, 20)
+    sim.run_matchup("Elf", "Mage", 1, "wolf", sim.MOB_TEMPLATES["wolf"], fights=5, seed=1)
+    assert dice.roll("1d20") == expected
+
+
+def test_fights_never_touch_world_store(monkeypatch):
+    def boom(*a, **kw):
+        raise AssertionError("simulator wrote to world_store")
+    monkeypatch.setattr(world_store, "update_mobs", boom)
+    monkeypatch.setattr(world_store, "update_mob", boom)
+    monkeypatch.setattr(world_store, "patch_mobs", boom)
+    report = sim.run_matchup("Human", "Paladin", 2, "bandit",
+                             sim.MOB_TEMPLATES["bandit"], fights=20, mob_count=2, seed=0)
+    assert report.fights == 20
+
+
+def test_prototype_is_not_mutated_between_fights():
+    proto = sim.build_player("Half-Orc", "Warrior", 1)
+    before = (proto.hp, proto.xp, dict(proto.stats), dict(proto.dm_context))
+    for i in range(5):
+        sim.simulate_fight(sim._fresh(proto), [sim.mob_from_template(
+            sim.MOB_TEMPLATES["giant_spider"], f"m{i}")])
+    assert (proto.hp, proto.xp, proto.stats, proto.dm_context) == before
+    assert proto.status_effects == []
+
+
+def test_sweep_seeds_do_not_depend_on_workers():
+    kw = dict(races=["Dwarf"], classes=["Cleric", "Rogue"], levels=[1],
+              templates={"goblin": sim.MOB_TEMPLATES["goblin"]}, fights=10, seed=5)
+    assert sim.sweep(**kw) == sim.sweep(**kw, workers=2)
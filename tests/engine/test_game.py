@@ -211,6 +211,65 @@ def test_who_command(game):
     assert "Warrior" in text
 
 
+def test_map_command_memoized_until_player_moves(game, monkeypatch):
+    import nachomud.world.map as map_mod
+    game.start()
+    calls = []
+    real = map_mod.render_map
+    monkeypatch.setattr(map_mod, "render_map",
+                        lambda *a, **k: calls.append(a) or real(*a, **k))
+    first = _text(game.handle("map"))
+    assert _text(game.handle("map")) == first
+    assert len(calls) == 1
+    game.handle("north")
+    game.handle("map")
+    assert len(calls) == 2
+    assert "* Market Square" in _text(game.handle("map list"))
+
+
+def test_map_command_draws_grid_around_player(game):
+    game.start()
+    game.handle("north")
+    text = _text(game.handle("map"))
+    assert "[*Market Squar*]" in text
+    assert "───" in text and "│" in text
+    assert "map list" in text
+
+
+def test_travel_walks_an_explored_route_and_renders_only_the_end(game):
+    game.start()
+    for step in ("n", "e", "w", "s"):
+        game.handle(step)
+    msgs = game.handle("travel smithy")
+    assert game.player.room_id == "silverbrook.smithy"
+    text = _text(msgs)
+    assert "2 steps" in text
+    assert text.count("You head") == 2
+    assert "Market Square" not in text
+    assert sum(1 for m in msgs if isinstance(m, tuple) and m[0] == "prompt") == 1
+
+
+def test_travel_reads_the_mob_registry_once_per_trip(game, monkeypatch):
+    game.start()
+    for step in ("n", "n", "n", "s", "s", "s"):
+        game.handle(step)
+    reads = []
+    real = world_store.load_mobs
+    monkeypatch.setattr(world_store, "load_mobs",
+                        lambda world_id: reads.append(world_id) or real(world_id))
+    game.handle("travel watchtower")
+    assert game.player.room_id == "silverbrook.watchtower"
+    assert len(reads) == 2                  # the hazard snapshot + the final render
+
+
+def test_travel_only_knows_explored_rooms(game):
+    game.start()
+    game.handle("n")
+    assert "don't know anywhere" in _text(game.handle("goto watchtower"))
+    assert "already in" in _text(game.handle("travel market square"))
+    assert game.player.room_id == "silverbrook.market_square"
+
+
 # ── Sleep ──
 
 def test_sleep_at_inn_restores_and_sets_respawn(game):
@@ -405,3 +464,24 @@ def test_talk_to_absent_npc_falls_through_to_dm(game):
     msgs = game.handle("talk Old John about swords")
     text = _text(msgs)
     assert "DM:" in text
+
+
+def test_moves_are_debounced_but_save_command_flushes(player, stub_dm, stub_npc):
+    saves = player_mod.SaveCoordinator(interval_seconds=3600)
+    g = Game(player=player, dm=stub_dm, npc_dialogue=stub_npc, saves=saves)
+    g.handle("north")
+    g.handle("south")
+    g.handle("north")
+    assert saves.writes == 1
+    g.handle("save")
+    assert saves.writes == 2
+    assert player_mod.load_player("p1").room_id == player.room_id
+
+
+def test_verb_of_labels_commands_for_metrics(game):
+    assert game.verb_of("n") == "move"
+    assert game.verb_of("go north") == "move"
+    assert game.verb_of("l") == "look"
+    assert game.verb_of("inv") == "inventory"
+    assert game.verb_of("i push the bookcase") == "adjudicate"
+    assert game.verb_of("attack goblin") == "attack"
@@ -91,3 +91,47 @@ def test_dice_doubled_no_modifier():
     for _ in range(50):
         v = dice.roll_dice_doubled("2d6")
         assert 4 <= v <= 24
+
+
+def test_compile_dice_is_cached_and_composite():
+    expr = dice.compile_dice("1d8+2d6+3")
+    assert expr is dice.compile_dice("1d8+2d6+3")
+    assert expr.terms == ((1, 8), (2, 6))
+    assert expr.modifier == 3
+    dice.seed(5)
+    r = expr.roll_detail()
+    assert len(r.rolls) == 3 and r.total == sum(r.rolls) + 3
+
+
+def test_compiled_rolls_match_the_string_api():
+    dice.seed(7)
+    a = [dice.roll("2d6+1") for _ in range(20)]
+    dice.seed(7)
+    b = [dice.compile_dice("2d6+1").roll() for _ in range(20)]
+    assert a == b
+
+
+@pytest.mark.parametrize("bad", ["", "5", "1d6 2", "1d6+-2", "-1d6", "0d6", "1d0"])
+def test_compile_rejects_malformed(bad):
+    with pytest.raises(ValueError):
+        dice.compile_dice(bad)
+
+
+def test_roll_many_is_seeded_and_in_range():
+    dice.seed(11)
+    a = dice.roll_many("3d6-1", 500)
+    dice.seed(11)
+    assert dice.roll_many(dice.compile_dice("3d6-1"), 500) == a
+    assert len(a) == 500
+    assert min(a) >= 2 and max(a) <= 17
+    assert 8 < sum(a) / len(a) < 11
+
+
+def test_pooled_seeded_is_reproducible_and_in_range():
+    with dice.seeded(5, pooled=True):
+        a = [dice.roll("1d20") for _ in range(300)] + [dice.roll("2d6+1") for _ in range(50)]
+    with dice.seeded(5, pooled=True):
+        b = [dice.roll("1d20") for _ in range(300)] + [dice.roll("2d6+1") for _ in range(50)]
+    assert a == b
+    assert min(a[:300]) >= 1 and max(a[:300]) <= 20
+    assert all(3 <= r <= 13 for r in a[300:])
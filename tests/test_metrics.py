@@ -0,0 +1,63 @@
+"""Tests for metrics.py — in-process counters/histograms rendered as
+Prometheus text, and the hot paths that record into them."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.metrics as metrics
+from nachomud.metrics import Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    reg = Registry()
+    h = reg.histogram("demo_seconds", "Demo.", ("verb",), buckets=(0.1, 1.0))
+    h.observe(0.05, "look")
+    h.observe(0.5, "look")
+    h.observe(3.0, "look")
+    text = reg.render()
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{verb="look",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{verb="look",le="1"} 2' in text
+    assert 'demo_seconds_bucket{verb="look",le="+Inf"} 3' in text
+    assert 'demo_seconds_sum{verb="look"} 3.55' in text
+    assert 'demo_seconds_count{verb="look"} 3' in text
+    assert h.count("look") == 3
+
+
+def test_counters_gauges_and_label_escaping():
+    reg = Registry()
+    c = reg.counter("demo_total", "Demo.", ("host",))
+    c.inc(2, 'http://a"b')
+    c.inc(1, 'http://a"b')
+    g = reg.gauge("demo_depth", "Demo.")
+    g.set(7)
+    text = reg.render()
+    assert 'demo_total{host="http://a\\"b"} 3' in text
+    assert "demo_depth 7" in text
+    assert reg.counter("demo_total", "again", ("host",)) is c
+    with pytest.raises(ValueError):
+        c.inc(1)
+
+
+def test_chat_records_latency_tokens_and_failures(monkeypatch):
+    import nachomud.ai.llm as llm
+
+    class _Client:
+        def chat(self, **_kw):
+            return {"message": {"content": "hi"}, "prompt_eval_count": 12, "eval_count": 5}
+
+    host = "http://metrics.test:11434"
+    monkeypatch.setitem(llm._clients, host, _Client())
+    monkeypatch.setattr(llm, "_breakers", {})
+    labels = (host, "m", "npc.speak")
+    before = metrics.LLM_SECONDS.count(*labels)
+    tokens = metrics.LLM_TOKENS.value(*labels, "completion")
+    with llm.call_site("npc.speak"):
+        assert llm.chat(system="x", message="y", model="m", host=host) == "hi"
+    assert metrics.LLM_SECONDS.count(*labels) == before + 1
+    assert metrics.LLM_TOKENS.value(*labels, "completion") == tokens + 5
+
+    failures = metrics.LLM_FAILURES.value("", "m", "other")
+    with pytest.raises(llm.LLMUnavailable):
+        llm.chat(system="x", message="y", model="m", host="")
+    assert metrics.LLM_FAILURES.value("", "m", "other") == failures + 1
@@ -103,6 +103,32 @@ def test_ws_handles_malformed_json(client):
         assert "malformed" in msg["text"].lower()
 
 
+def test_ws_rejects_commands_past_the_queue_limit(client, monkeypatch):
+    import threading
+
+    import nachomud.server as server_mod
+    from nachomud.engine.session import Session
+    monkeypatch.setattr(server_mod, "SESSION_QUEUE_MAX", 1)
+    release = threading.Event()
+    handled: list[str] = []
+
+    def slow_handle(self, text):
+        release.wait(5)
+        handled.append(text)
+        return [("output", f"did {text}\r\n")]
+    monkeypatch.setattr(Session, "handle", slow_handle)
+
+    with client.websocket_connect("/ws") as ws:
+        _drain(ws)
+        for text in ("one", "two", "three", "four"):
+            ws.send_text(json.dumps({"type": "command", "text": text}))
+        rejected = [_read_msg(ws)["text"] for _ in range(2)]
+        assert all("Slow down" in t for t in rejected)
+        release.set()
+        assert "did one" in _read_msg(ws)["text"]
+    assert handled[0] == "one" and len(handled) <= 2
+
+
 # ── Public-surface lockdown ──
 
 def test_actors_endpoint_removed(client):
@@ -178,3 +204,85 @@ def test_auth_request_no_whitelist_is_wide_open(client, monkeypatch):
     assert r.status_code == 200
     assert r.json() == {"ok": True}
     assert len(sent) == 1
+
+
+def test_map_endpoint_supports_etag(client):
+    import nachomud.server as server_mod     # the openapi tests reload it
+    with TestClient(server_mod.app) as c:
+        r = c.get("/map")
+        etag = r.headers["etag"]
+        assert r.status_code == 200 and etag
+        again = c.get("/map", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert c.get("/map", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def _wait_ready(c: TestClient, timeout: float = 10.0) -> None:
+    import time
+    deadline = time.monotonic() + timeout
+    while c.get("/ready").status_code != 200:
+        assert time.monotonic() < deadline, "world never became ready"
+        time.sleep(0.02)
+
+
+def test_ready_turns_200_once_the_world_is_up(client, tmp_path, monkeypatch):
+    import nachomud.server as server_mod
+    import nachomud.world.transcript_log as tlog
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    assert client.get("/ready").status_code == 503    # no world without the lifespan
+    with TestClient(server_mod.app) as c:
+        _wait_ready(c)
+        assert c.get("/ready").json() == {"ready": True}
+        assert c.app.state.world_loop.home.actors          # agents minted
+
+
+def test_metrics_endpoint_reports_commands(client, tmp_path, monkeypatch):
+    import nachomud.server as server_mod
+    import nachomud.world.transcript_log as tlog
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    with TestClient(server_mod.app) as c:
+        _wait_ready(c)
+        from nachomud.ai.scheduler import AgentScheduler
+        loop = c.app.state.world_loop.home
+        actor_id = next(iter(loop.actors))
+        loop.submit_command(actor_id, "look")
+        loop.agent_scheduler = AgentScheduler()
+        loop.agent_scheduler.register(actor_id)
+        loop.agent_scheduler.record_tick(actor_id)
+        r = c.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert 'nachomud_command_seconds_count{verb="look"}' in r.text
+    assert 'nachomud_lock_wait_seconds_count{scope="zone"}' in r.text
+    assert 'nachomud_world_actors{world="default"}' in r.text
+    assert 'nachomud_agent_interval_seconds{world="default"}' in r.text
+    assert 'nachomud_agent_ticks_per_minute{world="default",kind="actual"} 1' in r.text
+    assert 'nachomud_agent_ticks_per_minute{world="default",kind="target"}' in r.text
+    assert 'nachomud_agents_paused{world="default"} 0' in r.text
+    assert 'nachomud_llm_cache_entries{cache="npc_replies"} 0' in r.text
+
+
+def test_map_endpoint_404s_for_worlds_that_are_not_running(client, tmp_path, monkeypatch):
+    import nachomud.server as server_mod
+    import nachomud.world.map as map_mod
+    import nachomud.world.transcript_log as tlog
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    with TestClient(server_mod.app) as c:
+        _wait_ready(c)
+        cached = len(map_mod._explored)
+        assert c.get("/map", params={"world": "../../etc"}).status_code == 404
+        assert c.get("/map", params={"world": "nowhere"}).status_code == 404
+        assert len(map_mod._explored) == cached
+        assert c.get("/map", params={"world": "default"}).status_code == 200
+
+
+def test_admin_locks_needs_the_admin_token(client, monkeypatch):
+    import nachomud.server as server_mod
+    with TestClient(server_mod.app) as c:
+        assert c.get("/admin/locks").status_code == 404
+        monkeypatch.setattr(server_mod, "ADMIN_TOKEN", "s3cret")
+        assert c.get("/admin/locks", headers={"Authorization": "Bearer nope"}).status_code == 404
+        r = c.get("/admin/locks", headers={"Authorization": "Bearer s3cret"})
+    assert r.status_code == 200
+    assert set(r.json()) == {"active", "slowest"}
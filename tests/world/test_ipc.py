@@ -0,0 +1,157 @@
+"""Tests for world/ipc.py — a WorldLoop served over a Unix socket to a
+RemoteWorldLoop client."""
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+import nachomud.characters.save as player_mod
+import nachomud.world.store as world_store
+import nachomud.world.transcript_log as tlog
+from nachomud.characters.character import create_character
+from nachomud.rules.stats import Stats
+from nachomud.world.ipc import RemoteWorldLoop, WorldServer, WorldUnavailable
+from nachomud.world.registry import WorldRegistry
+
+
+@pytest.fixture
+def world_process(tmp_path, monkeypatch):
+    """A WorldRegistry + WorldServer on their own event loop thread, as
+    the dedicated world process would run them."""
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    monkeypatch.setattr(player_mod, "DATA_ROOT", str(tmp_path / "players"))
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    sock_dir = tempfile.mkdtemp(prefix="nm")     # AF_UNIX paths are short
+    path = os.path.join(sock_dir, "world.sock")
+    ready = threading.Event()
+    ctl: dict = {}
+
+    async def run() -> None:
+        loop = WorldRegistry(enable_agent_runner=False)
+        await loop.start()
+        server = WorldServer(loop, path)
+        await server.start()
+        ctl["stop"] = asyncio.Event()
+        ctl["aio"] = asyncio.get_running_loop()
+        ready.set()
+        await ctl["stop"].wait()
+        await server.stop()
+        await loop.stop()
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    yield path
+    ctl["aio"].call_soon_threadsafe(ctl["stop"].set)
+    thread.join(10)
+    shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+def _saved_player():
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1",
+                         respawn_room="silverbrook.inn", world_id="default")
+    p.room_id = "silverbrook.inn"
+    player_mod.save_player(p)
+    return p
+
+
+async def _next(queue: asyncio.Queue, pred):
+    while True:
+        item = await asyncio.wait_for(queue.get(), 5)
+        if pred(item):
+            return item
+
+
+def test_remote_session_round_trip(world_process):
+    async def scenario() -> None:
+        client = RemoteWorldLoop(world_process)
+        await client.start()
+        queue: asyncio.Queue = asyncio.Queue()
+        sub = client.add_subscriber(queue)
+        assert client.actor_list_event()["type"] == "actor_list"
+
+        actor = client.register_human(_saved_player())
+        assert actor.actor_id == "human_p1"
+        assert client.set_subscription(sub, actor.actor_id)
+        await _next(queue, lambda i: i == ("event", {"type": "subscribed",
+                                                      "actor_id": "human_p1"}))
+        assert client.start_actor(actor.actor_id)
+
+        msgs = client.submit_command(actor.actor_id, "look")
+        assert any(m[0] == "output" and "Bronze Hart" in m[1]
+                   for m in msgs if isinstance(m, tuple))
+        pushed = await _next(queue, lambda i: i[0] == "scoped" and i[2] in msgs)
+        assert pushed[1] == "human_p1"
+
+        sub.self_transcript.append(("output", "welcome\r\n"))
+        client.set_subscription(sub, "")
+        await _next(queue, lambda i: i == ("self", ("output", "welcome\r\n")))
+
+        world_id, rooms = client.explored_rooms()
+        assert world_id == "default" and "silverbrook.inn" in rooms
+        assert not client.set_subscription(sub, "nobody")
+        client.unregister_human(actor.actor_id)
+        client.remove_subscriber(sub)
+        await client.stop()
+
+    asyncio.run(scenario())
+
+
+def test_unreachable_world_fails_fast(world_process, monkeypatch):
+    import nachomud.world.ipc as ipc
+    monkeypatch.setattr(ipc, "CONNECT_ATTEMPTS", 1)
+
+    async def scenario() -> None:
+        client = RemoteWorldLoop(world_process + ".missing")
+        with pytest.raises(WorldUnavailable):
+            await client.start()
+
+    asyncio.run(scenario())
+
+
+def test_web_app_drives_remote_world(world_process, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import nachomud.server as server
+    monkeypatch.setattr(server, "WORLD_SOCKET", world_process)
+    with TestClient(server.app) as c:
+        assert isinstance(c.app.state.world_loop, RemoteWorldLoop)
+        with c.websocket_connect("/ws") as ws:
+            first = ws.receive_json()
+            assert first["type"] == "actor_list"
+        assert "map" in c.get("/map").json()
+
+
+def test_client_reconnects_and_resubscribes(world_process, monkeypatch):
+    import socket
+
+    import nachomud.world.ipc as ipc
+    monkeypatch.setattr(ipc, "CONNECT_RETRY_SECONDS", 0.05)
+
+    async def scenario() -> None:
+        client = RemoteWorldLoop(world_process)
+        await client.start()
+        queue: asyncio.Queue = asyncio.Queue()
+        sub = await asyncio.to_thread(client.add_subscriber, queue)
+        actor = await asyncio.to_thread(client.register_human, _saved_player())
+        await asyncio.to_thread(client.set_subscription, sub, actor.actor_id)
+        old_id, old_reader = sub.remote_id, client._reader
+
+        client._sock.shutdown(socket.SHUT_RDWR)   # the world "restarts"
+        await asyncio.to_thread(old_reader.join, 5)
+        assert not old_reader.is_alive()
+        assert sub.remote_id != old_id and client._subs == {sub.remote_id: sub}
+
+        msgs = await asyncio.to_thread(client.submit_command, actor.actor_id, "look")
+        await _next(queue, lambda i: i[0] == "scoped" and i[2] in msgs)
+        await client.stop()
+        with pytest.raises(WorldUnavailable):
+            client.actor_list_event()
+
+    asyncio.run(scenario())
@@ -0,0 +1,54 @@
+"""Tests for lockprof.py — who held which zone lock, for how long."""
+from __future__ import annotations
+
+import threading
+import time
+
+from nachomud.world.lockprof import LockProfiler
+from nachomud.world.zones import ZoneLocks
+
+
+def test_sections_record_holder_command_and_times():
+    prof = LockProfiler(capacity=2, slow_seconds=0)
+    locks = ZoneLocks(profiler=prof)
+    with locks.hold(["b", "a"], holder="human_p1", what="look"):
+        [active] = prof.active()
+        assert (active.holder, active.what, active.zones) == ("human_p1", "look", ("a", "b"))
+    with locks.hold(["a"], holder="agent_x", what="n"):
+        time.sleep(0.02)
+    with locks.exclusive(what="(register)"):
+        pass
+
+    assert prof.active() == []
+    slowest = prof.slowest()
+    assert len(slowest) == 2
+    assert slowest[0].what == "n" and slowest[0].hold_seconds >= 0.02
+    assert slowest[0].wait_seconds >= 0
+    assert "agent_x 'n' [a]" in prof.report()
+
+
+def _slow_command_body(release: threading.Event) -> None:
+    release.wait(5)
+
+
+def test_long_holds_get_a_stack_sample():
+    prof = LockProfiler(slow_seconds=0.05, sample_interval=3600)
+    locks = ZoneLocks(profiler=prof)
+    entered, release = threading.Event(), threading.Event()
+
+    def run() -> None:
+        with locks.hold(["a"], holder="human_p1", what="dm tell me a story"):
+            entered.set()
+            _slow_command_body(release)
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    assert entered.wait(5)
+    time.sleep(0.1)
+    assert prof.sample() == 1
+    assert "_slow_command_body" in prof.active()[0].stack
+    release.set()
+    t.join(5)
+
+    [section] = prof.slowest()
+    assert "_slow_command_body" in section.stack
+    assert "stack of human_p1 'dm tell me a story'" in prof.report()
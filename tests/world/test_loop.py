@@ -0,0 +1,83 @@
+"""Tests for loop.py — room occupancy and the movement events built on it."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.characters.save as player_mod
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+import nachomud.world.transcript_log as tlog
+from nachomud.characters.character import create_character
+from nachomud.rules.stats import Stats
+from nachomud.world.loop import WorldLoop
+
+
+@pytest.fixture
+def loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    monkeypatch.setattr(player_mod, "DATA_ROOT", str(tmp_path / "players"))
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    starter.seed_world("default")
+    return WorldLoop(enable_agent_runner=False,
+                     dm_llm=lambda s, u: "ok", npc_llm=lambda s, u: "ok",
+                     npc_summarizer=lambda s, u: "ok")
+
+
+def _join(loop: WorldLoop, name: str, room_id: str):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character(name, "Dwarf", "Warrior", s, player_id=name.lower(),
+                         respawn_room="silverbrook.inn", world_id="default")
+    p.room_id = room_id
+    return loop.register_human(p)
+
+
+def test_occupancy_follows_register_moves_and_unregister(loop):
+    aric = _join(loop, "Aric", "silverbrook.inn")
+    bree = _join(loop, "Bree", "silverbrook.market_square")
+    assert loop.occupants("silverbrook.inn") == [aric]
+
+    loop.submit_command(aric.actor_id, "north")
+    assert loop.occupants("silverbrook.inn") == []
+    assert loop.occupants("silverbrook.market_square") == [bree, aric]
+
+    loop.unregister_human(bree.actor_id)
+    assert loop.occupants("silverbrook.market_square") == [aric]
+    assert "Adventurers here" not in "".join(
+        m[1] for m in loop.submit_command(aric.actor_id, "look") if isinstance(m, tuple))
+
+
+def test_moves_are_witnessed_by_occupants_only_without_reading_the_graph(loop, monkeypatch):
+    aric = _join(loop, "Aric", "silverbrook.inn")
+    bree = _join(loop, "Bree", "silverbrook.market_square")
+    cade = _join(loop, "Cade", "silverbrook.tavern")
+    monkeypatch.setattr(world_store, "load_graph",
+                        lambda world_id: pytest.fail("graph read for a plain move"))
+
+    loop.submit_command(aric.actor_id, "north")
+
+    assert list(bree.game._pending_witness) == ["Aric arrives from the south."]
+    assert list(cade.game._pending_witness) == []
+    text = "".join(m[1] for m in loop.submit_command(bree.actor_id, "look")
+                   if isinstance(m, tuple) and m[0] == "output")
+    assert "Adventurers here" in text and "Aric arrives from the south." in text
+
+
+def test_tick_flushes_parked_saves_under_the_actors_zone_lock(loop, monkeypatch):
+    aric = _join(loop, "Aric", "silverbrook.inn")
+    now = [0.0]
+    loop.saves.clock = lambda: now[0]
+    loop.saves.request(aric.state)
+    aric.state.gold += 5
+    loop.saves.request(aric.state)
+    assert loop.saves.metrics()["pending"] == 1
+
+    held = []
+    real = player_mod.player_files
+    monkeypatch.setattr(player_mod, "player_files", lambda p: (
+        held.append(loop.zones._locks["silverbrook"].locked()), real(p))[1])
+    now[0] += loop.saves.interval_seconds
+    loop._tick_and_flush()
+
+    assert held == [True]
+    assert loop.saves.metrics()["pending"] == 0
+    assert player_mod.load_player("aric").gold == aric.state.gold
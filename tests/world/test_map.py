@@ -0,0 +1,74 @@
+"""Tests for map.py — the explored-rooms listing and its caches."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.world.map as map_mod
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+
+
+@pytest.fixture
+def world(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    starter.seed_world("default")
+    return tmp_path
+
+
+def _count_room_loads(monkeypatch) -> list[str]:
+    loads: list[str] = []
+    real = world_store.load_room
+
+    def counting(world_id, room_id):
+        loads.append(room_id)
+        return real(world_id, room_id)
+    monkeypatch.setattr(world_store, "load_room", counting)
+    return loads
+
+
+def test_render_explored_text_names_visited_rooms_only(world):
+    text = map_mod.render_explored_text(
+        "default", ["silverbrook.inn"], current_room_id="silverbrook.market_square")
+    assert "EXPLORED LOCATIONS (2 rooms)" in text
+    assert "* Market Square" in text
+    assert "north → Market Square" in text
+    assert "west → ?" in text
+
+
+def test_explored_map_reuses_render_until_graph_or_visits_change(world, monkeypatch):
+    visited = ["silverbrook.inn", "silverbrook.market_square"]
+    first = map_mod.explored_map("default", visited)
+    loads = _count_room_loads(monkeypatch)
+    assert map_mod.explored_map("default", list(visited)) is first
+
+    visited.append("silverbrook.smithy")
+    second = map_mod.explored_map("default", visited)
+    assert second.etag != first.etag
+    assert loads == ["silverbrook.smithy"]      # names of known rooms are cached
+
+    world_store.add_edge("default", "silverbrook.smithy", "east", "nowhere.yet")
+    third = map_mod.explored_map("default", visited)
+    assert third is not second and "nowhere" not in third.text
+
+
+def test_missing_rooms_are_not_cached_as_absent(world):
+    assert map_mod._room_name("default", "later.room") is None
+    from nachomud.models import Room
+    world_store.save_room("default", Room(id="later.room", name="Later"))
+    assert map_mod._room_name("default", "later.room") == "Later"
+
+
+def test_render_map_reads_only_rooms_in_viewport(world, monkeypatch):
+    import nachomud.world.spatial as spatial
+    from nachomud.models import Room
+    world_store.save_room("default", Room(id="far.away", name="Far Away",
+                                          coords=(50, 50, 0)))
+    index = spatial.load_index("default")
+    index.add("far.away", (50, 50, 0))
+    spatial.save_index("default", index)
+    loads = _count_room_loads(monkeypatch)
+    text = map_mod.render_map("default", "silverbrook.inn",
+                              ["silverbrook.inn", "far.away"])
+    assert "[*The Bronze H" in text and "[ Market Squar" in text
+    assert "far.away" not in loads and "Far Away" not in text
+    assert "Crooked" not in text                # two exits from anything visited
@@ -181,3 +181,51 @@ def test_dead_mob_not_moved(world):
     m2 = world_store.get_mob("default", "dead")
     assert m2.current_room == "silverbrook.market_square"  # never moved
     assert not m2.alive
+
+
+def test_tick_keeps_mob_changed_by_a_command_mid_tick(world, monkeypatch):
+    """The tick commits with compare-and-set: a mob a command wrote after
+    the tick's snapshot keeps the command's version."""
+    _spawn("default", "g1", "silverbrook.market_square", ai_state="wander")
+    real_snapshot = world_store.snapshot_mobs
+
+    def snapshot_then_combat(world_id):
+        snap = real_snapshot(world_id)
+        hurt = world_store.get_mob(world_id, "g1")
+        hurt.hp = 3
+        world_store.update_mob(world_id, hurt)
+        return snap
+    monkeypatch.setattr(world_store, "snapshot_mobs", snapshot_then_combat)
+    import nachomud.world.mobs as mobs_mod
+    monkeypatch.setattr(mobs_mod, "random_chance", lambda p: True)
+    tick_mobs("default", "silverbrook.inn", minutes=1)
+    m = world_store.get_mob("default", "g1")
+    assert m.hp == 3 and m.current_room == "silverbrook.market_square"
+
+
+def test_tick_reports_no_move_it_did_not_commit(world, monkeypatch):
+    """A mob skipped by the compare-and-set never moved, so nobody sees it go."""
+    _spawn("default", "g1", "silverbrook.inn", ai_state="wander")
+    real_snapshot = world_store.snapshot_mobs
+
+    def snapshot_then_combat(world_id):
+        snap = real_snapshot(world_id)
+        world_store.patch_mobs(world_id, {"g1": {"hp": 3}})
+        return snap
+    monkeypatch.setattr(world_store, "snapshot_mobs", snapshot_then_combat)
+    import nachomud.world.mobs as mobs_mod
+    monkeypatch.setattr(mobs_mod, "random_chance", lambda p: True)
+    w = tick_mobs("default", "silverbrook.inn", minutes=1)
+    assert not w.has_any
+    assert world_store.get_mob("default", "g1").current_room == "silverbrook.inn"
+
+
+def test_patch_mobs_keeps_fields_it_was_not_given(world):
+    _spawn("default", "g1", "silverbrook.market_square")
+    moved = world_store.get_mob("default", "g1")
+    moved.current_room, moved.ai_state = "silverbrook.inn", "return"
+    world_store.update_mob("default", moved)
+    world_store.patch_mobs("default", {"g1": {"hp": 0, "alive": False}, "ghost": {"hp": 1}})
+    m = world_store.get_mob("default", "g1")
+    assert (m.hp, m.alive, m.current_room, m.ai_state) == (0, False, "silverbrook.inn", "return")
+    assert world_store.get_mob("default", "ghost") is None
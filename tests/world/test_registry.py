@@ -0,0 +1,148 @@
+"""Tests for world/registry.py — one WorldLoop per world, booted on
+demand and hibernated when empty."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+import nachomud.characters.save as player_mod
+import nachomud.world.store as world_store
+import nachomud.world.transcript_log as tlog
+from nachomud.characters.character import create_character
+from nachomud.rules.stats import Stats
+from nachomud.world.loop import WorldLoop
+from nachomud.world.registry import WorldRegistry
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _serve(reg: WorldRegistry) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    aio = asyncio.new_event_loop()
+    thread = threading.Thread(target=aio.run_forever, daemon=True)
+    thread.start()
+    reg.run = lambda coro: asyncio.run_coroutine_threadsafe(coro, aio).result(10)
+    reg.run(reg.start())
+    return aio, thread
+
+
+def _shutdown(reg: WorldRegistry, aio: asyncio.AbstractEventLoop,
+              thread: threading.Thread) -> None:
+    reg.run(reg.stop())
+    aio.call_soon_threadsafe(aio.stop)
+    thread.join(5)
+
+
+@pytest.fixture
+def data_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    monkeypatch.setattr(player_mod, "DATA_ROOT", str(tmp_path / "players"))
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+
+
+@pytest.fixture
+def registry(data_dirs):
+    """A started, warmed-up registry on its own event loop thread; the
+    test drives it from the main thread like the server's worker
+    threads do."""
+    reg = WorldRegistry(enable_agent_runner=False, hibernate_seconds=60, clock=_Clock())
+    aio, thread = _serve(reg)
+    reg.run(reg.wait_ready())
+    yield reg
+    _shutdown(reg, aio, thread)
+
+
+def _player(pid: str, world_id: str):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id=pid,
+                         respawn_room="silverbrook.inn", world_id=world_id)
+    p.room_id = "silverbrook.inn"
+    return p
+
+
+def test_each_world_gets_its_own_loop(registry):
+    home = registry.register_human(_player("p1", "default"))
+    away = registry.register_human(_player("p2", "side"))
+
+    assert set(registry.loops) == {"default", "side"}
+    side = registry.loops["side"]
+    assert side.zones is not registry.home.zones
+    assert set(side.actors) == {"human_p2"}
+    assert "human_p1" in registry.home.actors
+    assert not any(a.startswith("agent_") for a in side.actors)
+
+    listed = {a["actor_id"]: a["world_id"] for a in registry.list_actors()}
+    assert listed["human_p1"] == "default" and listed["human_p2"] == "side"
+
+    assert any("Bronze Hart" in m[1] for m in registry.start_actor(away.actor_id)
+               if isinstance(m, tuple))
+    registry.submit_command(home.actor_id, "look")
+    world_id, rooms = registry.explored_rooms("side")
+    assert world_id == "side" and "silverbrook.inn" in rooms
+
+
+def test_subscribers_follow_actors_across_worlds(registry):
+    away = registry.register_human(_player("p2", "side"))
+    sub = registry.add_subscriber(asyncio.Queue())
+    assert registry.set_subscription(sub, away.actor_id)
+    assert registry.loops["side"].is_watched(away.actor_id)
+    assert registry.set_subscription(sub, "agent_scholar")
+    assert not registry.set_subscription(sub, "human_nobody")
+
+
+def test_empty_world_hibernates_and_wakes(registry):
+    away = registry.register_human(_player("p2", "side"))
+    registry.unregister_human(away.actor_id)
+
+    assert registry.run(registry.reap_idle()) == []
+    registry.clock.now += 61
+    assert registry.run(registry.reap_idle()) == ["side"]
+    assert set(registry.loops) == {"default"}
+    assert registry.explored_rooms("side") is None
+
+    registry.clock.now += 1000
+    assert registry.run(registry.reap_idle()) == []   # home never sleeps
+
+    again = registry.register_human(_player("p2", "side"))
+    assert registry.get_actor(again.actor_id) is not None
+    assert "side" in registry.loops
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_start_returns_before_the_home_world_is_warm(data_dirs):
+    gate = threading.Event()
+
+    class _HeldLoop(WorldLoop):
+        async def start(self) -> None:
+            await asyncio.to_thread(gate.wait, 10)
+            await super().start()
+
+    reg = WorldRegistry(enable_agent_runner=False, loop_factory=_HeldLoop)
+    aio, thread = _serve(reg)
+    try:
+        assert not reg.ready
+        queue: asyncio.Queue = asyncio.Queue()
+        reg.add_subscriber(queue)              # a viewer connects during warmup
+        assert reg.actor_list_event()["actors"] == []
+
+        gate.set()
+        reg.run(reg.wait_ready())
+        reg.run(asyncio.sleep(0.05))
+        assert reg.ready
+        events = [item for kind, item in _drain(queue) if kind == "event"]
+        assert any(len(e["actors"]) == 4 for e in events if e["type"] == "actor_list")
+    finally:
+        _shutdown(reg, aio, thread)
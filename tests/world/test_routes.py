@@ -0,0 +1,53 @@
+"""Tests for routes.py — travel routes over an actor's explored rooms."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+from nachomud.world.routes import RouteIndex
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    starter.seed_world("default")
+    return RouteIndex("default")
+
+
+def test_routes_only_cross_explored_rooms(index):
+    index.sync(["silverbrook.inn", "silverbrook.smithy"], "silverbrook.inn")
+    assert index.route("silverbrook.inn", "silverbrook.smithy") is None
+
+    index.sync(["silverbrook.inn", "silverbrook.smithy", "silverbrook.market_square"],
+               "silverbrook.inn")
+    assert index.route("silverbrook.inn", "silverbrook.smithy") == ["north", "east"]
+    assert index.find("smithy") == ["silverbrook.smithy"]
+
+
+def test_a_new_exit_shortens_cached_routes_in_place(index):
+    visited = ["silverbrook.inn", "silverbrook.market_square", "silverbrook.smithy"]
+    index.sync(visited, "silverbrook.inn")
+    assert index.route("silverbrook.inn", "silverbrook.smithy") == ["north", "east"]
+    tree = index._trees["silverbrook.inn"]
+
+    world_store.add_edge("default", "silverbrook.inn", "east", "silverbrook.smithy",
+                         bidirectional=False)
+    index.sync(visited, "silverbrook.inn")
+
+    assert index.route("silverbrook.inn", "silverbrook.smithy") == ["east"]
+    assert index._trees["silverbrook.inn"] is tree          # relaxed, not rebuilt
+    assert index.route("silverbrook.smithy", "silverbrook.inn") == ["west", "south"]
+
+
+def test_a_repointed_exit_drops_cached_routes(index):
+    visited = ["silverbrook.inn", "silverbrook.market_square", "silverbrook.smithy",
+               "silverbrook.tavern"]
+    index.sync(visited, "silverbrook.inn")
+    assert index.route("silverbrook.inn", "silverbrook.tavern") == ["north", "west"]
+
+    world_store.add_edge("default", "silverbrook.market_square", "west", "silverbrook.smithy",
+                         bidirectional=False)
+    index.sync(visited, "silverbrook.inn")
+
+    assert index.route("silverbrook.inn", "silverbrook.tavern") is None
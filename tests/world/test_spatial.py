@@ -0,0 +1,87 @@
+"""Tests for spatial.py — room coordinates and the bucketed index."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+import nachomud.world.spatial as spatial
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+from nachomud.ai.world_gen import WorldGen
+from nachomud.models import Room
+
+
+@pytest.fixture
+def world(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    starter.seed_world("default")
+    return tmp_path
+
+
+def test_place_stretches_past_taken_cells():
+    index = spatial.SpatialIndex(coords={"a": (0, 0, 0), "b": (1, 0, 0)})
+    assert index.place((0, 0, 0), "north") == (0, -1, 0)
+    assert index.place((0, 0, 0), "e") == (2, 0, 0)
+    assert index.place((0, 0, 0), "up") == (0, 0, 1)
+    for i in range(2, 2 + spatial.MAX_STRETCH):
+        index.add(f"r{i}", (i, 0, 0))
+    assert index.place((0, 0, 0), "east") is None
+    assert index.place(None, "east") is None
+
+
+def test_query_spans_buckets_and_layers():
+    edge = spatial.BUCKET - 1
+    index = spatial.SpatialIndex(coords={
+        "in_a": (edge, 0, 0), "in_b": (edge + 1, 1, 0),
+        "far": (edge + 5, 0, 0), "upstairs": (edge, 0, 1),
+    })
+    assert set(index.query(0, edge - 1, -1, edge + 2, 2)) == {"in_a", "in_b"}
+    index.add("in_a", (-40, -40, 0))
+    assert set(index.query(0, edge - 1, -1, edge + 2, 2)) == {"in_b"}
+    assert index.at((-40, -40, 0)) == "in_a" and index.at((edge, 0, 0)) is None
+
+
+def test_starter_town_is_laid_out_around_the_inn(world):
+    index = spatial.load_index("default")
+    assert index.coords["silverbrook.inn"] == (0, 0, 0)
+    assert index.coords["silverbrook.market_square"] == (0, -1, 0)
+    assert index.coords["silverbrook.smithy"] == (1, -1, 0)
+    assert world_store.load_room("default", "silverbrook.smithy").coords == (1, -1, 0)
+    # Reseeding keeps the layout.
+    starter.seed_world("default")
+    assert world_store.load_room("default", "silverbrook.smithy").coords == (1, -1, 0)
+
+
+def test_generated_room_gets_coords_from_direction(world):
+    gen = WorldGen(llm=lambda s, u: json.dumps({"name": "Plains", "exits": ["north"]}))
+    source = world_store.load_room("default", "silverbrook.watchtower")
+    room = gen.generate_room(source, "north", "default", requested_id="wild.frontier_north")
+    assert room.coords == (0, -4, 0)
+    assert world_store.load_room("default", room.id).coords == (0, -4, 0)
+    assert spatial.load_index("default").at((0, -4, 0)) == room.id
+
+
+def test_claim_appends_to_the_log_and_compacts_it(world, monkeypatch):
+    before = open(world_store.spatial_path("default")).read()
+    c = spatial.claim("default", (0, 0, 0), "east", "wild.east_field")
+    assert open(world_store.spatial_path("default")).read() == before
+    spatial._cache.clear()
+    assert spatial.load_index("default").at(c) == "wild.east_field"
+
+    monkeypatch.setattr(spatial, "LOG_COMPACT_BYTES", 0)
+    c2 = spatial.claim("default", c, "east", "wild.far_field")
+    assert not os.path.exists(world_store.spatial_log_path("default"))
+    assert world_store.load_spatial("default")["wild.far_field"] == c2
+
+
+def test_layout_backfills_legacy_rooms_without_touching_state(world):
+    world_store.save_room("default", Room(id="old.cellar", name="Cellar",
+                                          exits={"up": "silverbrook.inn"}))
+    world_store.add_edge("default", "silverbrook.inn", "down", "old.cellar")
+    world_store.put_room_narration("default", "old.cellar", "barrel", "k", "Dusty.")
+    assert spatial.layout_world("default", "silverbrook.inn") == 1
+    assert world_store.load_room("default", "old.cellar").coords == (0, 0, -1)
+    assert world_store.get_room_narration("default", "old.cellar", "barrel", "k") == "Dusty."
+    assert spatial.layout_world("default", "silverbrook.inn") == 0
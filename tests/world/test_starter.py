@@ -30,22 +30,34 @@ def test_seed_no_refresh_is_idempotent(fresh_world):
     assert written2 == 0  # already exist, none re-written
 
 
-def test_seed_refresh_overwrites_npcs_keeps_flags(fresh_world):
-    """Default seed refresh: NPC list updates from JSON, room.flags survive."""
+def test_seed_refresh_overwrites_npcs_keeps_flags(fresh_world, monkeypatch):
+    """Default seed refresh: an edited room is rewritten from JSON, room.flags survive."""
     # First seed
     starter.seed_world("default")
     # Player sets a flag (e.g. opened a secret passage)
     world_store.update_room_flags("default", "silverbrook.market_square",
                                   {"player_marked": True})
-    # Re-seed (developer added new NPCs / wares to JSON)
+    # Re-seed (developer edited the market square in the JSON)
+    doc = starter.load_starter_doc()
+    square = next(r for r in doc["rooms"] if r["room_id"] == "silverbrook.market_square")
+    square["description"] = "Freshly swept cobbles."
+    monkeypatch.setattr(starter, "load_starter_doc", lambda name="silverbrook": doc)
     written = starter.seed_world("default")
-    assert written == 6  # all rooms refreshed
+    assert written == 1  # only the edited room
     r = world_store.load_room("default", "silverbrook.market_square")
+    assert r.description == "Freshly swept cobbles."
     assert r.flags.get("player_marked") is True  # mutable state preserved
     # Greta should still be present and now have wares (after refresh)
     assert any(n.name == "Greta" and n.wares for n in r.npcs)
 
 
+def test_seed_refresh_skips_unchanged_rooms(fresh_world):
+    starter.seed_world("default")
+    graph_before = world_store.graph_version("default")
+    assert starter.seed_world("default") == 0
+    assert world_store.graph_version("default") == graph_before
+
+
 def test_inn_has_inn_flag(fresh_world):
     starter.seed_world("default")
     inn = world_store.load_room("default", "silverbrook.inn")
@@ -0,0 +1,39 @@
+"""Tests for synth.py — deterministic synthetic worlds."""
+from __future__ import annotations
+
+import pytest
+
+import nachomud.world.spatial as spatial
+import nachomud.world.store as world_store
+from nachomud.world.directions import opposite
+from nachomud.world.synth import synthesize_world
+
+
+@pytest.fixture
+def data_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    return tmp_path
+
+
+def test_world_has_requested_size_and_consistent_graph(data_root):
+    report = synthesize_world("s", 300, seed=3)
+    graph = world_store.load_graph("s")
+    assert report.rooms == len(graph) == len(world_store.list_rooms("s")) == 300
+    assert report.edges == sum(len(e) for e in graph.values())
+    for rid, exits in graph.items():
+        for direction, dest in exits.items():
+            assert graph[dest][opposite(direction)] == rid
+    index = spatial.load_index("s")
+    assert len(set(index.coords.values())) == 300
+    room = world_store.load_room("s", report.root)
+    assert room.coords == (0, 0, 0) and room.exits == graph[report.root]
+    assert len(world_store.load_mobs("s")) == report.mobs > 0
+    assert len(world_store.load_items("s")) == report.items > 0
+
+
+def test_same_seed_same_world(data_root):
+    synthesize_world("a", 200, seed=7)
+    synthesize_world("b", 200, seed=7)
+    synthesize_world("c", 200, seed=8)
+    assert world_store.load_graph("a") == world_store.load_graph("b")
+    assert world_store.load_graph("a") != world_store.load_graph("c")
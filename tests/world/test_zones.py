@@ -0,0 +1,148 @@
+"""Tests for zones.py — per-zone locking of WorldLoop commands."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import nachomud.characters.save as player_mod
+import nachomud.world.starter as starter
+import nachomud.world.store as world_store
+import nachomud.world.transcript_log as tlog
+from nachomud.characters.character import create_character
+from nachomud.models import Mob
+from nachomud.rules.stats import Stats
+from nachomud.world.loop import WorldLoop
+from nachomud.world.zones import ZoneLocks, zone_of
+
+
+def _finishes(fn, timeout: float = 0.5) -> bool:
+    """Run fn on a thread; True if it returned within `timeout`."""
+    done = threading.Event()
+    t = threading.Thread(target=lambda: (fn(), done.set()), daemon=True)
+    t.start()
+    return done.wait(timeout)
+
+
+def _held(locks: ZoneLocks, zones: list[str]):
+    """Hold `zones` on another thread until the returned event is set."""
+    release, holding = threading.Event(), threading.Event()
+
+    def run() -> None:
+        with locks.hold(zones):
+            holding.set()
+            release.wait(5)
+    threading.Thread(target=run, daemon=True).start()
+    assert holding.wait(5)
+    return release
+
+
+def _hold_briefly(locks: ZoneLocks, zones: list[str]):
+    def run() -> None:
+        with locks.hold(zones):
+            pass
+    return run
+
+
+def test_zone_of_uses_room_id_prefix():
+    assert zone_of("silverbrook.inn") == "silverbrook"
+    assert zone_of("wild_plains.ab12cd34ef") == "wild_plains"
+    assert zone_of("") == ""
+
+
+def test_disjoint_zones_run_together_and_shared_ones_wait():
+    locks = ZoneLocks()
+    release = _held(locks, ["a"])
+    assert _finishes(_hold_briefly(locks, ["b", "c"]))
+    blocked = threading.Event()
+
+    def crossing() -> None:
+        with locks.hold(["c", "a"]):
+            blocked.set()
+    threading.Thread(target=crossing, daemon=True).start()
+    assert not blocked.wait(0.2)
+    release.set()
+    assert blocked.wait(5)
+
+
+def test_exclusive_waits_for_every_zone():
+    locks = ZoneLocks()
+    _hold_briefly(locks, ["b"])()
+    release = _held(locks, ["a"])
+    entered = threading.Event()
+
+    def structural() -> None:
+        with locks.exclusive():
+            entered.set()
+    threading.Thread(target=structural, daemon=True).start()
+    assert not entered.wait(0.2)
+    release.set()
+    assert entered.wait(5)
+
+
+@pytest.fixture
+def loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(world_store, "DATA_ROOT", str(tmp_path / "world"))
+    monkeypatch.setattr(player_mod, "DATA_ROOT", str(tmp_path / "players"))
+    monkeypatch.setattr(tlog, "DATA_ROOT", str(tmp_path / "transcripts"))
+    starter.seed_world("default")
+    return WorldLoop(enable_agent_runner=False,
+                     dm_llm=lambda s, u: "ok", npc_llm=lambda s, u: "ok",
+                     npc_summarizer=lambda s, u: "ok")
+
+
+def test_commands_only_wait_on_their_own_zones(loop):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1",
+                         respawn_room="silverbrook.inn", world_id="default")
+    p.room_id = "silverbrook.inn"
+    actor = loop.register_human(p)
+
+    release = _held(loop.zones, ["far_marsh"])
+    assert _finishes(lambda: loop.submit_command(actor.actor_id, "look"))
+    release.set()
+
+    release = _held(loop.zones, ["silverbrook"])
+    assert not _finishes(lambda: loop.submit_command(actor.actor_id, "look"), 0.2)
+    release.set()
+
+
+def test_typed_ahead_moves_walk_under_one_lock_and_render_once(loop, monkeypatch):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1",
+                         respawn_room="silverbrook.inn", world_id="default")
+    p.room_id = "silverbrook.inn"
+    actor = loop.register_human(p)
+    holds = []
+    real_hold = loop.zones.hold
+    monkeypatch.setattr(loop.zones, "hold",
+                        lambda zones, **kw: holds.append(zones) or real_hold(zones, **kw))
+
+    out = loop.submit_moves(actor.actor_id, ["n", "go north", "east", "north"])
+
+    assert actor.state.room_id == "silverbrook.north_gate"    # east is a wall
+    assert len(holds) == 1
+    kinds = [m["type"] if isinstance(m, dict) else m[0] for m in out]
+    assert kinds.count("prompt") == 1 and kinds.count("status") == 1
+    steps = [m[1] for m in out if isinstance(m, tuple) and "You head" in m[1]]
+    assert len(steps) == 2
+
+
+def test_travel_stops_where_a_hostile_blocks_the_way(loop):
+    s = Stats(STR=15, DEX=12, CON=14, INT=8, WIS=10, CHA=13)
+    p = create_character("Aric", "Dwarf", "Warrior", s, player_id="p1",
+                         respawn_room="silverbrook.inn", world_id="default")
+    p.room_id = "silverbrook.north_gate"
+    p.visited_rooms = ["silverbrook.inn", "silverbrook.market_square",
+                       "silverbrook.north_gate"]
+    actor = loop.register_human(p)
+    world_store.add_mob("default", Mob(name="Goblin", hp=10, max_hp=10, atk=2, mob_id="g1",
+                                       current_room="silverbrook.market_square"))
+
+    out = loop.submit_command(actor.actor_id, "travel bronze hart")
+
+    assert actor.state.room_id == "silverbrook.market_square"
+    text = "".join(m[1] for m in out if isinstance(m, tuple) and m[0] == "output")
+    assert "You set off for The Bronze Hart Inn (2 steps)" in text
+    assert "Goblin blocks the way" in text
+    assert "Market Square" in text                              # where it stopped